@@ -0,0 +1,49 @@
+"""add_review_jobs
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "review_jobs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("installation_id", sa.String(255), nullable=False),
+        sa.Column("github_repo_id", sa.BigInteger(), nullable=False),
+        sa.Column("github_pr_id", sa.BigInteger(), nullable=False),
+        sa.Column("repo_owner", sa.String(255), nullable=False),
+        sa.Column("repo_name", sa.String(255), nullable=False),
+        sa.Column("pr_number", sa.Integer(), nullable=False),
+        sa.Column("head_sha", sa.String(40), nullable=True),
+        sa.Column("trigger_source", sa.String(50), nullable=False, server_default="push"),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("run_after", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("locked_by", sa.String(255), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_review_jobs_status_run_after", "review_jobs", ["status", "run_after"])
+    op.create_index("ix_review_jobs_repo_pr", "review_jobs", ["github_repo_id", "pr_number"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_jobs_repo_pr", table_name="review_jobs")
+    op.drop_index("ix_review_jobs_status_run_after", table_name="review_jobs")
+    op.drop_table("review_jobs")
@@ -0,0 +1,42 @@
+"""add_review_jobs_active_head_index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 중복 활성 작업은 가장 최근 것만 남기고 superseded 처리
+    op.execute(
+        """
+        UPDATE review_jobs SET status = 'superseded', finished_at = now()
+        WHERE status IN ('pending', 'running')
+          AND id NOT IN (
+              SELECT max(id) FROM review_jobs
+              WHERE status IN ('pending', 'running')
+              GROUP BY github_repo_id, pr_number, head_sha
+          )
+        """
+    )
+    op.create_index(
+        "uq_review_jobs_active_head",
+        "review_jobs",
+        ["github_repo_id", "pr_number", "head_sha"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_review_jobs_active_head", table_name="review_jobs")
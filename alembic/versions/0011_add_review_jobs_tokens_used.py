@@ -0,0 +1,31 @@
+"""add_review_jobs_tokens_used
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "review_jobs",
+        sa.Column("tokens_used", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_review_jobs_installation_started", "review_jobs", ["installation_id", "started_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_jobs_installation_started", table_name="review_jobs")
+    op.drop_column("review_jobs", "tokens_used")
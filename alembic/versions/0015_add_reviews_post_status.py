@@ -0,0 +1,53 @@
+"""add_reviews_post_status
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 리뷰는 모두 게시가 끝난 것으로 본다
+    op.add_column(
+        "reviews",
+        sa.Column("post_status", sa.String(20), nullable=False, server_default="posted"),
+    )
+    op.add_column(
+        "reviews",
+        sa.Column("post_attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("reviews", sa.Column("post_error", sa.Text(), nullable=True))
+    op.add_column(
+        "reviews",
+        sa.Column(
+            "inline_comments",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="[]",
+        ),
+    )
+    op.create_index(
+        "ix_reviews_post_pending",
+        "reviews",
+        ["updated_at"],
+        postgresql_where=sa.text("post_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reviews_post_pending", table_name="reviews")
+    op.drop_column("reviews", "inline_comments")
+    op.drop_column("reviews", "post_error")
+    op.drop_column("reviews", "post_attempts")
+    op.drop_column("reviews", "post_status")
@@ -13,12 +13,78 @@ class Settings(BaseSettings):
         github_private_key_path: GitHub App 개인키 파일 경로.
         github_webhook_secret: Webhook 서명 검증에 사용되는 시크릿.
         github_installation_id: GitHub App Installation ID (선택).
+        github_api_url: GitHub REST API 베이스 URL (GitHub Enterprise나 로컬 대역 서버용).
+        github_http2: GitHub API 호출에 HTTP/2를 사용할지 여부 (``h2`` 패키지가 없으면 HTTP/1.1).
+        github_http_max_connections: GitHub API 공유 클라이언트의 최대 동시 커넥션 수.
+        github_http_max_keepalive: 유휴 상태로 유지할 최대 keep-alive 커넥션 수.
+        github_http_keepalive_expiry: 유휴 keep-alive 커넥션을 닫기까지의 시간 (초).
+        github_token_refresh_margin_seconds: installation 토큰 만료 이 시간 전부터 백그라운드에서 미리 재발급 (초).
+        github_page_concurrency: 목록 API(PR 파일/커밋)의 페이지를 동시에 요청하는 최대 수.
+        pr_collector_mode: PR 데이터 수집 방식. ``"rest"``, ``"graphql"`` (메타데이터/파일/커밋을 쿼리 하나로 조회,
+            patch는 파일 리뷰를 할 때만 REST로 조회) 또는 ``"diff"`` (변경 파일을 unified diff 한 번의 다운로드로 받아 로컬에서 파싱).
+        github_diff_max_patch_chars: ``diff`` 수집 방식에서 파일당 유지할 patch 최대 길이. 넘는 부분은 버린다.
+        github_review_max_comments: 리뷰(``POST /pulls/{n}/reviews``) 하나에 담는 최대 인라인 코멘트 수.
+        github_rate_limit_throttle_ratio: 남은 rate limit 비율이 이보다 낮으면 남은 요청을 reset 시각까지 나눠 보냄.
+        github_rate_limit_low_priority_reserve_ratio: 남은 비율이 이보다 낮으면 저우선순위 요청(컨텍스트 파일 조회)을 생략.
+        github_rate_limit_max_retries: rate limit 응답(429/403)을 받았을 때 최대 재시도 횟수.
+        github_rate_limit_max_wait_seconds: rate limit으로 한 번에 기다리는 최대 시간 (초).
+        github_retry_max_attempts: 일시적 오류(502/503/504, 연결 실패)를 받은 재시도 가능 요청의 최대 재시도 횟수.
+        github_retry_base_delay_seconds: 일시적 오류 재시도의 첫 대기 시간 (초, 시도마다 2배에 full jitter).
+        github_retry_max_delay_seconds: 일시적 오류 재시도 한 번의 최대 대기 시간 (초).
+        github_circuit_failure_threshold: 호스트별로 연속 실패가 이만큼 쌓이면 circuit을 열어 요청을 바로 실패시킴.
+        github_circuit_reset_seconds: circuit이 열린 뒤 시험 요청 하나를 허용하기까지의 시간 (초).
+        github_cache_max_entries: ETag 조건부 요청 캐시의 인메모리 최대 항목 수.
+        github_cache_max_bytes: ETag 조건부 요청 캐시의 인메모리 최대 본문 크기 합계 (바이트).
+        github_cache_dir: 조건부 요청 캐시를 디스크에도 저장할 디렉터리 (빈 값이면 메모리만 사용).
+        github_cache_disk_max_entries: 디스크 캐시의 최대 파일 수 (0이면 무제한).
+        github_blob_cache_max_entries: blob SHA 기반 파일 내용 캐시의 인메모리 최대 항목 수.
+        github_blob_cache_max_bytes: blob 캐시의 인메모리 최대 내용 크기 합계 (바이트).
+        github_blob_cache_dir: blob 캐시를 디스크에도 저장할 디렉터리 (빈 값이면 메모리만 사용).
+        github_blob_cache_disk_max_bytes: 디스크 blob 캐시의 최대 크기 합계 (바이트, 0이면 무제한).
+        github_snapshot_dir: head_sha별 저장소 스냅샷(tarball)을 저장할 디렉터리 (빈 값이면 사용 안 함).
+        github_snapshot_max_bytes: 저장소 스냅샷의 최대 디스크 사용량 (바이트, 0이면 무제한).
+        github_snapshot_max_file_bytes: 스냅샷에 포함할 파일 하나의 최대 크기 (바이트).
+        github_snapshot_max_delta_files: 이전 스냅샷에서 delta로 새 스냅샷을 만들 수 있는 최대 변경 파일 수.
         llm_provider: 사용할 LLM provider. ``"anthropic"``, ``"google"``, ``"ollama"`` 중 하나.
         anthropic_api_key: Anthropic API 키 (provider가 anthropic인 경우 필수).
         google_api_key: Google API 키 (provider가 google인 경우 필수).
         ollama_base_url: Ollama 서버 주소 (provider가 ollama인 경우 필수).
         ollama_model: Ollama에서 사용할 모델 이름.
+        llm_max_concurrent_requests: provider/model별 동시에 보내는 LLM 요청 수 (0이면 무제한).
+        llm_requests_per_minute: provider/model별 분당 LLM 요청 수 한도 (0이면 무제한).
+        llm_tokens_per_minute: provider/model별 분당 LLM 토큰(입력+출력) 한도 (0이면 무제한).
+        llm_output_tokens_estimate: 토큰 한도 예약 시 요청 하나의 출력 토큰 추정치. 응답 후 실제 사용량으로 정산한다.
+        llm_rate_limit_max_retries: LLM provider가 429를 돌려줬을 때 Retry-After만큼 기다린 뒤 재시도하는 최대 횟수.
+        llm_limit_overrides: provider 또는 ``provider:model``별 한도 override. JSON 예:
+            ``{"ollama": {"max_concurrent": 1}, "anthropic:claude-3-5-sonnet-20241022": {"rpm": 50, "tpm": 40000}}``.
         database_url: SQLAlchemy async 데이터베이스 URL.
+        review_worker_concurrency: 워커 프로세스 하나가 동시에 실행하는 리뷰 작업 수.
+        review_worker_poll_interval: 큐가 비어 있을 때 워커의 폴링 간격 (초).
+        review_job_max_attempts: 리뷰 작업 최대 시도 횟수.
+        review_job_retry_delay_seconds: 실패한 작업의 재시도 기본 지연 (초, 시도 횟수에 비례).
+        review_job_stale_seconds: running 작업의 heartbeat가 이 시간 동안 없으면 워커 비정상 종료로 보고 재등록.
+        review_checkpointing: LanGraph Postgres 체크포인트와 파일별 중간 결과 저장으로 중단된 리뷰를 이어서 실행할지 여부.
+        review_debounce_seconds: push 트리거 리뷰를 지연시켜 연속 push를 하나로 합치는 시간 (0이면 즉시).
+        review_supersede_check_interval: 실행 중 작업의 heartbeat 갱신 및 최신 커밋 대체 여부 확인 간격 (초).
+        review_priority_aging_seconds: 대기 중인 작업의 우선순위가 1 오르는 데 걸리는 시간 (초, 기아 방지).
+        review_high_risk_priority_boost: 위험도 HIGH로 분류된 PR에 더하는 트리아지 우선순위.
+        review_global_max_running: 전체 워커를 합친 동시 실행 리뷰 수 한도 (0이면 무제한).
+        review_saturation_queue_depth: 대기 작업이 이 수 이상이면 포화로 보고 LOW 위험도 PR 리뷰를 지연 (0이면 비활성).
+        review_low_risk_defer_seconds: 포화 시 직전 위험도가 LOW인 PR 리뷰를 지연시키는 시간 (초).
+        review_queue_max_depth: 대기 작업이 이 수 이상이면 리뷰 트리거 웹훅을 503으로 거절 (0이면 무제한).
+        installation_max_concurrent_reviews: installation 하나가 동시에 실행할 수 있는 리뷰 수 (0이면 무제한).
+        installation_daily_token_quota: installation 하나의 하루(UTC) LLM 토큰 한도 (0이면 무제한).
+        installation_limit_overrides: installation별 한도 override. JSON 예:
+            ``{"12345": {"weight": 2, "max_concurrent": 4, "daily_token_quota": 2000000}}``.
+        worker_maintenance_interval: 워커의 주기 작업(delivery 기록 정리 등) 실행 간격 (초).
+        webhook_delivery_ttl_hours: 처리한 웹훅 delivery ID 보관 기간 (시간).
+        webhook_delivery_cache_size: 인메모리 delivery ID LRU 최대 크기.
+        pr_sync_interval_seconds: 워커가 활성 저장소의 PR 상태를 GitHub와 동기화하는 간격 (초, 0이면 비활성).
+        pr_sync_concurrency: PR 상태 동기화 시 동시에 처리하는 저장소 수.
+        pr_sync_direct_fetch_max: DB의 open PR이 이 수 이하면 PR 목록 대신 해당 PR만 직접 조회.
+        review_post_max_attempts: 완료된 리뷰의 GitHub 게시를 시도하는 최대 횟수 (넘으면 failed로 포기).
+        review_post_retry_delay_seconds: 게시가 끝나지 않은 리뷰를 워커 주기 작업에서 다시 게시하기까지의 최소 대기 (초).
+            진행 중인 게시와 겹치지 않도록 게시 한 번에 걸리는 시간(rate limit 대기 포함)보다 길게 둔다.
         host: 서버 바인딩 주소.
         port: 서버 포트.
     """
@@ -30,6 +96,49 @@ class Settings(BaseSettings):
     github_webhook_secret: str
     github_installation_id: str | None = None
 
+    # GitHub API HTTP 클라이언트 (프로세스당 하나를 공유)
+    github_api_url: str = "https://api.github.com"
+    github_http2: bool = True
+    github_http_max_connections: int = 20
+    github_http_max_keepalive: int = 10
+    github_http_keepalive_expiry: float = 60.0
+    github_token_refresh_margin_seconds: int = 600
+    github_page_concurrency: int = 4
+    pr_collector_mode: str = "rest"  # 선택지: rest, graphql, diff
+    github_diff_max_patch_chars: int = 200_000
+    github_review_max_comments: int = 50
+
+    # GitHub API rate limit 스로틀링
+    github_rate_limit_throttle_ratio: float = 0.2
+    github_rate_limit_low_priority_reserve_ratio: float = 0.1
+    github_rate_limit_max_retries: int = 3
+    github_rate_limit_max_wait_seconds: float = 300.0
+
+    # GitHub 일시적 오류 재시도 및 호스트별 circuit breaker
+    github_retry_max_attempts: int = 3
+    github_retry_base_delay_seconds: float = 0.5
+    github_retry_max_delay_seconds: float = 8.0
+    github_circuit_failure_threshold: int = 5
+    github_circuit_reset_seconds: float = 30.0
+
+    # GitHub GET 응답 ETag 캐시
+    github_cache_max_entries: int = 2000
+    github_cache_max_bytes: int = 64 * 1024 * 1024
+    github_cache_dir: str = ""
+    github_cache_disk_max_entries: int = 20000
+
+    # git blob SHA 기반 파일 내용 캐시
+    github_blob_cache_max_entries: int = 1000
+    github_blob_cache_max_bytes: int = 32 * 1024 * 1024
+    github_blob_cache_dir: str = ""
+    github_blob_cache_disk_max_bytes: int = 512 * 1024 * 1024
+
+    # head_sha별 저장소 스냅샷 (tarball) 캐시
+    github_snapshot_dir: str = ""
+    github_snapshot_max_bytes: int = 2 * 1024 * 1024 * 1024
+    github_snapshot_max_file_bytes: int = 1024 * 1024
+    github_snapshot_max_delta_files: int = 200
+
     # LLM 설정
     llm_provider: str = "anthropic"  # 선택지: anthropic, google, ollama
     anthropic_api_key: str | None = None
@@ -39,6 +148,14 @@ class Settings(BaseSettings):
     ollama_base_url: str | None = None
     ollama_model: str = "llama3.2"
 
+    # provider/model별 LLM 동시 요청 수 및 분당 요청/토큰 한도
+    llm_max_concurrent_requests: int = 8
+    llm_requests_per_minute: int = 0
+    llm_tokens_per_minute: int = 0
+    llm_output_tokens_estimate: int = 1024
+    llm_rate_limit_max_retries: int = 2
+    llm_limit_overrides: dict[str, dict[str, float]] = {}
+
     # diff 크기 제한 (HIGH 위험도 기준 최대값, LOW=30% / MEDIUM=70% / HIGH=100% 비율 적용)
     diff_max_chars_cloud: int = 10000   # anthropic / google
     diff_max_chars_ollama: int = 4000   # ollama (로컬 LLM 컨텍스트 창 고려)
@@ -46,6 +163,43 @@ class Settings(BaseSettings):
     # 데이터베이스
     database_url: str = "postgresql+asyncpg://almagest:almagest@db:5432/almagest_reviewer"
 
+    # 리뷰 작업 큐 / 워커
+    review_worker_concurrency: int = 2
+    review_worker_poll_interval: float = 2.0
+    review_job_max_attempts: int = 3
+    review_job_retry_delay_seconds: int = 30
+    review_job_stale_seconds: int = 120
+    review_checkpointing: bool = True
+    review_debounce_seconds: int = 0
+    review_supersede_check_interval: float = 5.0
+    review_priority_aging_seconds: int = 120
+    review_high_risk_priority_boost: int = 1
+
+    # admission control / backpressure
+    review_global_max_running: int = 0
+    review_saturation_queue_depth: int = 0
+    review_low_risk_defer_seconds: int = 300
+    review_queue_max_depth: int = 0
+
+    # installation별 공정 분배 / 한도
+    installation_max_concurrent_reviews: int = 0
+    installation_daily_token_quota: int = 0
+    installation_limit_overrides: dict[str, dict[str, float]] = {}
+    worker_maintenance_interval: int = 600
+
+    # 웹훅 delivery 중복 처리 방지 (X-GitHub-Delivery)
+    webhook_delivery_ttl_hours: int = 72
+    webhook_delivery_cache_size: int = 10000
+
+    # PR 상태 증분 동기화 (웹훅 누락 보정)
+    pr_sync_interval_seconds: int = 3600
+    pr_sync_concurrency: int = 4
+    pr_sync_direct_fetch_max: int = 30
+
+    # 완료된 리뷰의 GitHub 게시 재시도 (그래프 재실행 없이 저장된 결과로 게시)
+    review_post_max_attempts: int = 5
+    review_post_retry_delay_seconds: int = 600
+
     # OAuth 로그인 (GitHub App > Settings > Client ID / Client Secret)
     github_client_id: str = ""
     github_client_secret: str = ""
@@ -1,5 +1,5 @@
-"""데이터베이스 패키지 — 엔진, 세션, Base, get_db 재export."""
+"""데이터베이스 패키지 — 엔진, 세션, Base, get_db/session_scope 재export."""
 from app.database.base import Base, TimestampMixin
-from app.database.engine import async_session_factory, engine, get_db
+from app.database.engine import async_session_factory, engine, get_db, session_scope
 
-__all__ = ["Base", "TimestampMixin", "engine", "async_session_factory", "get_db"]
+__all__ = ["Base", "TimestampMixin", "engine", "async_session_factory", "get_db", "session_scope"]
@@ -1,12 +1,16 @@
 """SQLAlchemy 비동기 엔진 및 세션 팩토리."""
+import time
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
+from app import metrics
 from app.config import settings
 
 engine = create_async_engine(
@@ -15,6 +19,23 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_pool_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    """커넥션 대여 시 사용 중 커넥션 수를 늘리고 대여 시각을 기록한다."""
+    connection_record.info["checked_out_at"] = time.monotonic()
+    metrics.add_gauge("db_pool_checked_out", 1)
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_pool_checkin(dbapi_connection, connection_record) -> None:
+    """커넥션 반납 시 사용 중 커넥션 수를 줄이고 점유 시간을 기록한다."""
+    checked_out_at = connection_record.info.pop("checked_out_at", None)
+    if checked_out_at is not None:
+        metrics.add_gauge("db_pool_checked_out", -1)
+        metrics.observe("db_connection_hold_seconds", time.monotonic() - checked_out_at)
+
+
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -22,12 +43,14 @@ async_session_factory = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI Depends용 비동기 DB 세션 제너레이터.
+@asynccontextmanager
+async def session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """필요한 시점에만 DB 세션을 여는 트랜잭션 컨텍스트 매니저.
+
+    요청 시작 시점이 아니라 실제로 DB가 필요해진 시점에 커넥션을 가져온다.
 
     Yields:
-        AsyncSession: 요청 단위로 격리된 SQLAlchemy 비동기 세션.
-        요청 성공 시 commit, 예외 발생 시 rollback 후 세션 종료.
+        AsyncSession: 블록이 정상 종료되면 commit, 예외 발생 시 rollback되는 세션.
     """
     async with async_session_factory() as session:
         try:
@@ -36,3 +59,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI Depends용 비동기 DB 세션 제너레이터.
+
+    Yields:
+        AsyncSession: 요청 단위로 격리된 SQLAlchemy 비동기 세션.
+        ``session_scope``와 같이 요청 성공 시 commit, 예외 발생 시 rollback 후 세션 종료.
+    """
+    async with session_scope() as session:
+        yield session
@@ -3,6 +3,18 @@ from app.database.models.pull_request import PullRequest
 from app.database.models.repository import Repository
 from app.database.models.review import Review
 from app.database.models.review_comment import ReviewComment
+from app.database.models.review_file_result import ReviewFileResult
+from app.database.models.review_job import ReviewJob
 from app.database.models.skill import Skill
+from app.database.models.webhook_delivery import WebhookDelivery
 
-__all__ = ["Repository", "Skill", "PullRequest", "Review", "ReviewComment"]
+__all__ = [
+    "Repository",
+    "Skill",
+    "PullRequest",
+    "Review",
+    "ReviewComment",
+    "ReviewFileResult",
+    "ReviewJob",
+    "WebhookDelivery",
+]
@@ -21,6 +21,7 @@ class PullRequest(Base, TimestampMixin):
         state: PR 상태 (open/closed/merged).
         risk_level: 리스크 수준 (LOW/MEDIUM/HIGH).
         triage_priority: 트리아지 우선순위 (nullable).
+        summary_comment_id: 리뷰 요약을 게시한 GitHub 코멘트 ID (재리뷰 시 이 코멘트를 수정).
     """
 
     __tablename__ = "pull_requests"
@@ -44,6 +45,7 @@ class PullRequest(Base, TimestampMixin):
     state: Mapped[str] = mapped_column(String(50), default="open", nullable=False)
     risk_level: Mapped[str | None] = mapped_column(String(20))
     triage_priority: Mapped[int | None] = mapped_column(Integer)
+    summary_comment_id: Mapped[int | None] = mapped_column(BigInteger)
 
     repository: Mapped["Repository"] = relationship(  # noqa: F821
         "Repository", back_populates="pull_requests"
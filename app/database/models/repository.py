@@ -1,5 +1,7 @@
 """Repository ORM 모델."""
-from sqlalchemy import BigInteger, Boolean, Index, String, Text, UniqueConstraint
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, TimestampMixin
@@ -15,6 +17,9 @@ class Repository(Base, TimestampMixin):
         name: 저장소 이름.
         installation_id: GitHub App Installation ID.
         is_active: 활성 여부.
+        system_prompt: 저장소별 리뷰 시스템 프롬프트.
+        prs_synced_at: PR 상태를 GitHub와 마지막으로 동기화한 시각 (증분 동기화 기준점).
+        prs_sync_claimed_at: 워커가 PR 상태 동기화를 맡은 시각 (끝나면 None, 워커가 죽으면 임대 만료 후 재시도).
     """
 
     __tablename__ = "repositories"
@@ -31,6 +36,8 @@ class Repository(Base, TimestampMixin):
     installation_id: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     system_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
+    prs_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    prs_sync_claimed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     skills: Mapped[list["Skill"]] = relationship(  # noqa: F821
         "Skill", back_populates="repository", cascade="all, delete-orphan"
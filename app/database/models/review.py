@@ -1,7 +1,7 @@
 """Review ORM 모델."""
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import BigInteger, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,12 +24,21 @@ class Review(Base, TimestampMixin):
         review_decision: 리뷰 결정 (APPROVE/REQUEST_CHANGES/COMMENT).
         retry_count: 재시도 횟수.
         errors: 처리 중 발생한 에러 목록 (JSONB array).
+        post_status: GitHub 게시 상태 (pending/posted/failed).
+        post_attempts: GitHub 게시 시도 횟수.
+        post_error: 마지막 게시 실패 사유.
+        inline_comments: 게시할 인라인 코멘트 목록 (JSONB array, 게시 재시도용).
     """
 
     __tablename__ = "reviews"
     __table_args__ = (
         Index("ix_reviews_pull_request_created", "pull_request_id", "created_at"),
         Index("ix_reviews_head_sha", "head_sha"),
+        Index(
+            "ix_reviews_post_pending",
+            "updated_at",
+            postgresql_where=text("post_status = 'pending'"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
@@ -49,6 +58,10 @@ class Review(Base, TimestampMixin):
     errors: Mapped[list] = mapped_column(JSONB, default=list, nullable=False, server_default="[]")
     effective_risk_score: Mapped[float | None] = mapped_column(Float)
     effective_risk_level: Mapped[str | None] = mapped_column(String(20))
+    post_status: Mapped[str] = mapped_column(String(20), nullable=False, server_default="posted")
+    post_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False, server_default="0")
+    post_error: Mapped[str | None] = mapped_column(Text)
+    inline_comments: Mapped[list] = mapped_column(JSONB, default=list, nullable=False, server_default="[]")
 
     pull_request: Mapped["PullRequest"] = relationship(  # noqa: F821
         "PullRequest", back_populates="reviews"
@@ -0,0 +1,31 @@
+"""ReviewFileResult ORM 모델."""
+from sqlalchemy import BigInteger, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base, TimestampMixin
+
+
+class ReviewFileResult(Base, TimestampMixin):
+    """진행 중인 리뷰 실행의 파일별 중간 결과 (재시작 시 완료된 파일 재리뷰 방지용).
+
+    리뷰 결과가 게시되면 thread 단위로 삭제된다.
+
+    Attributes:
+        id: 내부 PK.
+        thread_id: 체크포인트 thread ID (``{owner}/{name}#{pr}@{head_sha}``).
+        pass_number: ``review_all_files`` 실행 회차 (재시도 시 증가).
+        filename: 파일 경로.
+        result: ``review_single_file`` 결과 (``review``, ``message`` 포함).
+    """
+
+    __tablename__ = "review_file_results"
+    __table_args__ = (
+        UniqueConstraint("thread_id", "pass_number", "filename", name="uq_review_file_results_thread_file"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    thread_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    pass_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    filename: Mapped[str] = mapped_column(String(1000), nullable=False)
+    result: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -0,0 +1,71 @@
+"""ReviewJob ORM 모델."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base, TimestampMixin
+
+
+class ReviewJob(Base, TimestampMixin):
+    """웹훅이 등록하고 워커가 소비하는 리뷰 작업 큐 항목.
+
+    Attributes:
+        id: 내부 PK.
+        installation_id: GitHub App Installation ID.
+        github_repo_id: GitHub 저장소 ID.
+        github_pr_id: GitHub PR ID.
+        repo_owner: 저장소 소유자 login.
+        repo_name: 저장소 이름.
+        pr_number: PR 번호.
+        head_sha: 리뷰 대상 HEAD 커밋 SHA (알 수 없으면 NULL).
+        trigger_source: 리뷰 트리거 출처 (push, ready_for_review, re_review_command, label_removed).
+        status: 작업 상태 (pending/running/succeeded/failed/superseded).
+        priority: 실행 우선순위 (클수록 먼저 실행, 대기 시간에 따라 aging 적용).
+        attempts: 지금까지 실행을 시도한 횟수.
+        tokens_used: 지금까지 실행에서 사용한 LLM 토큰 수 (installation 일일 한도 계산용).
+        run_after: 이 시각 이후에만 워커가 가져간다.
+        started_at: 마지막 실행 시작 시각.
+        heartbeat_at: 실행 중인 워커가 마지막으로 살아 있음을 알린 시각.
+        finished_at: 실행 종료 시각.
+        locked_by: 작업을 가져간 워커 ID.
+        last_error: 마지막 실패 메시지.
+    """
+
+    __tablename__ = "review_jobs"
+    __table_args__ = (
+        Index("ix_review_jobs_status_run_after", "status", "run_after"),
+        Index("ix_review_jobs_repo_pr", "github_repo_id", "pr_number"),
+        Index("ix_review_jobs_installation_started", "installation_id", "started_at"),
+        # 같은 커밋에 대해 대기/실행 중인 작업은 하나만 허용
+        Index(
+            "uq_review_jobs_active_head",
+            "github_repo_id",
+            "pr_number",
+            "head_sha",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    installation_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    github_repo_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    github_pr_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    repo_owner: Mapped[str] = mapped_column(String(255), nullable=False)
+    repo_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    pr_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    head_sha: Mapped[str | None] = mapped_column(String(40))
+    trigger_source: Mapped[str] = mapped_column(String(50), nullable=False, server_default="push")
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False, server_default="pending")
+    priority: Mapped[int] = mapped_column(Integer, default=0, nullable=False, server_default="0")
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False, server_default="0")
+    tokens_used: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False, server_default="0")
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    locked_by: Mapped[str | None] = mapped_column(String(255))
+    last_error: Mapped[str | None] = mapped_column(Text)
@@ -0,0 +1,22 @@
+"""WebhookDelivery ORM 모델."""
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base, TimestampMixin
+
+
+class WebhookDelivery(Base, TimestampMixin):
+    """처리한 GitHub 웹훅 delivery 기록 (재전송 중복 처리 방지용).
+
+    Attributes:
+        delivery_id: ``X-GitHub-Delivery`` 헤더 값 (GUID).
+        event: ``X-GitHub-Event`` 헤더 값.
+    """
+
+    __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        Index("ix_webhook_deliveries_created_at", "created_at"),
+    )
+
+    delivery_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    event: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -1,7 +1,23 @@
+from app.config import settings
+
 from .client import GitHubClient
+from .diff_collector import DiffPRDataCollector
+from .graphql_collector import GraphQLPRDataCollector
 from .pr_collector import PRDataCollector
 
 github_client = GitHubClient()
-pr_collector = PRDataCollector(github_client)
+if settings.pr_collector_mode == "graphql":
+    pr_collector = GraphQLPRDataCollector(github_client)
+elif settings.pr_collector_mode == "diff":
+    pr_collector = DiffPRDataCollector(github_client)
+else:
+    pr_collector = PRDataCollector(github_client)
 
-__all__ = ["GitHubClient", "PRDataCollector", "github_client", "pr_collector"]
\ No newline at end of file
+__all__ = [
+    "DiffPRDataCollector",
+    "GitHubClient",
+    "GraphQLPRDataCollector",
+    "PRDataCollector",
+    "github_client",
+    "pr_collector",
+]
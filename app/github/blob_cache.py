@@ -0,0 +1,143 @@
+"""git blob SHA를 키로 쓰는 저장소 파일 내용 캐시.
+
+blob SHA는 파일 내용의 해시이므로 같은 SHA의 내용은 언제나 같다. 그래서 재검증 없이
+PR/커밋/재시도 사이에 그대로 재사용할 수 있고, 브랜치가 바뀌어도 내용이 같은 파일은
+다시 받지 않는다. 인메모리 LRU 계층과, 선택적으로 전체 크기로 제한한 디스크 계층을 둔다.
+"""
+import asyncio
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+
+from app import metrics
+from app.config import settings
+
+# 디스크 캐시 정리(크기 초과분 삭제)를 몇 번의 저장마다 할지
+DISK_PRUNE_EVERY = 50
+_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+class BlobCache:
+    """blob SHA → 파일 내용(bytes) 캐시.
+
+    메모리 계층은 항목 수 ``max_entries``와 내용 크기 합계 ``max_bytes``로 제한한 LRU이고,
+    ``disk_dir``를 지정하면 ``<sha 앞 2자리>/<sha>`` 파일로 디스크에도 저장한다. 디스크 계층은
+    파일 크기 합계 ``disk_max_bytes``를 넘으면 가장 오래 사용하지 않은 파일부터 삭제한다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        disk_dir: str | Path | None = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._total_bytes = 0
+        self._disk_writes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, sha: str) -> bytes | None:
+        """blob 내용을 조회한다. 메모리에 없으면 디스크 계층을 확인한다.
+
+        Args:
+            sha: git blob SHA.
+
+        Returns:
+            파일 내용. 없으면 None.
+        """
+        content = self._entries.get(sha)
+        if content is not None:
+            self._entries.move_to_end(sha)
+            metrics.inc("github_blob_cache_requests_total", result="memory")
+            return content
+        if self.disk_dir is not None and _SHA_PATTERN.match(sha):
+            content = await asyncio.to_thread(self._read_disk, sha)
+            if content is not None:
+                self._remember(sha, content)
+                metrics.inc("github_blob_cache_requests_total", result="disk")
+                return content
+        metrics.inc("github_blob_cache_requests_total", result="miss")
+        return None
+
+    async def put(self, sha: str, content: bytes) -> None:
+        """blob 내용을 저장한다.
+
+        Args:
+            sha: git blob SHA.
+            content: 파일 내용.
+        """
+        self._remember(sha, content)
+        if self.disk_dir is None or not _SHA_PATTERN.match(sha):
+            return
+        await asyncio.to_thread(self._write_disk, sha, content)
+        self._disk_writes += 1
+        if self.disk_max_bytes > 0 and self._disk_writes % DISK_PRUNE_EVERY == 0:
+            await asyncio.to_thread(self._prune_disk)
+
+    def _remember(self, sha: str, content: bytes) -> None:
+        """메모리 LRU에 저장하고, 한도를 넘으면 가장 오래된 항목부터 버린다."""
+        if len(content) > self.max_bytes:
+            return
+        previous = self._entries.pop(sha, None)
+        if previous is not None:
+            self._total_bytes -= len(previous)
+        self._entries[sha] = content
+        self._total_bytes += len(content)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+    def _disk_path(self, sha: str) -> Path:
+        return self.disk_dir / sha[:2] / sha
+
+    def _read_disk(self, sha: str) -> bytes | None:
+        """디스크에서 blob을 읽고, 최근 사용 시각을 갱신해 정리 대상에서 뒤로 미룬다."""
+        path = self._disk_path(sha)
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def _write_disk(self, sha: str, content: bytes) -> None:
+        """blob을 임시 파일에 쓴 뒤 교체해, 읽는 쪽이 쓰다 만 파일을 보지 않게 한다."""
+        path = self._disk_path(sha)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"blob 디스크 캐시 저장 실패: {e}")
+
+    def _prune_disk(self) -> None:
+        """디스크 캐시 크기가 ``disk_max_bytes``를 넘으면 오래 사용하지 않은 파일부터 삭제한다."""
+        try:
+            files = [(path, path.stat()) for path in self.disk_dir.glob("??/*") if path.suffix != ".tmp"]
+            total = sum(stat.st_size for _, stat in files)
+            for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+                if total <= self.disk_max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+        except OSError as e:
+            logger.warning(f"blob 디스크 캐시 정리 실패: {e}")
+
+
+blob_cache = BlobCache(
+    max_entries=settings.github_blob_cache_max_entries,
+    max_bytes=settings.github_blob_cache_max_bytes,
+    disk_dir=settings.github_blob_cache_dir or None,
+    disk_max_bytes=settings.github_blob_cache_disk_max_bytes,
+)
@@ -0,0 +1,208 @@
+"""GitHub GET 응답의 조건부 요청(ETag / Last-Modified) 캐시.
+
+캐시된 응답의 검증자를 ``If-None-Match`` / ``If-Modified-Since``로 보내고, GitHub가 304를
+돌려주면 본문을 다시 받지 않고 캐시된 응답을 사용한다. 304 응답은 rate limit을 소모하지 않는다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+import httpx
+from loguru import logger
+
+from app.config import settings
+
+# 304 응답으로 캐시 항목을 되살릴 때 복원하는 응답 헤더
+CACHED_HEADERS = ("content-type", "etag", "last-modified", "link")
+# 디스크 캐시 정리(오래된 파일 삭제)를 몇 번의 저장마다 할지
+DISK_PRUNE_EVERY = 100
+
+
+class CachedResponse(NamedTuple):
+    """캐시에 저장하는 GET 응답.
+
+    Attributes:
+        etag: 응답의 ``ETag`` 헤더 값.
+        last_modified: 응답의 ``Last-Modified`` 헤더 값.
+        headers: 응답 복원에 필요한 헤더 (``CACHED_HEADERS``).
+        content: 응답 본문.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse | None":
+        """검증자(ETag/Last-Modified)가 있는 응답만 캐시 항목으로 만든다.
+
+        Args:
+            response: 200 응답.
+
+        Returns:
+            캐시 항목. 검증자가 없으면 None.
+        """
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return None
+        headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+        return cls(etag, last_modified, headers, response.content)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """재검증 요청에 붙일 조건부 헤더를 반환한다."""
+        if self.etag:
+            return {"If-None-Match": self.etag}
+        return {"If-Modified-Since": self.last_modified}
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """304 응답 대신 돌려줄 200 응답을 캐시된 본문으로 만든다.
+
+        Args:
+            request: 재검증에 사용한 요청.
+
+        Returns:
+            캐시된 본문과 헤더를 가진 ``httpx.Response``.
+        """
+        return httpx.Response(200, headers=self.headers, content=self.content, request=request)
+
+
+def cache_key(installation_id: str, path: str, params: dict | None, accept: str) -> str:
+    """캐시 키를 만든다. installation마다 접근 권한이 다르므로 installation ID를 포함한다.
+
+    Args:
+        installation_id: GitHub App의 Installation ID.
+        path: API 경로.
+        params: 쿼리 파라미터.
+        accept: Accept 헤더 값 (같은 경로라도 표현이 달라진다).
+
+    Returns:
+        캐시 키 문자열.
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return f"{installation_id}:{accept}:{path}?{query}"
+
+
+class ResponseCache:
+    """항목 수와 본문 크기로 제한한 인메모리 LRU에, 선택적으로 디스크 계층을 더한 응답 캐시.
+
+    ``disk_dir``를 지정하면 메모리에서 밀려난 항목도 디스크에서 다시 읽어 재검증할 수 있고,
+    프로세스 재시작 후에도 검증자가 유지된다. 디스크 계층은 파일 수 ``disk_max_entries``로 제한한다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        disk_dir: str | Path | None = None,
+        disk_max_entries: int = 0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_entries = disk_max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._total_bytes = 0
+        self._disk_writes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """캐시 항목을 조회한다. 메모리에 없으면 디스크 계층을 확인한다.
+
+        Args:
+            key: ``cache_key``로 만든 키.
+
+        Returns:
+            캐시 항목. 없으면 None.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.disk_dir is None:
+            return None
+        entry = await asyncio.to_thread(self._read_disk, key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def put(self, key: str, entry: CachedResponse) -> None:
+        """캐시 항목을 저장한다.
+
+        Args:
+            key: ``cache_key``로 만든 키.
+            entry: 저장할 응답.
+        """
+        self._remember(key, entry)
+        if self.disk_dir is None:
+            return
+        await asyncio.to_thread(self._write_disk, key, entry)
+        self._disk_writes += 1
+        if self.disk_max_entries > 0 and self._disk_writes % DISK_PRUNE_EVERY == 0:
+            await asyncio.to_thread(self._prune_disk)
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """메모리 LRU에 저장하고, 한도를 넘으면 가장 오래된 항목부터 버린다."""
+        if len(entry.content) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= len(previous.content)
+        self._entries[key] = entry
+        self._total_bytes += len(entry.content)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted.content)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.cache"
+
+    def _read_disk(self, key: str) -> CachedResponse | None:
+        """디스크 파일(첫 줄은 JSON 메타데이터, 나머지는 본문)에서 항목을 읽는다."""
+        try:
+            raw = self._disk_path(key).read_bytes()
+            meta, _, content = raw.partition(b"\n")
+            data = json.loads(meta)
+        except (OSError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        return CachedResponse(data["etag"], data["last_modified"], data["headers"], content)
+
+    def _write_disk(self, key: str, entry: CachedResponse) -> None:
+        """항목을 임시 파일에 쓴 뒤 교체해, 읽는 쪽이 쓰다 만 파일을 보지 않게 한다."""
+        meta = json.dumps(
+            {"key": key, "etag": entry.etag, "last_modified": entry.last_modified, "headers": entry.headers}
+        ).encode()
+        path = self._disk_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(meta + b"\n" + entry.content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"GitHub 응답 디스크 캐시 저장 실패: {e}")
+
+    def _prune_disk(self) -> None:
+        """디스크 캐시 파일이 ``disk_max_entries``를 넘으면 오래된 것부터 삭제한다."""
+        try:
+            files = sorted(self.disk_dir.glob("*.cache"), key=lambda p: p.stat().st_mtime)
+            for path in files[: max(0, len(files) - self.disk_max_entries)]:
+                path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"GitHub 응답 디스크 캐시 정리 실패: {e}")
+
+
+response_cache = ResponseCache(
+    max_entries=settings.github_cache_max_entries,
+    max_bytes=settings.github_cache_max_bytes,
+    disk_dir=settings.github_cache_dir or None,
+    disk_max_entries=settings.github_cache_disk_max_entries,
+)
@@ -1,40 +1,425 @@
 """GitHub App 인증 방식을 사용하는 GitHub API 클라이언트."""
-from datetime import datetime, timedelta
-from typing import Any
+import asyncio
+import importlib.util
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from pathlib import Path
+from typing import Any, AsyncIterator
 
 import httpx
 from loguru import logger
 
+from app import metrics
 from app.config import settings
 from app.auth import generate_jwt
+from app.github.blob_cache import BlobCache, blob_cache as default_blob_cache
+from app.github.cache import CachedResponse, ResponseCache, cache_key, response_cache
+from app.github.rate_limit import (
+    APP_BUDGET_KEY,
+    PRIORITY_NORMAL,
+    GitHubRateLimiter,
+    rate_limiter as default_rate_limiter,
+)
+from app.github.resilience import (
+    CircuitBreaker,
+    can_retry,
+    circuit_breaker as default_circuit_breaker,
+    is_transient_response,
+    retry_delay,
+)
+
+GITHUB_API_VERSION = "2022-11-28"
+DEFAULT_ACCEPT = "application/vnd.github+json"
+DIFF_ACCEPT = "application/vnd.github.diff"
+
+# 목록 API의 최대 페이지 크기와, GitHub가 PR당 돌려주는 파일/커밋 수 상한
+PER_PAGE_MAX = 100
+PR_FILES_LIMIT = 3000
+PR_COMMITS_LIMIT = 250
+
+# App JWT 유효 시간(GitHub 최대 10분)과, 만료 몇 초 전까지 재사용할지
+APP_JWT_TTL_SECONDS = 600
+APP_JWT_REUSE_MARGIN_SECONDS = 60
+# 남은 유효 시간이 이보다 짧은 installation 토큰은 쓰지 않고 새로 발급받을 때까지 기다린다
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+
+class GitHubGraphQLError(Exception):
+    """GraphQL 응답에 ``errors``가 포함된 경우 발생한다."""
+
+
+@cache
+def _http2_enabled() -> bool:
+    """``github_http2`` 설정과 ``h2`` 패키지 설치 여부로 HTTP/2 사용 여부를 정한다."""
+    if not settings.github_http2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("h2 패키지가 없어 GitHub API를 HTTP/1.1로 호출합니다")
+        return False
+    return True
 
 
 class GitHubClient:
     """GitHub App 인증을 자동으로 처리하는 GitHub API 클라이언트.
 
-    JWT 생성과 Installation Access Token 발급 및 관리를 내부에서 자동으로 처리한다.
+    JWT 생성과 installation별 Access Token 발급 및 캐시를 내부에서 자동으로 처리한다.
+    GET 조회는 ETag/Last-Modified 조건부 요청으로 캐시해 변경이 없으면 304로 본문 전송을 생략한다.
+    모든 호출은 프로세스당 하나인 ``httpx.AsyncClient``를 공유해 커넥션을 keep-alive로 재사용하며,
+    ``h2`` 패키지가 설치되어 있고 ``github_http2``가 켜져 있으면 HTTP/2로 다중화한다.
+    요청 속도는 installation별 rate limit 예산에 맞춰 ``GitHubRateLimiter``가 조절한다.
+    일시적 오류는 재시도해도 안전한 요청만 다시 보내고, 장애가 이어지면 ``CircuitBreaker``가 빠르게 실패시킨다.
     """
 
-    BASE_URL = "https://api.github.com"
-
-    def __init__(self):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+        blob_cache: BlobCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ):
+        self.base_url = (base_url or settings.github_api_url).rstrip("/")
+        self.cache = cache if cache is not None else response_cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter
+        self.blob_cache = blob_cache if blob_cache is not None else default_blob_cache
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else default_circuit_breaker
         self.app_id = settings.github_app_id
         self.private_key = settings.read_private_key()
-        self._installation_token: str | None = None
-        self._token_expires_at: datetime | None = None
+        self._app_jwt: str | None = None
+        self._app_jwt_expires_at: float = 0.0
+        self._installation_tokens: dict[str, tuple[str, datetime]] = {}
+        self._token_refreshes: dict[str, asyncio.Task] = {}
+        self._http: httpx.AsyncClient | None = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트를 반환한다. 처음 호출될 때 생성한다.
+
+        Returns:
+            커넥션 풀을 가진 ``httpx.AsyncClient``.
+        """
+        if self._http is None or self._http.is_closed:
+            http2 = _http2_enabled()
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.github_http_max_connections,
+                    max_keepalive_connections=settings.github_http_max_keepalive,
+                    keepalive_expiry=settings.github_http_keepalive_expiry,
+                ),
+                timeout=10.0,
+                headers={"X-GitHub-Api-Version": GITHUB_API_VERSION},
+            )
+            logger.debug(f"GitHub HTTP 클라이언트 생성 (http2={http2}, base_url={self.base_url})")
+        return self._http
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트의 커넥션을 모두 닫는다. 이후 호출 시 새로 생성된다."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+            logger.debug("GitHub HTTP 클라이언트 종료")
+        self._http = None
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        installation_id: str | None = None,
+        priority: str = PRIORITY_NORMAL,
+        stream: bool = False,
+        follow_redirects: bool = False,
+        retry_safe: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """rate limit 예산에 맞춰 요청을 보내고, rate limit 응답이나 일시적 오류면 대기 후 재시도한다.
+
+        rate limit 응답(429/403)은 ``GitHubRateLimiter.backoff``가 정한 시간만큼 기다린다.
+        502/503/504와 전송 오류는 재시도해도 안전한 요청(멱등 메서드, ``retry_safe``, 전송 전 연결
+        실패)만 지수 backoff + jitter로 다시 보내며, 호스트별 circuit breaker에 결과를 기록한다.
+
+        Args:
+            method: HTTP 메서드.
+            path: ``base_url`` 기준 API 경로.
+            headers: 요청 헤더.
+            installation_id: 예산을 차감할 Installation ID (App JWT 요청이면 None).
+            priority: ``PRIORITY_NORMAL`` 또는 ``PRIORITY_LOW``.
+            stream: True면 본문을 읽지 않은 응답을 돌려준다. 호출자가 ``aclose()``해야 한다.
+            follow_redirects: 리다이렉트를 따라갈지 여부 (tarball 다운로드 등).
+            retry_safe: 멱등 메서드가 아니어도 일시적 오류 시 재시도해도 안전한 요청인지 여부.
+            **kwargs: ``httpx.AsyncClient.build_request``에 그대로 전달할 인자.
+
+        Returns:
+            마지막으로 받은 응답 (상태 코드는 확인하지 않음).
+
+        Raises:
+            RateLimitBudgetExceeded: 저우선순위 요청인데 예산이 부족한 경우.
+            CircuitOpenError: 대상 호스트의 circuit이 열려 있는 경우.
+            httpx.TransportError: 재시도 후에도 전송 오류가 난 경우.
+        """
+        key = str(installation_id) if installation_id is not None else APP_BUDGET_KEY
+        http = self._get_http()
+        rate_limit_attempt = 0
+        transient_attempt = 0
+        while True:
+            request = http.build_request(method, path, headers=headers, **kwargs)
+            host = request.url.host
+            self.circuit_breaker.before_request(host)
+            await self.rate_limiter.acquire(key, priority)
+            try:
+                response = await http.send(request, stream=stream, follow_redirects=follow_redirects)
+            except httpx.TransportError as e:
+                self.circuit_breaker.record_failure(host)
+                if transient_attempt >= settings.github_retry_max_attempts or not can_retry(method, retry_safe, e):
+                    raise
+                await self._transient_backoff(method, path, transient_attempt, type(e).__name__)
+                transient_attempt += 1
+                continue
+            self.rate_limiter.update(key, response)
+
+            if is_transient_response(response):
+                self.circuit_breaker.record_failure(host)
+                if transient_attempt >= settings.github_retry_max_attempts or not can_retry(method, retry_safe):
+                    break
+                if stream:
+                    await response.aclose()
+                await self._transient_backoff(method, path, transient_attempt, str(response.status_code))
+                transient_attempt += 1
+                continue
+            self.circuit_breaker.record_success(host)
+
+            if rate_limit_attempt == settings.github_rate_limit_max_retries or response.is_success:
+                break
+            if stream:
+                # 에러 응답은 작으므로 읽어 두고 (backoff가 본문을 확인한다) 스트림을 닫는다
+                await response.aread()
+            # 재시도 대기는 다음 acquire가 blocked_until까지 기다리는 것으로 처리된다
+            if self.rate_limiter.backoff(key, response, rate_limit_attempt) is None:
+                break
+            rate_limit_attempt += 1
+        return response
+
+    async def _transient_backoff(self, method: str, path: str, attempt: int, reason: str) -> None:
+        """일시적 오류 재시도 전에 지수 backoff + full jitter만큼 기다린다."""
+        delay = retry_delay(
+            attempt, settings.github_retry_base_delay_seconds, settings.github_retry_max_delay_seconds
+        )
+        metrics.inc("github_transient_retries_total", reason=reason)
+        logger.warning(f"🔁 GitHub 일시적 오류 ({reason}) {method} {path}: {delay:.2f}초 후 재시도 (attempt={attempt + 1})")
+        await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        token: str,
+        accept: str = DEFAULT_ACCEPT,
+        installation_id: str | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """공유 클라이언트로 GitHub API를 호출하고 에러 응답이면 예외를 던진다.
+
+        Args:
+            method: HTTP 메서드.
+            path: ``base_url`` 기준 API 경로 (예: ``/repos/o/r/pulls/1``).
+            token: Authorization 헤더에 넣을 Bearer 토큰 (JWT 또는 installation token).
+            accept: Accept 헤더 값.
+            installation_id: rate limit 예산을 차감할 Installation ID (App JWT 요청이면 None).
+            **kwargs: ``httpx.AsyncClient.request``에 그대로 전달할 인자 (params, json, timeout 등).
+
+        Returns:
+            성공한 응답.
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        response = await self._send(
+            method,
+            path,
+            {"Authorization": f"Bearer {token}", "Accept": accept},
+            installation_id=installation_id,
+            **kwargs,
+        )
+        response.raise_for_status()
+        return response
+
+    async def _get(
+        self,
+        installation_id: str,
+        path: str,
+        accept: str = DEFAULT_ACCEPT,
+        params: dict[str, Any] | None = None,
+        timeout: float = 10.0,
+        priority: str = PRIORITY_NORMAL,
+    ) -> httpx.Response:
+        """installation 토큰으로 GET을 보내되, 캐시된 응답이 있으면 조건부 요청으로 재검증한다.
+
+        GitHub가 304를 돌려주면 캐시된 본문으로 만든 200 응답을 반환한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            path: ``base_url`` 기준 API 경로.
+            accept: Accept 헤더 값.
+            params: 쿼리 파라미터.
+            timeout: 요청 타임아웃 (초).
+            priority: rate limit 예산이 부족할 때의 우선순위 (``PRIORITY_LOW``면 가장 먼저 포기).
+
+        Returns:
+            성공한 응답 (또는 캐시에서 복원한 응답).
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+            RateLimitBudgetExceeded: 저우선순위 요청인데 예산이 부족한 경우.
+        """
+        token = await self.get_installation_token(installation_id)
+        key = cache_key(str(installation_id), path, params, accept)
+        cached = await self.cache.get(key)
+
+        headers = {"Authorization": f"Bearer {token}", "Accept": accept}
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+        response = await self._send(
+            "GET",
+            path,
+            headers,
+            installation_id=installation_id,
+            priority=priority,
+            params=params,
+            timeout=timeout,
+        )
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            metrics.inc("github_cache_requests_total", result="hit")
+            logger.debug(f"GitHub 응답 캐시 적중 (304): {path}")
+            return cached.to_response(response.request)
+        response.raise_for_status()
+
+        entry = CachedResponse.from_response(response)
+        if entry is not None:
+            await self.cache.put(key, entry)
+        metrics.inc("github_cache_requests_total", result="miss" if entry is not None else "uncacheable")
+        return response
+
+    async def _iter_pages(
+        self,
+        installation_id: str,
+        path: str,
+        total: int | None = None,
+        limit: int | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float = 10.0,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """목록 API를 ``per_page=100``으로 조회하며 페이지가 도착하는 대로 순서대로 내보낸다.
+
+        전체 개수(``total``)를 알면 필요한 페이지를 처음부터 동시에 요청하고, 모르면 첫 페이지의
+        ``Link: rel="last"`` 헤더로 마지막 페이지를 알아낸 뒤 나머지를 동시에 요청한다.
+        동시 요청 수는 ``github_page_concurrency``로 제한하며, 소비자가 중간에 멈추면
+        남은 페이지 요청은 취소된다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            path: ``base_url`` 기준 API 경로.
+            total: 전체 항목 수 (PR 상세의 ``changed_files``/``commits`` 등). 모르면 None.
+            limit: 가져올 최대 항목 수 (GitHub API의 상한).
+            params: ``per_page``/``page`` 외의 쿼리 파라미터.
+            timeout: 페이지당 요청 타임아웃 (초).
+
+        Yields:
+            페이지 하나의 항목 목록 (``limit``을 넘는 항목은 잘라낸다).
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        semaphore = asyncio.Semaphore(settings.github_page_concurrency)
+
+        async def fetch(page: int) -> httpx.Response:
+            async with semaphore:
+                return await self._get(
+                    installation_id,
+                    path,
+                    params={**(params or {}), "per_page": PER_PAGE_MAX, "page": page},
+                    timeout=timeout,
+                )
+
+        remaining = limit
+        max_pages = math.ceil(limit / PER_PAGE_MAX) if limit else None
+        if total is not None:
+            if limit is not None and total > limit:
+                logger.warning(f"{path}: 전체 {total}개 중 API 상한 {limit}개까지만 조회합니다")
+            page_count = max(1, math.ceil(min(total, limit or total) / PER_PAGE_MAX))
+            tasks = [asyncio.create_task(fetch(page)) for page in range(1, page_count + 1)]
+        else:
+            first = await fetch(1)
+            last_url = first.links.get("last", {}).get("url")
+            page_count = int(httpx.URL(last_url).params.get("page", 1)) if last_url else 1
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+            tasks = [asyncio.create_task(fetch(page)) for page in range(2, page_count + 1)]
+            items = first.json()
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            yield items
+
+        try:
+            for task in tasks:
+                items = (await task).json()
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                yield items
+        finally:
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()  # 소비되지 않은 페이지의 예외를 회수
+                else:
+                    task.cancel()
+
+    async def _get_paginated(
+        self,
+        installation_id: str,
+        path: str,
+        total: int | None = None,
+        limit: int | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float = 10.0,
+    ) -> list[dict[str, Any]]:
+        """목록 API의 모든 페이지를 조회해 이어 붙인다. 인자는 ``_iter_pages``와 같다.
+
+        Returns:
+            모든 페이지의 항목을 순서대로 합친 목록.
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        items: list[dict[str, Any]] = []
+        async for page in self._iter_pages(installation_id, path, total, limit, params, timeout):
+            items.extend(page)
+        return items
 
     def _get_jwt(self) -> str:
-        """GitHub App 인증에 사용되는 JWT 토큰을 생성한다.
+        """GitHub App 인증에 사용되는 JWT 토큰을 반환한다.
+
+        RS256 서명 비용을 줄이기 위해 만료 ``APP_JWT_REUSE_MARGIN_SECONDS`` 전까지는
+        한 번 서명한 JWT를 재사용한다.
 
         Returns:
             JWT 토큰 문자열
         """
-        return generate_jwt(self.app_id, self.private_key)
+        now = time.time()
+        if self._app_jwt is None or now >= self._app_jwt_expires_at - APP_JWT_REUSE_MARGIN_SECONDS:
+            self._app_jwt = generate_jwt(self.app_id, self.private_key, APP_JWT_TTL_SECONDS)
+            self._app_jwt_expires_at = now + APP_JWT_TTL_SECONDS
+        return self._app_jwt
 
     async def get_installation_token(self, installation_id: str) -> str:
         """JWT를 사용해 Installation Access Token을 발급받는다.
 
-        발급된 토큰은 만료될 때까지(최대 1시간) 캐시하여 재사용한다.
+        토큰은 installation별로 API가 알려준 ``expires_at``까지 캐시한다.
+        만료 ``github_token_refresh_margin_seconds`` 전부터는 캐시된 토큰을 그대로 반환하면서
+        백그라운드에서 새 토큰을 받아 두고, 동시에 여러 호출이 발급을 요청하면 한 번만 발급한다.
 
         Args:
             installation_id: GitHub App의 Installation ID
@@ -45,35 +430,73 @@ class GitHubClient:
         Raises:
             httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
         """
-        # 캐시된 토큰이 있고 아직 유효하다면 재사용
-        if self._installation_token and self._token_expires_at:
-            if datetime.now() < self._token_expires_at - timedelta(minutes=5):
-                logger.debug("캐시된 installation token을 재사용합니다")
-                return self._installation_token
-
-        # 새로운 JWT 생성
-        jwt_token = self._get_jwt()
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/app/installations/{installation_id}/access_tokens",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        installation_id = str(installation_id)
+        cached = self._installation_tokens.get(installation_id)
+        if cached is not None:
+            token, expires_at = cached
+            remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+            if remaining > TOKEN_EXPIRY_MARGIN_SECONDS:
+                if remaining <= settings.github_token_refresh_margin_seconds:
+                    self._start_token_refresh(installation_id)
+                logger.debug(f"Installation {installation_id}의 캐시된 토큰을 재사용합니다")
+                return token
+
+        # 한 installation의 발급은 하나만 진행하고, 취소된 호출자가 있어도 발급은 계속한다
+        return await asyncio.shield(self._start_token_refresh(installation_id))
+
+    def _start_token_refresh(self, installation_id: str) -> asyncio.Task:
+        """installation 토큰 발급 태스크를 시작한다. 이미 진행 중이면 그 태스크를 반환한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+
+        Returns:
+            발급된 토큰을 결과로 갖는 태스크.
+        """
+        task = self._token_refreshes.get(installation_id)
+        if task is None:
+            task = asyncio.create_task(self._issue_installation_token(installation_id))
+            self._token_refreshes[installation_id] = task
+            task.add_done_callback(lambda t: self._on_token_refresh_done(installation_id, t))
+        return task
 
-            # 토큰 캐싱
-            self._installation_token = data["token"]
+    def _on_token_refresh_done(self, installation_id: str, task: asyncio.Task) -> None:
+        """끝난 발급 태스크를 정리하고, 실패했으면 로그로 남긴다 (백그라운드 갱신 실패도 드러나도록)."""
+        self._token_refreshes.pop(installation_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Installation {installation_id} 토큰 발급 실패: {task.exception()}")
+
+    async def _issue_installation_token(self, installation_id: str) -> str:
+        """GitHub API로 Installation Access Token을 새로 발급받아 캐시한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+
+        Returns:
+            발급된 토큰 문자열
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        response = await self._request(
+            "POST",
+            f"/app/installations/{installation_id}/access_tokens",
+            self._get_jwt(),
+            retry_safe=True,
+        )
+        data = response.json()
+
+        if data.get("expires_at"):
+            expires_at = datetime.fromisoformat(data["expires_at"].replace("Z", "+00:00"))
+        else:
             # Installation Access Token은 최대 1시간 유효
-            self._token_expires_at = datetime.now() + timedelta(hours=1)
+            expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        self._installation_tokens[installation_id] = (data["token"], expires_at)
 
-            logger.info(f"Installation {installation_id}에 대한 새로운 토큰을 발급받았습니다")
-            return self._installation_token
+        logger.info(
+            f"Installation {installation_id}에 대한 새로운 토큰을 발급받았습니다 (만료 {expires_at:%H:%M:%S} UTC)"
+        )
+        return data["token"]
 
     async def create_pr_comment(
         self,
@@ -100,37 +523,117 @@ class GitHubClient:
         """
         token = await self.get_installation_token(installation_id)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/issues/{pull_number}/comments",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                json={"body": comment_body},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._request(
+            "POST",
+            f"/repos/{repo_owner}/{repo_name}/issues/{pull_number}/comments",
+            token,
+            installation_id=installation_id,
+            json={"body": comment_body},
+        )
+        data = response.json()
+
+        logger.info(f"{repo_owner}/{repo_name}의 PR #{pull_number}에 코멘트를 생성했습니다")
+        return data
+
+    async def update_issue_comment(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        comment_id: int,
+        comment_body: str,
+    ) -> dict[str, Any]:
+        """기존 PR(이슈) 코멘트의 내용을 수정한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            comment_id: 수정할 코멘트 ID
+            comment_body: 새 코멘트 내용 (Markdown 지원)
+
+        Returns:
+            수정된 코멘트 정보가 담긴 API 응답 데이터
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우 (삭제된 코멘트면 404)
+        """
+        token = await self.get_installation_token(installation_id)
+
+        response = await self._request(
+            "PATCH",
+            f"/repos/{repo_owner}/{repo_name}/issues/comments/{comment_id}",
+            token,
+            installation_id=installation_id,
+            json={"body": comment_body},
+        )
+        data = response.json()
+
+        logger.info(f"{repo_owner}/{repo_name}의 코멘트 {comment_id}를 수정했습니다")
+        return data
 
-            logger.info(f"{repo_owner}/{repo_name}의 PR #{pull_number}에 코멘트를 생성했습니다")
-            return data
+    async def create_review(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        commit_id: str,
+        body: str,
+        comments: list[dict[str, Any]],
+        event: str = "COMMENT",
+    ) -> dict[str, Any]:
+        """Pull Request에 인라인 코멘트를 묶은 리뷰 하나를 제출한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            pull_number: Pull Request 번호
+            commit_id: 코멘트 라인 번호의 기준 커밋 SHA
+            body: 리뷰 본문
+            comments: 인라인 코멘트 목록 (``path``, ``line``, ``side``, ``body``)
+            event: 리뷰 이벤트 ("COMMENT", "APPROVE", "REQUEST_CHANGES")
+
+        Returns:
+            생성된 리뷰 정보가 담긴 API 응답 데이터
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우 (diff 밖의 라인이면 422)
+        """
+        token = await self.get_installation_token(installation_id)
+
+        response = await self._request(
+            "POST",
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/reviews",
+            token,
+            installation_id=installation_id,
+            json={"commit_id": commit_id, "body": body, "event": event, "comments": comments},
+            timeout=30.0,
+        )
+        data = response.json()
+
+        logger.info(f"{repo_owner}/{repo_name}의 PR #{pull_number}에 인라인 코멘트 {len(comments)}개로 리뷰를 제출했습니다")
+        return data
 
     async def get_pr_files(
         self,
         installation_id: str,
         repo_owner: str,
         repo_name: str,
-        pull_number: int
+        pull_number: int,
+        total: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Pull Request에서 변경된 파일 목록을 조회한다.
+        """Pull Request에서 변경된 파일 목록을 모든 페이지에 걸쳐 조회한다.
+
+        GitHub는 PR당 최대 ``PR_FILES_LIMIT``(3000)개 파일까지만 반환한다.
 
         Args:
             installation_id: GitHub App의 Installation ID
             repo_owner: 저장소 소유자
             repo_name: 저장소 이름
             pull_number: Pull Request 번호
+            total: PR 상세의 ``changed_files`` 값. 주면 모든 페이지를 처음부터 동시에 요청한다.
 
         Returns:
             변경된 파일 목록 (patch, additions, deletions 등의 정보 포함)
@@ -138,23 +641,46 @@ class GitHubClient:
         Raises:
             httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
         """
-        token = await self.get_installation_token(installation_id)
+        data = await self._get_paginated(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/files",
+            total=total,
+            limit=PR_FILES_LIMIT,
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/files",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        logger.info(f"PR #{pull_number}에서 {len(data)}개의 변경 파일을 조회했습니다")
+        return data
+
+    async def iter_pr_files(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        total: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Pull Request의 변경 파일 목록을 페이지가 도착하는 대로 내보낸다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            pull_number: Pull Request 번호
+            total: PR 상세의 ``changed_files`` 값. 주면 모든 페이지를 처음부터 동시에 요청한다.
 
-            logger.info(f"PR #{pull_number}에서 {len(data)}개의 변경 파일을 조회했습니다")
-            return data
+        Yields:
+            변경 파일 최대 100개로 이루어진 페이지
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        async for page in self._iter_pages(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/files",
+            total=total,
+            limit=PR_FILES_LIMIT,
+        ):
+            yield page
 
     async def get_file_content(
         self,
@@ -162,7 +688,8 @@ class GitHubClient:
         repo_owner: str,
         repo_name: str,
         file_path: str,
-        ref: str = "main"
+        ref: str = "main",
+        priority: str = PRIORITY_NORMAL,
     ) -> str:
         """저장소 내 특정 파일의 내용을 조회한다.
 
@@ -172,45 +699,227 @@ class GitHubClient:
             repo_name: 저장소 이름
             file_path: 저장소 내 파일 경로
             ref: Git 참조 (브랜치, 태그 또는 커밋 SHA)
+            priority: rate limit 예산이 부족할 때의 우선순위 (리뷰 컨텍스트 조회는 ``PRIORITY_LOW``)
 
         Returns:
             파일 내용을 문자열 형태로 반환
 
         Raises:
             httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+            RateLimitBudgetExceeded: 저우선순위 조회인데 rate limit 예산이 부족한 경우
         """
-        token = await self.get_installation_token(installation_id)
+        response = await self._get(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/contents/{file_path}",
+            accept="application/vnd.github.raw+json",
+            params={"ref": ref},
+            priority=priority,
+        )
+
+        logger.debug(f"{repo_owner}/{repo_name}의 {file_path} 파일 내용을 조회했습니다")
+        return response.text
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/contents/{file_path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github.raw+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                params={"ref": ref},
-                timeout=10.0
+    async def get_tree(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        ref: str,
+        priority: str = PRIORITY_NORMAL,
+    ) -> list[dict[str, Any]]:
+        """커밋(또는 트리) 기준 저장소 최상위 디렉터리의 항목 목록을 조회한다.
+
+        항목마다 경로와 blob SHA가 있어, 파일 내용을 받기 전에 존재 여부와 캐시 키를 알 수 있다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            ref: 커밋 SHA, 트리 SHA 또는 브랜치 이름
+            priority: rate limit 예산이 부족할 때의 우선순위
+
+        Returns:
+            트리 항목 목록 (``path``, ``type``, ``sha``, ``size`` 등)
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+            RateLimitBudgetExceeded: 저우선순위 조회인데 rate limit 예산이 부족한 경우
+        """
+        response = await self._get(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/git/trees/{ref}",
+            priority=priority,
+        )
+        return response.json()["tree"]
+
+    async def get_blob(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        sha: str,
+        priority: str = PRIORITY_NORMAL,
+    ) -> bytes:
+        """blob SHA로 파일 내용을 조회한다. blob 캐시에 있으면 요청하지 않는다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            sha: git blob SHA (``get_tree`` 항목의 ``sha``)
+            priority: rate limit 예산이 부족할 때의 우선순위
+
+        Returns:
+            파일 내용 (bytes)
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+            RateLimitBudgetExceeded: 저우선순위 조회인데 rate limit 예산이 부족한 경우
+        """
+        content = await self.blob_cache.get(sha)
+        if content is None:
+            # blob은 SHA가 곧 내용이므로 ETag 캐시 대신 blob 캐시만 사용한다
+            token = await self.get_installation_token(installation_id)
+            response = await self._request(
+                "GET",
+                f"/repos/{repo_owner}/{repo_name}/git/blobs/{sha}",
+                token,
+                accept="application/vnd.github.raw+json",
+                installation_id=installation_id,
+                priority=priority,
+                timeout=10.0,
             )
-            response.raise_for_status()
+            content = response.content
+            await self.blob_cache.put(sha, content)
+            logger.debug(f"{repo_owner}/{repo_name}의 blob {sha[:7]}을 조회했습니다")
+        return content
+
+    async def get_blob_content(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        sha: str,
+        priority: str = PRIORITY_NORMAL,
+    ) -> str:
+        """blob SHA로 파일 내용을 문자열로 조회한다. ``get_blob``과 같이 blob 캐시를 거친다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            sha: git blob SHA
+            priority: rate limit 예산이 부족할 때의 우선순위
+
+        Returns:
+            파일 내용을 문자열 형태로 반환
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+            RateLimitBudgetExceeded: 저우선순위 조회인데 rate limit 예산이 부족한 경우
+        """
+        content = await self.get_blob(installation_id, repo_owner, repo_name, sha, priority=priority)
+        return content.decode("utf-8", errors="replace")
+
+    async def download_tarball(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        ref: str,
+        destination: Path,
+    ) -> int:
+        """저장소의 특정 커밋 tarball(gzip)을 파일로 내려받는다.
+
+        본문을 메모리에 모으지 않고 ``destination``에 스트리밍으로 쓴다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            ref: 커밋 SHA 또는 브랜치 이름
+            destination: 저장할 파일 경로
+
+        Returns:
+            내려받은 바이트 수
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        token = await self.get_installation_token(installation_id)
+
+        response = await self._send(
+            "GET",
+            f"/repos/{repo_owner}/{repo_name}/tarball/{ref}",
+            {"Authorization": f"Bearer {token}", "Accept": DEFAULT_ACCEPT},
+            installation_id=installation_id,
+            stream=True,
+            follow_redirects=True,
+            timeout=120.0,
+        )
+        size = 0
+        try:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            with destination.open("wb") as f:
+                async for chunk in response.aiter_bytes():
+                    f.write(chunk)
+                    size += len(chunk)
+        finally:
+            await response.aclose()
+
+        logger.info(f"{repo_owner}/{repo_name}@{ref[:7]} tarball을 내려받았습니다 ({size} bytes)")
+        return size
+
+    async def compare_commits(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        base: str,
+        head: str,
+    ) -> dict[str, Any]:
+        """두 커밋을 비교한다.
 
-            logger.debug(f"{repo_owner}/{repo_name}의 {file_path} 파일 내용을 조회했습니다")
-            return response.text
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            base: 기준 커밋 SHA
+            head: 비교 대상 커밋 SHA
+
+        Returns:
+            비교 결과 (``status``: ahead/behind/diverged/identical, ``files``: 변경 파일 최대 300개)
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        response = await self._get(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/compare/{base}...{head}",
+            timeout=30.0,
+        )
+        return response.json()
 
     async def get_pr_commits(
         self,
         installation_id: str,
         repo_owner: str,
         repo_name: str,
-        pull_number: int
+        pull_number: int,
+        total: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Pull Request의 커밋 목록을 조회한다.
+        """Pull Request의 커밋 목록을 모든 페이지에 걸쳐 조회한다.
+
+        GitHub는 PR당 최대 ``PR_COMMITS_LIMIT``(250)개 커밋까지만 반환한다.
 
         Args:
             installation_id: GitHub App의 Installation ID
             repo_owner: 저장소 소유자
             repo_name: 저장소 이름
             pull_number: Pull Request 번호
+            total: PR 상세의 ``commits`` 값. 주면 모든 페이지를 처음부터 동시에 요청한다.
 
         Returns:
             커밋 목록 (SHA, 메시지, 작성자 등의 정보 포함)
@@ -218,23 +927,61 @@ class GitHubClient:
         Raises:
             httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
         """
-        token = await self.get_installation_token(installation_id)
+        data = await self._get_paginated(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/commits",
+            total=total,
+            limit=PR_COMMITS_LIMIT,
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/commits",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                timeout=10.0
+        logger.info(f"PR #{pull_number}에서 {len(data)}개의 커밋을 조회했습니다")
+        return data
+
+    async def iter_prs(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        state: str = "all",
+        sort: str = "created",
+        direction: str = "desc",
+        per_page: int = 100,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """저장소의 Pull Request 목록을 한 페이지씩 순서대로 내보낸다.
+
+        소비자가 필요한 만큼만 읽고 멈추면 이후 페이지는 요청하지 않는다
+        (예: ``sort="updated"``로 마지막 동기화 시점까지만 읽기).
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            state: PR 상태 필터 ("open", "closed", "all")
+            sort: 정렬 기준 ("created", "updated", "popularity", "long-running")
+            direction: 정렬 방향 ("asc", "desc")
+            per_page: 페이지당 결과 수 (최대 100)
+
+        Yields:
+            PR 목록 한 페이지 (number, state, merged_at, updated_at 등의 정보 포함)
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+        """
+        page = 1
+        while True:
+            response = await self._get(
+                installation_id,
+                f"/repos/{repo_owner}/{repo_name}/pulls",
+                params={"state": state, "sort": sort, "direction": direction, "per_page": per_page, "page": page},
+                timeout=30.0,
             )
-            response.raise_for_status()
             data = response.json()
-
-            logger.info(f"PR #{pull_number}에서 {len(data)}개의 커밋을 조회했습니다")
-            return data
+            if not data:
+                break
+            yield data
+            if len(data) < per_page:
+                break
+            page += 1
 
     async def list_prs(
         self,
@@ -244,7 +991,7 @@ class GitHubClient:
         state: str = "all",
         per_page: int = 100,
     ) -> list[dict[str, Any]]:
-        """저장소의 Pull Request 목록을 조회한다.
+        """저장소의 Pull Request 목록을 모든 페이지에 걸쳐 조회한다.
 
         Args:
             installation_id: GitHub App의 Installation ID
@@ -259,30 +1006,9 @@ class GitHubClient:
         Raises:
             httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
         """
-        token = await self.get_installation_token(installation_id)
         results: list[dict[str, Any]] = []
-        page = 1
-
-        async with httpx.AsyncClient() as client:
-            while True:
-                response = await client.get(
-                    f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/pulls",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28"
-                    },
-                    params={"state": state, "per_page": per_page, "page": page},
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                if not data:
-                    break
-                results.extend(data)
-                if len(data) < per_page:
-                    break
-                page += 1
+        async for page in self.iter_prs(installation_id, repo_owner, repo_name, state=state, per_page=per_page):
+            results.extend(page)
 
         logger.info(f"{repo_owner}/{repo_name}에서 PR {len(results)}개를 조회했습니다 (state={state})")
         return results
@@ -312,22 +1038,18 @@ class GitHubClient:
         """
         token = await self.get_installation_token(installation_id)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/merge",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                json={"merge_method": merge_method},
-                timeout=15.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._request(
+            "PUT",
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}/merge",
+            token,
+            installation_id=installation_id,
+            json={"merge_method": merge_method},
+            timeout=15.0,
+        )
+        data = response.json()
 
-            logger.info(f"{repo_owner}/{repo_name} PR #{pull_number}을 {merge_method} 방식으로 병합했습니다")
-            return data
+        logger.info(f"{repo_owner}/{repo_name} PR #{pull_number}을 {merge_method} 방식으로 병합했습니다")
+        return data
 
     async def get_pr_details(
         self,
@@ -350,20 +1072,91 @@ class GitHubClient:
         Raises:
             httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
         """
+        response = await self._get(
+            installation_id,
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}",
+        )
+        data = response.json()
+
+        logger.info(f"PR #{pull_number}의 상세 정보를 조회했습니다")
+        return data
+
+    async def iter_pr_diff_lines(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+    ) -> AsyncIterator[str]:
+        """Pull Request 전체의 unified diff를 한 번의 요청으로 받아 줄 단위로 내보낸다.
+
+        본문을 메모리에 모으지 않고 도착하는 대로 내보내므로 ``diff_parser.iter_file_changes``와
+        함께 쓰면 파일 단위로 바로 처리할 수 있다. diff가 너무 큰 PR은 GitHub가 406을 반환한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            repo_owner: 저장소 소유자
+            repo_name: 저장소 이름
+            pull_number: Pull Request 번호
+
+        Yields:
+            개행 문자가 제거된 diff 한 줄
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우 (diff 크기 초과 시 406)
+        """
         token = await self.get_installation_token(installation_id)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{repo_owner}/{repo_name}/pulls/{pull_number}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._send(
+            "GET",
+            f"/repos/{repo_owner}/{repo_name}/pulls/{pull_number}",
+            {"Authorization": f"Bearer {token}", "Accept": DIFF_ACCEPT},
+            installation_id=installation_id,
+            stream=True,
+            timeout=60.0,
+        )
+        try:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for line in response.aiter_lines():
+                yield line
+        finally:
+            await response.aclose()
+
+    async def graphql(
+        self,
+        installation_id: str,
+        query: str,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """GitHub GraphQL API로 쿼리를 실행한다.
+
+        Args:
+            installation_id: GitHub App의 Installation ID
+            query: GraphQL 쿼리 문자열
+            variables: 쿼리 변수
+
+        Returns:
+            응답의 ``data`` 필드
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 결과 에러가 발생한 경우
+            GitHubGraphQLError: 응답에 GraphQL 에러가 포함된 경우
+        """
+        token = await self.get_installation_token(installation_id)
 
-            logger.info(f"PR #{pull_number}의 상세 정보를 조회했습니다")
-            return data
+        response = await self._request(
+            "POST",
+            "/graphql",
+            token,
+            installation_id=installation_id,
+            json={"query": query, "variables": variables or {}},
+            timeout=30.0,
+            retry_safe=True,
+        )
+        payload = response.json()
+        if payload.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in payload["errors"])
+            raise GitHubGraphQLError(messages)
+        return payload["data"]
@@ -0,0 +1,125 @@
+"""PR 전체 unified diff 기반 Pull Request 데이터 수집 모듈."""
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+from loguru import logger
+
+from app.config import settings
+from app.github.diff_parser import iter_file_changes
+from app.github.pr_collector import PRDataCollector
+from app.models import FileChange
+
+
+class DiffPRDataCollector(PRDataCollector):
+    """변경 파일을 files API 페이지 대신 unified diff 한 번의 다운로드로 받는 수집기.
+
+    ``application/vnd.github.diff`` 응답을 줄 단위로 스트리밍하며 로컬에서 파싱하므로,
+    파일 수와 관계없이 파일 목록에는 요청 하나만 쓰고 페이지 JSON을 디코딩하지 않는다.
+    diff가 GitHub 한도를 넘어 406을 받으면 REST files API로 대신 조회한다.
+    """
+
+    async def _fetch_pr_payloads(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool,
+    ) -> tuple[dict, list[dict], list[dict]]:
+        """PR 상세, diff에서 파싱한 파일 목록, 커밋 목록을 동시에 조회한다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            include_commits: 커밋 목록 조회 여부
+
+        Returns:
+            (PR 상세, 파일 목록, 커밋 목록). 모두 REST API 응답 형태.
+        """
+        async def fetch_commits() -> list[dict]:
+            if not include_commits:
+                return []
+            return await self.client.get_pr_commits(
+                installation_id=installation_id,
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                pull_number=pull_number,
+            )
+
+        pr_details, files_data, commits_data = await asyncio.gather(
+            self.client.get_pr_details(
+                installation_id=installation_id,
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                pull_number=pull_number,
+            ),
+            self._fetch_files(installation_id, repo_owner, repo_name, pull_number),
+            fetch_commits(),
+        )
+
+        return pr_details, files_data, commits_data
+
+    async def iter_file_pages(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        total: int | None = None,
+    ) -> AsyncIterator[list[FileChange]]:
+        """diff는 요청 하나로 받으므로 파싱이 끝난 변경 파일 전체를 한 페이지로 내보낸다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            total: PR 상세의 ``changed_files`` 값 (files API로 대신 조회할 때 사용)
+
+        Yields:
+            변환된 FileChange 목록
+        """
+        files_data = await self._fetch_files(installation_id, repo_owner, repo_name, pull_number, total)
+        yield [self._convert_to_file_change(f) for f in files_data]
+
+    async def _fetch_files(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        total: int | None = None,
+    ) -> list[dict]:
+        """PR diff를 스트리밍 파싱해 REST files 응답 형태의 목록으로 반환한다.
+
+        Returns:
+            변경 파일 목록
+        """
+        lines = self.client.iter_pr_diff_lines(
+            installation_id=installation_id,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pull_number=pull_number,
+        )
+        try:
+            files_data = [
+                file_change.model_dump()
+                async for file_change in iter_file_changes(lines, settings.github_diff_max_patch_chars)
+            ]
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != httpx.codes.NOT_ACCEPTABLE:
+                raise
+            logger.warning(f"PR #{pull_number} diff가 너무 커서 files API로 조회합니다")
+            return await self.client.get_pr_files(
+                installation_id=installation_id,
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                pull_number=pull_number,
+                total=total,
+            )
+
+        logger.info(f"PR #{pull_number} diff에서 {len(files_data)}개의 변경 파일을 파싱했습니다")
+        return files_data
@@ -0,0 +1,234 @@
+"""Unified diff(``application/vnd.github.diff``) 스트리밍 파서.
+
+PR 전체 diff를 한 줄씩 받아 파일 단위 ``FileChange``로 바꾼다. 파일 하나가 끝날 때마다
+결과를 내보내므로, 메모리에는 현재 파싱 중인 파일의 patch만 유지된다.
+"""
+import ast
+import re
+from typing import AsyncIterable, AsyncIterator, Iterable
+
+from app.models import FileChange
+
+DEV_NULL = "/dev/null"
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+
+def _unquote(path: str) -> str:
+    """git이 따옴표로 감싼 경로(공백/비ASCII 포함)를 원래 문자열로 되돌린다."""
+    if len(path) >= 2 and path[0] == path[-1] == '"':
+        try:
+            return ast.literal_eval("b" + path).decode("utf-8", "replace")
+        except (SyntaxError, ValueError):
+            return path[1:-1]
+    return path
+
+
+def _strip_prefix(path: str) -> str:
+    path = _unquote(path)
+    if path.startswith(("a/", "b/")):
+        return path[2:]
+    return path
+
+
+def _split_git_paths(rest: str) -> tuple[str, str]:
+    """``diff --git`` 줄의 ``a/<old> b/<new>`` 부분을 두 경로로 나눈다.
+
+    경로에 공백이 있을 수 있으므로 따옴표로 감싼 경우를 먼저 처리하고, 아니면
+    두 경로가 같다고 가정해 가운데에서 나눈 뒤, 그래도 안 되면 마지막 `` b/``에서 나눈다.
+    """
+    if rest.startswith('"'):
+        end = 1
+        while end < len(rest) and (rest[end] != '"' or rest[end - 1] == "\\"):
+            end += 1
+        return _strip_prefix(rest[: end + 1]), _strip_prefix(rest[end + 2:])
+
+    mid = (len(rest) - 1) // 2
+    if len(rest) % 2 == 1 and rest[mid] == " " and rest[2:mid] == rest[mid + 3:]:
+        return rest[2:mid], rest[mid + 3:]
+
+    old, sep, new = rest.rpartition(" b/")
+    if sep:
+        return _strip_prefix(old), new
+    return _strip_prefix(rest), _strip_prefix(rest)
+
+
+class UnifiedDiffParser:
+    """한 줄씩 입력받아 파일 diff가 끝날 때마다 ``FileChange``를 돌려주는 증분 파서.
+
+    파일 상태(added/removed/renamed/copied/modified), 추가/삭제 라인 수, 이름 변경 전 경로,
+    바이너리 여부를 diff 헤더에서 읽는다. ``patch``는 files API와 같이 첫 ``@@`` 줄부터이며,
+    ``max_patch_chars``를 처음 넘는 순간 그 파일의 patch 수집을 멈추고 라인 수만 센다.
+    중간 줄만 빠지면 이후 라인 번호가 어긋나므로, 가능하면 마지막으로 완결된 hunk까지만 남기고
+    ``patch_truncated``를 표시한다.
+    """
+
+    def __init__(self, max_patch_chars: int | None = None):
+        self.max_patch_chars = max_patch_chars
+        self._current: dict | None = None
+
+    def feed(self, line: str) -> FileChange | None:
+        """diff 한 줄(개행 문자 제외)을 처리한다.
+
+        Args:
+            line: diff의 한 줄.
+
+        Returns:
+            이 줄로 직전 파일의 diff가 끝났으면 그 ``FileChange``, 아니면 None.
+        """
+        if line.startswith("diff --git "):
+            finished = self.close()
+            old_path, new_path = _split_git_paths(line[len("diff --git "):])
+            self._current = {
+                "filename": new_path,
+                "old_path": old_path,
+                "status": "modified",
+                "is_binary": False,
+                "additions": 0,
+                "deletions": 0,
+                "patch_lines": [],
+                "patch_chars": 0,
+                "hunk_start": 0,
+                "truncated": False,
+                "in_hunk": False,
+            }
+            return finished
+
+        current = self._current
+        if current is None:
+            return None
+
+        if current["in_hunk"] or line.startswith("@@"):
+            current["in_hunk"] = True
+            marker = line[:1]
+            if marker == "+":
+                current["additions"] += 1
+            elif marker == "-":
+                current["deletions"] += 1
+            if not current["truncated"]:
+                self._append_patch_line(current, line)
+        elif line.startswith("new file mode"):
+            current["status"] = "added"
+        elif line.startswith("deleted file mode"):
+            current["status"] = "removed"
+        elif line.startswith("rename from "):
+            current["status"] = "renamed"
+            current["old_path"] = _unquote(line[len("rename from "):])
+        elif line.startswith("rename to "):
+            current["filename"] = _unquote(line[len("rename to "):])
+        elif line.startswith("copy from "):
+            current["status"] = "copied"
+            current["old_path"] = _unquote(line[len("copy from "):])
+        elif line.startswith("copy to "):
+            current["filename"] = _unquote(line[len("copy to "):])
+        elif line.startswith("Binary files ") or line == "GIT binary patch":
+            current["is_binary"] = True
+        elif line.startswith("+++ "):
+            path = line[4:].split("\t", 1)[0]
+            if path != DEV_NULL:
+                current["filename"] = _strip_prefix(path)
+        return None
+
+    def _append_patch_line(self, current: dict, line: str) -> None:
+        """patch에 한 줄을 더한다. 한도를 넘으면 이후 줄은 받지 않고 진행 중인 hunk를 버린다."""
+        if line.startswith("@@"):
+            current["hunk_start"] = len(current["patch_lines"])
+        size = current["patch_chars"] + len(line) + 1
+        if self.max_patch_chars is not None and size > self.max_patch_chars:
+            current["truncated"] = True
+            if current["hunk_start"] > 0:
+                # 완결된 hunk가 있으면 잘린 hunk 없이 그 앞까지만 남긴다
+                del current["patch_lines"][current["hunk_start"]:]
+            return
+        current["patch_lines"].append(line)
+        current["patch_chars"] = size
+
+    def close(self) -> FileChange | None:
+        """파싱 중인 파일을 마무리한다. 입력이 끝났을 때도 반드시 호출해야 한다.
+
+        Returns:
+            마지막 파일의 ``FileChange``. 파싱 중인 파일이 없으면 None.
+        """
+        current, self._current = self._current, None
+        if current is None:
+            return None
+        renamed = current["status"] in ("renamed", "copied")
+        return FileChange(
+            filename=current["filename"],
+            status=current["status"],
+            additions=current["additions"],
+            deletions=current["deletions"],
+            changes=current["additions"] + current["deletions"],
+            patch="\n".join(current["patch_lines"]) if current["patch_lines"] else None,
+            previous_filename=current["old_path"] if renamed else None,
+            is_binary=current["is_binary"],
+            patch_truncated=current["truncated"],
+        )
+
+
+async def iter_file_changes(
+    lines: AsyncIterable[str],
+    max_patch_chars: int | None = None,
+) -> AsyncIterator[FileChange]:
+    """diff 줄 스트림을 받아 파일 diff가 끝날 때마다 ``FileChange``를 내보낸다.
+
+    Args:
+        lines: 개행 문자가 제거된 diff 줄의 비동기 스트림.
+        max_patch_chars: 파일당 유지할 patch 최대 길이 (None이면 무제한).
+
+    Yields:
+        파일 하나의 ``FileChange``.
+    """
+    parser = UnifiedDiffParser(max_patch_chars)
+    async for line in lines:
+        file_change = parser.feed(line)
+        if file_change is not None:
+            yield file_change
+    last = parser.close()
+    if last is not None:
+        yield last
+
+
+def parse_unified_diff(lines: str | Iterable[str], max_patch_chars: int | None = None) -> list[FileChange]:
+    """unified diff 전체를 한 번에 파싱한다.
+
+    Args:
+        lines: diff 문자열 또는 개행 문자가 제거된 줄 목록.
+        max_patch_chars: 파일당 유지할 patch 최대 길이 (None이면 무제한).
+
+    Returns:
+        파일별 ``FileChange`` 목록 (diff에 나온 순서).
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    parser = UnifiedDiffParser(max_patch_chars)
+    files = [f for f in map(parser.feed, lines) if f is not None]
+    last = parser.close()
+    if last is not None:
+        files.append(last)
+    return files
+
+
+def commentable_lines(patch: str | None) -> set[int]:
+    """patch에서 리뷰 코멘트를 달 수 있는 변경 후 파일의 라인 번호를 구한다.
+
+    GitHub pull request review API는 diff hunk 안의 라인에만 ``side="RIGHT"`` 코멘트를
+    허용한다. 추가된 라인(``+``)과 문맥 라인(공백)이 여기에 해당한다.
+
+    Args:
+        patch: files API 형식의 patch (첫 ``@@`` 줄부터).
+
+    Returns:
+        변경 후 파일 기준 라인 번호 집합. patch가 없으면 빈 집합.
+    """
+    lines: set[int] = set()
+    current: int | None = None
+    for line in (patch or "").splitlines():
+        match = _HUNK_HEADER.match(line)
+        if match:
+            current = int(match.group(1))
+            continue
+        if current is None or line.startswith(("-", "\\")):
+            continue
+        lines.add(current)
+        current += 1
+    return lines
@@ -0,0 +1,323 @@
+"""GitHub GraphQL API 기반 Pull Request 데이터 수집 모듈."""
+import httpx
+from loguru import logger
+
+from app.github.pr_collector import PRDataCollector
+from app.models import PRData
+
+PR_QUERY = """
+query(
+  $owner: String!, $name: String!, $number: Int!,
+  $filesCursor: String, $commitsCursor: String,
+  $withFiles: Boolean!, $withCommits: Boolean!
+) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      number
+      title
+      body
+      state
+      url
+      additions
+      deletions
+      changedFiles
+      baseRefName
+      baseRefOid
+      headRefName
+      headRefOid
+      author {
+        login
+        avatarUrl
+        ... on User { databaseId }
+        ... on Bot { databaseId }
+      }
+      files(first: 100, after: $filesCursor) @include(if: $withFiles) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path additions deletions changeType }
+      }
+      commits(first: 100, after: $commitsCursor) @include(if: $withCommits) {
+        totalCount
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          commit {
+            oid
+            message
+            url
+            author {
+              name
+              date
+              user { login databaseId avatarUrl }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL changeType → REST files API의 status
+_CHANGE_TYPE_STATUS = {
+    "ADDED": "added",
+    "DELETED": "removed",
+    "MODIFIED": "modified",
+    "RENAMED": "renamed",
+    "COPIED": "copied",
+    "CHANGED": "changed",
+}
+
+
+class GraphQLPRDataCollector(PRDataCollector):
+    """PR 메타데이터, 변경 파일 목록, 커밋을 GraphQL 쿼리 하나로 조회하는 수집기.
+
+    파일/커밋이 100개를 넘으면 커서로 이어서 조회하며, 다음 페이지가 필요한 연결만 다시
+    요청한다. 결과는 REST 응답 형태로 바꿔 ``PRDataCollector._convert_to_pr_data``를 그대로 사용한다.
+
+    GraphQL API는 파일별 diff(patch)를 제공하지 않는다. ``collect_pr_metadata``는 patch 없이
+    GraphQL만으로 수집을 끝내고, patch는 파일 리뷰 직전에 ``load_patches``가 REST files API로
+    받는다. 위험도가 LOW라 파일 리뷰를 건너뛰는 PR은 REST 요청을 하지 않는다.
+    """
+
+    async def collect_pr_metadata(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool = True
+    ) -> PRData:
+        """GraphQL로 PR 상세, 변경 파일 목록(patch 제외), 커밋을 한 번에 수집한다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            include_commits: 커밋 목록 포함 여부 (기본: True)
+
+        Returns:
+            patch가 비어 있는 PR 데이터
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 실패 또는 PR이 없는 경우 (404)
+            GitHubGraphQLError: 응답에 GraphQL 에러가 포함된 경우
+        """
+        pr_details, files_data, commits_data = await self._query_payloads(
+            installation_id, repo_owner, repo_name, pull_number, include_commits
+        )
+        return self._convert_to_pr_data(
+            pr_details=pr_details,
+            files_data=files_data,
+            commits_data=commits_data,
+            repo_owner=repo_owner,
+            repo_name=repo_name
+        )
+
+    async def load_patches(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pr_data: PRData,
+    ) -> PRData:
+        """patch 없이 수집한 변경 파일에 REST files API의 patch를 채운다.
+
+        patch가 하나라도 있으면 이미 받은 것으로 보고 그대로 반환한다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pr_data: ``collect_pr_metadata`` 결과
+
+        Returns:
+            patch를 채운 PR 데이터 (받을 것이 없으면 ``pr_data`` 그대로)
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 실패 시
+        """
+        if not pr_data.files or any(f.patch for f in pr_data.files):
+            return pr_data
+        rest_files = await self.client.get_pr_files(
+            installation_id=installation_id,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pull_number=pr_data.pr_number,
+            total=pr_data.changed_files_count,
+        )
+        patches = {f["filename"]: self._convert_to_file_change(f) for f in rest_files}
+        files = [patches.get(f.filename, f) for f in pr_data.files]
+        logger.debug(f"PR #{pr_data.pr_number} REST patch {len(patches)}개 조회")
+        return pr_data.model_copy(update={"files": files})
+
+    async def _fetch_pr_payloads(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool,
+    ) -> tuple[dict, list[dict], list[dict]]:
+        """GraphQL로 PR 상세/파일/커밋을 조회하고, 변경 파일이 있으면 REST로 patch를 받는다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            include_commits: 커밋 목록 조회 여부
+
+        Returns:
+            (PR 상세, 파일 목록, 커밋 목록). 모두 REST API 응답 형태.
+        """
+        pr_details, files_data, commits_data = await self._query_payloads(
+            installation_id, repo_owner, repo_name, pull_number, include_commits
+        )
+        if files_data:
+            rest_files = await self.client.get_pr_files(
+                installation_id=installation_id,
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                pull_number=pull_number,
+                total=pr_details["changed_files"],
+            )
+            patches = {f["filename"]: f for f in rest_files}
+            files_data = [patches.get(f["filename"]) or f for f in files_data]
+        return pr_details, files_data, commits_data
+
+    async def _query_payloads(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool,
+    ) -> tuple[dict, list[dict], list[dict]]:
+        """GraphQL 조회 결과를 REST 응답 형태(patch 제외)로 바꿔 반환한다.
+
+        Returns:
+            (PR 상세, 파일 목록, 커밋 목록)
+        """
+        pull_request, file_nodes, commit_nodes = await self._query_pull_request(
+            installation_id, repo_owner, repo_name, pull_number, include_commits
+        )
+        files_data = [_file_from_node(node) for node in file_nodes]
+        commits_data = [_commit_from_node(node["commit"], repo_owner, repo_name) for node in commit_nodes]
+        pr_details = _details_from_node(pull_request, include_commits)
+
+        logger.debug(f"GraphQL PR 수집: 파일 {len(files_data)}개, 커밋 {len(commits_data)}개")
+        return pr_details, files_data, commits_data
+
+    async def _query_pull_request(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool,
+    ) -> tuple[dict, list[dict], list[dict]]:
+        """PR_QUERY를 커서가 끝날 때까지 반복 실행한다.
+
+        Returns:
+            (pullRequest 노드, 파일 노드 목록, 커밋 노드 목록)
+
+        Raises:
+            httpx.HTTPStatusError: PR이 없는 경우 (REST PR 조회와 같은 404)
+        """
+        variables = {
+            "owner": repo_owner,
+            "name": repo_name,
+            "number": pull_number,
+            "filesCursor": None,
+            "commitsCursor": None,
+            "withFiles": True,
+            "withCommits": include_commits,
+        }
+        pull_request: dict | None = None
+        file_nodes: list[dict] = []
+        commit_nodes: list[dict] = []
+
+        while variables["withFiles"] or variables["withCommits"]:
+            data = await self.client.graphql(installation_id, PR_QUERY, dict(variables))
+            node = (data.get("repository") or {}).get("pullRequest")
+            if node is None:
+                _raise_not_found(self.client.base_url, repo_owner, repo_name, pull_number)
+            if pull_request is None:
+                pull_request = node
+
+            for connection, nodes, flag, cursor in (
+                ("files", file_nodes, "withFiles", "filesCursor"),
+                ("commits", commit_nodes, "withCommits", "commitsCursor"),
+            ):
+                if not variables[flag]:
+                    continue
+                nodes.extend(node[connection]["nodes"])
+                page_info = node[connection]["pageInfo"]
+                variables[flag] = page_info["hasNextPage"]
+                variables[cursor] = page_info["endCursor"]
+
+        return pull_request, file_nodes, commit_nodes
+
+
+def _raise_not_found(base_url: str, repo_owner: str, repo_name: str, pull_number: int) -> None:
+    """REST PR 조회가 PR이 없을 때 던지는 것과 같은 404 ``HTTPStatusError``를 던진다."""
+    request = httpx.Request("GET", f"{base_url}/repos/{repo_owner}/{repo_name}/pulls/{pull_number}")
+    response = httpx.Response(httpx.codes.NOT_FOUND, request=request)
+    raise httpx.HTTPStatusError(
+        f"Pull request {repo_owner}/{repo_name}#{pull_number} not found", request=request, response=response
+    )
+
+
+def _details_from_node(node: dict, include_commits: bool) -> dict:
+    """pullRequest 노드를 REST PR 상세 응답 형태로 바꾼다."""
+    author = node.get("author") or {}
+    details = {
+        "number": node["number"],
+        "title": node["title"],
+        "body": node.get("body"),
+        "state": "open" if node["state"] == "OPEN" else "closed",
+        "user": {
+            "login": author.get("login", "ghost"),
+            "id": author.get("databaseId") or 0,
+            "avatar_url": author.get("avatarUrl"),
+        },
+        "base": {"ref": node["baseRefName"], "sha": node["baseRefOid"]},
+        "head": {"ref": node["headRefName"], "sha": node["headRefOid"]},
+        "html_url": node.get("url"),
+        "diff_url": f"{node['url']}.diff" if node.get("url") else None,
+        "additions": node["additions"],
+        "deletions": node["deletions"],
+        "changed_files": node["changedFiles"],
+    }
+    if include_commits:
+        details["commits"] = node["commits"]["totalCount"]
+    return details
+
+
+def _file_from_node(node: dict) -> dict:
+    """파일 노드를 patch 없는 REST files 응답 형태로 바꾼다."""
+    return {
+        "filename": node["path"],
+        "status": _CHANGE_TYPE_STATUS.get(node["changeType"], "modified"),
+        "additions": node["additions"],
+        "deletions": node["deletions"],
+        "changes": node["additions"] + node["deletions"],
+        "patch": None,
+    }
+
+
+def _commit_from_node(commit: dict, repo_owner: str, repo_name: str) -> dict:
+    """커밋 노드를 REST commits 응답 형태로 바꾼다."""
+    author = commit.get("author") or {}
+    user = author.get("user")
+    return {
+        "sha": commit["oid"],
+        "html_url": commit.get("url") or f"https://github.com/{repo_owner}/{repo_name}/commit/{commit['oid']}",
+        "author": {"login": user["login"], "id": user.get("databaseId") or 0, "avatar_url": user.get("avatarUrl")}
+        if user
+        else None,
+        "commit": {
+            "message": commit["message"],
+            "author": {"name": author.get("name", "unknown"), "date": author.get("date")},
+        },
+    }
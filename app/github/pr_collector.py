@@ -1,5 +1,6 @@
 """Pull Request 데이터 수집 모듈."""
-from typing import Optional
+import asyncio
+from typing import AsyncIterator, Optional
 from loguru import logger
 
 from app.github.client import GitHubClient
@@ -37,33 +38,15 @@ class PRDataCollector:
         """
         logger.info(f"PR 데이터 수집 시작: {repo_owner}/{repo_name}#{pull_number}")
 
-        # 1. PR 상세 정보 조회
-        pr_details = await self.client.get_pr_details(
+        pr_details, files_data, commits_data = await self._fetch_pr_payloads(
             installation_id=installation_id,
             repo_owner=repo_owner,
             repo_name=repo_name,
-            pull_number=pull_number
+            pull_number=pull_number,
+            include_commits=include_commits,
         )
 
-        # 2. 변경된 파일 목록 조회
-        files_data = await self.client.get_pr_files(
-            installation_id=installation_id,
-            repo_owner=repo_owner,
-            repo_name=repo_name,
-            pull_number=pull_number
-        )
-
-        # 3. 커밋 목록 조회 (옵션)
-        commits_data = []
-        if include_commits:
-            commits_data = await self.client.get_pr_commits(
-                installation_id=installation_id,
-                repo_owner=repo_owner,
-                repo_name=repo_name,
-                pull_number=pull_number
-            )
-
-        # 4. 데이터 변환
+        # 데이터 변환
         pr_data = self._convert_to_pr_data(
             pr_details=pr_details,
             files_data=files_data,
@@ -80,6 +63,195 @@ class PRDataCollector:
 
         return pr_data
 
+    async def collect_pr_metadata(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool = True
+    ) -> PRData:
+        """변경 파일 목록을 제외한 PR 상세와 커밋을 수집한다.
+
+        파일은 ``collect_files``로 따로 받아, 파일 페이지를 내려받는 동안 리뷰의 앞 단계를
+        먼저 진행할 수 있게 한다. 파일 수·라인 수 통계는 PR 상세의 값으로 채운다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            include_commits: 커밋 목록 포함 여부 (기본: True)
+
+        Returns:
+            ``files``가 빈 PR 데이터
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 실패 시
+        """
+        pr_details, commits_data = await self._fetch_details_and_commits(
+            installation_id, repo_owner, repo_name, pull_number, include_commits
+        )
+        return self._convert_to_pr_data(
+            pr_details=pr_details,
+            files_data=[],
+            commits_data=commits_data,
+            repo_owner=repo_owner,
+            repo_name=repo_name
+        )
+
+    async def iter_file_pages(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        total: int | None = None,
+    ) -> AsyncIterator[list[FileChange]]:
+        """변경 파일을 페이지(최대 100개) 단위로 도착하는 대로 ``FileChange`` 목록으로 내보낸다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            total: PR 상세의 ``changed_files`` 값 (알면 모든 페이지를 처음부터 동시에 요청)
+
+        Yields:
+            변환된 FileChange 목록 (페이지 하나)
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 실패 시
+        """
+        async for page in self.client.iter_pr_files(
+            installation_id=installation_id,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pull_number=pull_number,
+            total=total,
+        ):
+            yield [self._convert_to_file_change(f) for f in page]
+
+    async def collect_files(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        total: int | None = None,
+    ) -> list[FileChange]:
+        """``iter_file_pages``의 페이지를 도착하는 대로 모아 전체 변경 파일 목록을 반환한다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            total: PR 상세의 ``changed_files`` 값
+
+        Returns:
+            변경 파일 목록
+
+        Raises:
+            httpx.HTTPStatusError: GitHub API 호출 실패 시
+        """
+        files: list[FileChange] = []
+        async for page in self.iter_file_pages(installation_id, repo_owner, repo_name, pull_number, total):
+            files.extend(page)
+            logger.debug(f"PR #{pull_number} 변경 파일 {len(files)}/{total if total is not None else '?'}개 수신")
+        return files
+
+    async def load_patches(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pr_data: PRData,
+    ) -> PRData:
+        """파일 리뷰에 필요한 patch를 채운다. REST files API는 patch를 함께 주므로 그대로 반환한다.
+
+        patch 없이 파일 목록을 받는 수집기(GraphQL)가 재정의한다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pr_data: 수집한 PR 데이터
+
+        Returns:
+            patch가 채워진 PR 데이터
+        """
+        return pr_data
+
+    async def _fetch_details_and_commits(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool,
+    ) -> tuple[dict, list[dict]]:
+        """REST API로 PR 상세와 커밋 목록을 동시에 조회한다 (커밋 페이지 수는 Link 헤더로 파악).
+
+        Returns:
+            (PR 상세, 커밋 목록). 모두 REST API 응답 형태.
+        """
+        async def fetch_commits() -> list[dict]:
+            if not include_commits:
+                return []
+            return await self.client.get_pr_commits(
+                installation_id=installation_id,
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                pull_number=pull_number,
+            )
+
+        pr_details, commits_data = await asyncio.gather(
+            self.client.get_pr_details(
+                installation_id=installation_id,
+                repo_owner=repo_owner,
+                repo_name=repo_name,
+                pull_number=pull_number,
+            ),
+            fetch_commits(),
+        )
+        return pr_details, commits_data
+
+    async def _fetch_pr_payloads(
+        self,
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        pull_number: int,
+        include_commits: bool,
+    ) -> tuple[dict, list[dict], list[dict]]:
+        """REST API로 PR 상세, 변경 파일, 커밋 목록을 조회한다.
+
+        PR 상세와 커밋은 동시에 요청하고, 파일은 PR 상세의 ``changed_files``로 페이지 수를 알아
+        모든 페이지를 처음부터 동시에 요청한다.
+
+        Args:
+            installation_id: GitHub App Installation ID
+            repo_owner: 리포지토리 소유자
+            repo_name: 리포지토리 이름
+            pull_number: PR 번호
+            include_commits: 커밋 목록 조회 여부
+
+        Returns:
+            (PR 상세, 파일 목록, 커밋 목록). 모두 REST API 응답 형태.
+        """
+        pr_details, commits_data = await self._fetch_details_and_commits(
+            installation_id, repo_owner, repo_name, pull_number, include_commits
+        )
+        files_data = await self.client.get_pr_files(
+            installation_id=installation_id,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pull_number=pull_number,
+            total=pr_details.get("changed_files"),
+        )
+        return pr_details, files_data, commits_data
+
     def _convert_to_pr_data(
         self,
         pr_details: dict,
@@ -113,10 +285,12 @@ class PRDataCollector:
         # CommitInfo 목록 변환
         commits = [self._convert_to_commit_info(c) for c in commits_data]
 
-        # 통계 계산
-        total_additions = sum(f.additions for f in files)
-        total_deletions = sum(f.deletions for f in files)
+        # 통계 계산 (파일 목록이 API 상한에서 잘렸을 수 있으므로 PR 상세의 값을 우선 사용)
+        total_additions = pr_details.get("additions", sum(f.additions for f in files))
+        total_deletions = pr_details.get("deletions", sum(f.deletions for f in files))
         total_changes = sum(f.changes for f in files)
+        if "additions" in pr_details and "deletions" in pr_details:
+            total_changes = total_additions + total_deletions
 
         return PRData(
             pr_number=pr_details["number"],
@@ -135,8 +309,8 @@ class PRDataCollector:
             total_additions=total_additions,
             total_deletions=total_deletions,
             total_changes=total_changes,
-            changed_files_count=len(files),
-            commits_count=len(commits),
+            changed_files_count=pr_details.get("changed_files", len(files)),
+            commits_count=pr_details.get("commits", len(commits)),
             html_url=pr_details.get("html_url"),
             diff_url=pr_details.get("diff_url")
         )
@@ -158,7 +332,9 @@ class PRDataCollector:
             changes=file_data.get("changes", 0),
             patch=file_data.get("patch"),
             blob_url=file_data.get("blob_url"),
-            previous_filename=file_data.get("previous_filename")
+            previous_filename=file_data.get("previous_filename"),
+            is_binary=file_data.get("is_binary", False),
+            patch_truncated=file_data.get("patch_truncated", False),
         )
 
     def _convert_to_commit_info(self, commit_data: dict) -> CommitInfo:
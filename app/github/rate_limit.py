@@ -0,0 +1,173 @@
+"""GitHub API rate limit 추적과 installation별 적응형 스로틀링.
+
+응답의 ``X-RateLimit-*`` 헤더로 installation별 남은 예산을 추적하고,
+- 남은 비율이 ``throttle_ratio`` 아래로 내려가면 남은 요청을 reset 시각까지 고르게 나눠 보내고 (토큰 버킷),
+- 429 / rate limit 403(2차 한도 포함)을 받으면 ``Retry-After`` 또는 reset 시각까지 지터를 더해 기다리며,
+- 저우선순위 요청(컨텍스트 파일 조회 등)은 예산이 ``low_priority_reserve_ratio`` 아래거나 대기 중이면
+  보내지 않고 ``RateLimitBudgetExceeded``를 던져 가장 먼저 포기하게 한다.
+"""
+import asyncio
+import random
+import time
+
+import httpx
+from loguru import logger
+
+from app import metrics
+from app.config import settings
+
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+# installation 토큰이 아닌 App JWT로 보내는 요청의 예산 키
+APP_BUDGET_KEY = "app"
+# 헤더 없이 받은 2차 rate limit 응답의 기본 대기 시간 (시도마다 2배)
+SECONDARY_LIMIT_BASE_SECONDS = 60
+
+
+class RateLimitBudgetExceeded(Exception):
+    """rate limit 예산이 부족해 저우선순위 요청을 보내지 않았을 때 발생한다."""
+
+
+class _Budget:
+    """installation 하나의 rate limit 상태.
+
+    Attributes:
+        limit: 시간당 요청 한도 (응답 헤더를 받기 전에는 None).
+        remaining: 남은 요청 수 (응답 헤더를 받기 전에는 None).
+        reset_at: 한도가 초기화되는 시각 (epoch 초).
+        blocked_until: Retry-After/한도 소진으로 요청을 보내지 않을 시각 (epoch 초).
+        next_slot: 스로틀링 중 다음 요청을 보낼 수 있는 시각 (epoch 초).
+    """
+
+    def __init__(self):
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.next_slot = 0.0
+
+    def remaining_ratio(self) -> float | None:
+        if not self.limit or self.remaining is None:
+            return None
+        if time.time() >= self.reset_at:
+            return 1.0
+        return self.remaining / self.limit
+
+
+class GitHubRateLimiter:
+    """installation별 GitHub API 예산을 추적하고 요청 속도를 조절한다."""
+
+    def __init__(
+        self,
+        throttle_ratio: float,
+        low_priority_reserve_ratio: float,
+        max_wait_seconds: float,
+    ):
+        self.throttle_ratio = throttle_ratio
+        self.low_priority_reserve_ratio = low_priority_reserve_ratio
+        self.max_wait_seconds = max_wait_seconds
+        self._budgets: dict[str, _Budget] = {}
+
+    def _budget(self, key: str) -> _Budget:
+        budget = self._budgets.get(key)
+        if budget is None:
+            budget = self._budgets[key] = _Budget()
+        return budget
+
+    async def acquire(self, key: str, priority: str = PRIORITY_NORMAL) -> None:
+        """요청을 보내기 전에 호출한다. 필요하면 보낼 수 있을 때까지 기다린다.
+
+        Args:
+            key: 예산 키 (installation ID 또는 ``APP_BUDGET_KEY``).
+            priority: ``PRIORITY_NORMAL`` 또는 ``PRIORITY_LOW``.
+
+        Raises:
+            RateLimitBudgetExceeded: 저우선순위 요청인데 예산이 부족하거나 대기 중인 경우.
+        """
+        budget = self._budget(key)
+        now = time.time()
+        ratio = budget.remaining_ratio()
+
+        if priority == PRIORITY_LOW and (
+            budget.blocked_until > now
+            or (ratio is not None and ratio < self.low_priority_reserve_ratio)
+        ):
+            metrics.inc("github_requests_shed_total", installation=key)
+            raise RateLimitBudgetExceeded(f"GitHub rate limit 예산 부족 (installation={key}, remaining={budget.remaining})")
+
+        wait = max(0.0, budget.blocked_until - now)
+        if ratio is not None and ratio < self.throttle_ratio and budget.remaining:
+            # 남은 요청을 reset 시각까지 고르게 분배 (다음 슬롯을 예약하므로 동시 호출도 순서대로 퍼진다)
+            interval = max(0.0, budget.reset_at - now) / budget.remaining
+            slot = max(now + wait, budget.next_slot)
+            budget.next_slot = slot + interval
+            wait = slot - now
+
+        wait = min(wait, self.max_wait_seconds)
+        if wait > 0:
+            metrics.observe("github_throttle_wait_seconds", wait)
+            logger.debug(f"GitHub rate limit 스로틀: installation {key} {wait:.2f}초 대기")
+            await asyncio.sleep(wait)
+
+    def update(self, key: str, response: httpx.Response) -> None:
+        """응답의 ``X-RateLimit-*`` 헤더로 예산을 갱신하고 지표로 노출한다.
+
+        Args:
+            key: 예산 키.
+            response: GitHub API 응답.
+        """
+        remaining = response.headers.get("x-ratelimit-remaining")
+        if remaining is None:
+            return
+        budget = self._budget(key)
+        try:
+            budget.remaining = int(remaining)
+            budget.limit = int(response.headers.get("x-ratelimit-limit", budget.limit or 0)) or None
+            budget.reset_at = float(response.headers.get("x-ratelimit-reset", budget.reset_at))
+        except ValueError:
+            return
+        metrics.set_gauge("github_rate_limit_remaining", budget.remaining, installation=key)
+
+    def backoff(self, key: str, response: httpx.Response, attempt: int) -> float | None:
+        """rate limit 응답이면 지터를 더한 대기 시간을 정하고 그동안 해당 예산을 막는다.
+
+        Args:
+            key: 예산 키.
+            response: GitHub API 응답.
+            attempt: 지금까지 재시도한 횟수 (0부터).
+
+        Returns:
+            재시도 전 대기 시간 (초). rate limit 응답이 아니면 None.
+        """
+        if response.status_code not in (httpx.codes.FORBIDDEN, httpx.codes.TOO_MANY_REQUESTS):
+            return None
+
+        retry_after = response.headers.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            wait = float(retry_after)
+        elif response.headers.get("x-ratelimit-remaining") == "0":
+            wait = float(response.headers.get("x-ratelimit-reset", time.time())) - time.time()
+        elif response.status_code == httpx.codes.TOO_MANY_REQUESTS or "rate limit" in response.text.lower():
+            wait = SECONDARY_LIMIT_BASE_SECONDS * 2 ** attempt
+        else:
+            # 권한 부족 등 rate limit과 무관한 403
+            return None
+
+        wait = min(max(wait, 1.0), self.max_wait_seconds)
+        wait += random.uniform(0, 1 + wait * 0.1)
+        budget = self._budget(key)
+        budget.blocked_until = max(budget.blocked_until, time.time() + wait)
+
+        metrics.inc("github_rate_limited_total", installation=key)
+        logger.warning(
+            f"🚦 GitHub rate limit ({response.status_code}) installation {key}: "
+            f"{wait:.1f}초 후 재시도 (attempt={attempt + 1})"
+        )
+        return wait
+
+
+rate_limiter = GitHubRateLimiter(
+    throttle_ratio=settings.github_rate_limit_throttle_ratio,
+    low_priority_reserve_ratio=settings.github_rate_limit_low_priority_reserve_ratio,
+    max_wait_seconds=settings.github_rate_limit_max_wait_seconds,
+)
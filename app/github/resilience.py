@@ -0,0 +1,153 @@
+"""GitHub API 일시적 오류 재시도 정책과 호스트별 circuit breaker.
+
+- 502/503/504 응답과 연결 오류는 일시적 오류로 보고, 재시도해도 안전한 요청(GET 등 조회 메서드와
+  ``retry_safe``로 표시한 요청)만 지수 backoff + full jitter로 다시 보낸다. 요청이 서버에 닿지
+  않은 것이 확실한 연결 실패(``httpx.ConnectError`` 등)는 메서드와 관계없이 재시도한다.
+- 호스트별로 연속 실패가 ``failure_threshold``번 쌓이면 circuit을 열어 ``reset_seconds`` 동안
+  요청을 보내지 않고 ``CircuitOpenError``를 던진다. 그 뒤 시험 요청 하나가 성공하면 다시 닫는다.
+"""
+import random
+import time
+
+import httpx
+from loguru import logger
+
+from app import metrics
+from app.config import settings
+
+# 재시도해도 서버 상태가 바뀌지 않는 메서드. PUT/DELETE는 HTTP상 멱등이지만 GitHub의 PR 병합처럼
+# 첫 시도가 서버에서 성공하고 응답만 잃으면 재시도가 405/404로 실패해, 성공한 작업을 실패로 보고하게 된다
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# 일시적 서버 오류로 보고 재시도하는 상태 코드
+TRANSIENT_STATUS_CODES = frozenset({
+    httpx.codes.BAD_GATEWAY,
+    httpx.codes.SERVICE_UNAVAILABLE,
+    httpx.codes.GATEWAY_TIMEOUT,
+})
+# 요청이 서버에 전달되기 전에 실패한 것이 확실한 전송 오류
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(Exception):
+    """호스트의 circuit이 열려 있어 요청을 보내지 않았을 때 발생한다."""
+
+
+def is_transient_response(response: httpx.Response) -> bool:
+    """재시도할 만한 일시적 서버 오류 응답인지 확인한다."""
+    return response.status_code in TRANSIENT_STATUS_CODES
+
+
+def can_retry(method: str, retry_safe: bool, error: httpx.TransportError | None = None) -> bool:
+    """일시적 오류를 받은 요청을 다시 보내도 안전한지 판단한다.
+
+    Args:
+        method: HTTP 메서드.
+        retry_safe: 조회 메서드가 아니지만 재시도해도 안전하다고 호출자가 표시한 요청인지 여부.
+        error: 응답 대신 받은 전송 오류 (응답을 받았으면 None).
+
+    Returns:
+        재시도해도 되면 True.
+    """
+    if retry_safe or method.upper() in SAFE_METHODS:
+        return True
+    return isinstance(error, _NOT_SENT_ERRORS)
+
+
+def retry_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """``attempt``번째 재시도 전 대기 시간을 full jitter로 정한다 (0 ~ base·2^attempt, 상한 max)."""
+    return random.uniform(0, min(max_seconds, base_seconds * 2 ** attempt))
+
+
+class _Circuit:
+    """호스트 하나의 circuit 상태.
+
+    Attributes:
+        failures: 연속 실패 횟수.
+        opened_at: circuit이 열린(또는 마지막 시험 요청을 보낸) 시각 (monotonic 초, 닫혀 있으면 None).
+    """
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: float | None = None
+
+
+class CircuitBreaker:
+    """호스트별 연속 실패 횟수로 요청 차단 여부를 정한다."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._circuits: dict[str, _Circuit] = {}
+
+    def _circuit(self, host: str) -> _Circuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _Circuit()
+        return circuit
+
+    def is_open(self, host: str) -> bool:
+        """호스트의 circuit이 열려 있는지 (시험 요청 대기 포함) 확인한다."""
+        circuit = self._circuits.get(host)
+        return circuit is not None and circuit.opened_at is not None
+
+    def before_request(self, host: str) -> None:
+        """요청을 보내기 전에 호출한다. circuit이 열려 있으면 요청을 막는다.
+
+        열린 지 ``reset_seconds``가 지났으면 시험 요청 하나만 통과시키고 대기 시간을 다시 센다.
+        시험 요청의 결과가 나오지 않아도(취소 등) 다음 ``reset_seconds`` 뒤에는 다시 시험한다.
+
+        Args:
+            host: 요청 대상 호스트.
+
+        Raises:
+            CircuitOpenError: circuit이 열려 있는 경우.
+        """
+        if self.failure_threshold <= 0:
+            return
+        circuit = self._circuit(host)
+        if circuit.opened_at is None:
+            return
+        now = time.monotonic()
+        elapsed = now - circuit.opened_at
+        if elapsed >= self.reset_seconds:
+            circuit.opened_at = now
+            logger.info(f"🔌 GitHub circuit 시험 요청 ({host})")
+            return
+        metrics.inc("github_circuit_rejected_total", host=host)
+        raise CircuitOpenError(
+            f"GitHub circuit open ({host}): 연속 {circuit.failures}회 실패, "
+            f"{max(0.0, self.reset_seconds - elapsed):.0f}초 후 재시도"
+        )
+
+    def record_success(self, host: str) -> None:
+        """요청이 성공(일시적 오류가 아닌 응답)하면 호출한다. 열린 circuit을 닫는다."""
+        circuit = self._circuits.get(host)
+        if circuit is None or (circuit.failures == 0 and circuit.opened_at is None):
+            return
+        if circuit.opened_at is not None:
+            logger.info(f"🔌 GitHub circuit 닫힘 ({host})")
+            metrics.set_gauge("github_circuit_open", 0, host=host)
+        circuit.failures = 0
+        circuit.opened_at = None
+
+    def record_failure(self, host: str) -> None:
+        """일시적 오류를 받으면 호출한다. 연속 실패가 한도에 닿으면 circuit을 연다.
+
+        이미 열린 상태(시험 요청 실패)면 대기 시간을 처음부터 다시 센다.
+        """
+        if self.failure_threshold <= 0:
+            return
+        circuit = self._circuit(host)
+        circuit.failures += 1
+        if circuit.opened_at is not None:
+            circuit.opened_at = time.monotonic()
+        elif circuit.failures >= self.failure_threshold:
+            circuit.opened_at = time.monotonic()
+            logger.warning(f"🔌 GitHub circuit 열림 ({host}): 연속 {circuit.failures}회 실패")
+            metrics.set_gauge("github_circuit_open", 1, host=host)
+
+
+circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.github_circuit_failure_threshold,
+    reset_seconds=settings.github_circuit_reset_seconds,
+)
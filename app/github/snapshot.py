@@ -0,0 +1,378 @@
+"""head_sha별 저장소 스냅샷 디스크 캐시.
+
+리뷰 컨텍스트에 파일을 여러 개 읽어야 할 때 ``contents`` API를 파일마다 호출하지 않도록,
+커밋의 tarball을 한 번 내려받아 파일 내용을 하나의 pack 파일에 이어 붙이고 경로 → (오프셋, 길이)
+인덱스를 함께 저장한다. 읽을 때는 pack 파일을 mmap으로 열어 필요한 구간만 읽는다.
+
+같은 PR에 새 커밋이 푸시되면 이전 스냅샷에서 compare API로 바뀐 파일만 blob으로 받아
+새 스냅샷을 만든다 (delta). 디스크 사용량이 ``max_bytes``를 넘으면 가장 오래 사용하지 않은
+스냅샷부터 삭제한다.
+
+디스크 구조::
+
+    <root>/<owner>/<repo>/<head_sha>.pack   파일 내용을 이어 붙인 것
+    <root>/<owner>/<repo>/<head_sha>.json   {"files": {경로: [오프셋, 길이, blob SHA]}}
+"""
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import tarfile
+import tempfile
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+
+from app import metrics
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.github.client import GitHubClient
+
+# compare API가 한 번에 돌려주는 최대 파일 수 (이 이상이면 목록이 잘렸을 수 있음)
+COMPARE_FILES_LIMIT = 300
+# 프로세스 안에서 mmap을 열어 두는 최대 스냅샷 수
+OPEN_SNAPSHOTS_LIMIT = 8
+
+
+def git_blob_sha(content: bytes) -> str:
+    """git이 blob에 부여하는 SHA-1을 계산한다."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+class RepositorySnapshot:
+    """한 커밋 시점의 저장소 파일 내용. pack 파일을 mmap으로 열어 경로별로 읽는다.
+
+    mmap은 파일 디스크립터를 따로 복제해 두므로 pack 파일은 연 직후 닫는다. 캐시에서 밀려나거나
+    디스크에서 삭제되어도 mmap은 닫지 않으며, 스냅샷을 들고 있는 마지막 사용자가 놓을 때 해제된다.
+
+    Attributes:
+        head_sha: 스냅샷의 커밋 SHA.
+        files: 경로 → (오프셋, 길이, blob SHA).
+    """
+
+    def __init__(self, head_sha: str, pack_path: Path, files: dict[str, tuple[int, int, str]]):
+        self.head_sha = head_sha
+        self.files = files
+        with pack_path.open("rb") as pack:
+            size = os.fstat(pack.fileno()).st_size
+            self._mmap = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.files
+
+    def read_bytes(self, path: str) -> bytes | None:
+        """파일 내용을 읽는다.
+
+        Args:
+            path: 저장소 루트 기준 경로.
+
+        Returns:
+            파일 내용. 스냅샷에 없는 경로(또는 크기 제한으로 제외된 파일)면 None.
+        """
+        entry = self.files.get(path)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        if length == 0:
+            return b""
+        return self._mmap[offset: offset + length]
+
+    def read_text(self, path: str) -> str | None:
+        """파일 내용을 UTF-8 문자열로 읽는다. 스냅샷에 없는 경로면 None."""
+        content = self.read_bytes(path)
+        return content.decode("utf-8", errors="replace") if content is not None else None
+
+    def close(self) -> None:
+        """mmap을 닫는다. 다른 곳과 공유하지 않는 스냅샷에만 호출한다."""
+        if self._mmap is not None:
+            self._mmap.close()
+
+
+class SnapshotCache:
+    """저장소 스냅샷을 head_sha별로 디스크에 보관하는 캐시.
+
+    ``root_dir``가 비어 있으면 비활성화되며 ``get``은 None을 반환한다.
+    """
+
+    def __init__(
+        self,
+        root_dir: str | Path | None,
+        max_bytes: int,
+        max_file_bytes: int,
+        max_delta_files: int,
+    ):
+        self.root_dir = Path(root_dir) if root_dir else None
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.max_delta_files = max_delta_files
+        self._open: OrderedDict[Path, RepositorySnapshot] = OrderedDict()
+        # 스냅샷을 만드는 동안만 잠금이 살아 있도록 약한 참조로 보관한다
+        self._locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    @property
+    def enabled(self) -> bool:
+        return self.root_dir is not None
+
+    def _repo_dir(self, repo_owner: str, repo_name: str) -> Path:
+        return self.root_dir / repo_owner / repo_name
+
+    async def get(
+        self,
+        client: "GitHubClient",
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        head_sha: str,
+    ) -> RepositorySnapshot | None:
+        """head_sha의 스냅샷을 반환한다. 없으면 이전 스냅샷의 delta 또는 tarball로 만든다.
+
+        같은 스냅샷을 동시에 요청하면 한 번만 만든다.
+
+        Args:
+            client: 스냅샷을 만들 때 사용할 GitHub 클라이언트.
+            installation_id: GitHub App의 Installation ID.
+            repo_owner: 저장소 소유자.
+            repo_name: 저장소 이름.
+            head_sha: 커밋 SHA.
+
+        Returns:
+            스냅샷. 캐시가 비활성화되어 있으면 None.
+
+        Raises:
+            httpx.HTTPStatusError: 스냅샷을 만드는 중 GitHub API 호출이 실패한 경우
+        """
+        if not self.enabled:
+            return None
+        repo_dir = self._repo_dir(repo_owner, repo_name)
+        index_path = repo_dir / f"{head_sha}.json"
+
+        lock = self._locks.setdefault(index_path, asyncio.Lock())
+        async with lock:
+            snapshot = self._open.get(index_path)
+            if snapshot is not None:
+                self._open.move_to_end(index_path)
+                await asyncio.to_thread(os.utime, index_path)
+                metrics.inc("github_snapshot_requests_total", result="hit")
+                return snapshot
+
+            snapshot = await asyncio.to_thread(self._load, index_path)
+            if snapshot is not None:
+                metrics.inc("github_snapshot_requests_total", result="hit")
+            else:
+                snapshot = await self._build(client, installation_id, repo_owner, repo_name, head_sha)
+                await asyncio.to_thread(self._prune, index_path)
+            self._remember(index_path, snapshot)
+        return snapshot
+
+    def _remember(self, index_path: Path, snapshot: RepositorySnapshot) -> None:
+        # 밀려난 스냅샷은 아직 읽는 쪽이 있을 수 있으므로 닫지 않고 참조만 놓는다
+        self._open[index_path] = snapshot
+        while len(self._open) > OPEN_SNAPSHOTS_LIMIT:
+            self._open.popitem(last=False)
+
+    def _load(self, index_path: Path) -> RepositorySnapshot | None:
+        """디스크의 스냅샷을 연다. 인덱스가 없거나 깨졌으면 None."""
+        try:
+            data = json.loads(index_path.read_text())
+            os.utime(index_path)
+            files = {path: tuple(entry) for path, entry in data["files"].items()}
+            return RepositorySnapshot(data["head_sha"], index_path.with_suffix(".pack"), files)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    async def _build(
+        self,
+        client: "GitHubClient",
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        head_sha: str,
+    ) -> RepositorySnapshot:
+        """이전 스냅샷이 있으면 delta로, 없거나 delta가 불가능하면 tarball로 스냅샷을 만든다."""
+        repo_dir = self._repo_dir(repo_owner, repo_name)
+        await asyncio.to_thread(repo_dir.mkdir, parents=True, exist_ok=True)
+
+        base_index = await asyncio.to_thread(self._latest_index, repo_dir)
+        if base_index is not None:
+            snapshot = await self._build_from_delta(
+                client, installation_id, repo_owner, repo_name, head_sha, base_index
+            )
+            if snapshot is not None:
+                metrics.inc("github_snapshot_requests_total", result="delta")
+                return snapshot
+
+        with tempfile.TemporaryDirectory(dir=repo_dir) as tmp_dir:
+            tarball_path = Path(tmp_dir) / "snapshot.tar.gz"
+            await client.download_tarball(installation_id, repo_owner, repo_name, head_sha, tarball_path)
+            snapshot = await asyncio.to_thread(self._write_from_tarball, repo_dir, head_sha, tarball_path)
+        metrics.inc("github_snapshot_requests_total", result="tarball")
+        logger.info(f"📦 {repo_owner}/{repo_name}@{head_sha[:7]} 스냅샷 생성 (tarball, 파일 {len(snapshot.files)}개)")
+        return snapshot
+
+    async def _build_from_delta(
+        self,
+        client: "GitHubClient",
+        installation_id: str,
+        repo_owner: str,
+        repo_name: str,
+        head_sha: str,
+        base_index: Path,
+    ) -> RepositorySnapshot | None:
+        """이전 스냅샷에 compare API의 변경 파일만 반영해 새 스냅샷을 만든다.
+
+        head가 base의 후손(fast-forward)이 아니거나 변경 파일이 ``max_delta_files``를 넘으면
+        delta를 쓰지 않는다 (compare의 파일 목록이 base → head 변경과 다를 수 있으므로).
+
+        Returns:
+            새 스냅샷. delta를 쓸 수 없으면 None.
+        """
+        base = await asyncio.to_thread(self._load, base_index)
+        if base is None:
+            return None
+        try:
+            comparison = await client.compare_commits(
+                installation_id, repo_owner, repo_name, base.head_sha, head_sha
+            )
+            changed = comparison.get("files") or []
+            if (
+                comparison.get("status") not in ("ahead", "identical")
+                or len(changed) >= min(self.max_delta_files, COMPARE_FILES_LIMIT)
+            ):
+                return None
+
+            semaphore = asyncio.Semaphore(settings.github_page_concurrency)
+
+            async def fetch(file: dict) -> tuple[str, bytes]:
+                async with semaphore:
+                    return file["filename"], await client.get_blob(
+                        installation_id, repo_owner, repo_name, file["sha"]
+                    )
+
+            # copied는 원본 파일이 그대로 남으므로 renamed만 이전 경로를 지운다
+            removed = {
+                f["previous_filename"] for f in changed if f["status"] == "renamed" and f.get("previous_filename")
+            }
+            removed |= {f["filename"] for f in changed if f["status"] == "removed"}
+            updated = dict(await asyncio.gather(*(fetch(f) for f in changed if f["status"] != "removed")))
+            snapshot = await asyncio.to_thread(
+                self._write_from_delta, base_index.parent, head_sha, base, removed, updated
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"스냅샷 delta 생성 실패, tarball로 대신 만듭니다: {e}")
+            return None
+        finally:
+            base.close()
+        logger.info(
+            f"📦 {repo_owner}/{repo_name}@{head_sha[:7]} 스냅샷 생성 "
+            f"(delta from {base.head_sha[:7]}, 변경 파일 {len(changed)}개)"
+        )
+        return snapshot
+
+    @staticmethod
+    def _latest_index(repo_dir: Path) -> Path | None:
+        indexes = list(repo_dir.glob("*.json"))
+        return max(indexes, key=lambda p: p.stat().st_mtime) if indexes else None
+
+    def _write_from_tarball(self, repo_dir: Path, head_sha: str, tarball_path: Path) -> RepositorySnapshot:
+        """tarball의 일반 파일을 pack 파일에 이어 붙이고 인덱스를 쓴다.
+
+        tarball 항목은 ``<owner>-<repo>-<sha>/`` 디렉터리 아래에 있으므로 첫 경로 요소를 떼어낸다.
+        ``max_file_bytes``보다 큰 파일은 제외한다.
+        """
+        def entries():
+            with tarfile.open(tarball_path, "r:gz") as tar:
+                for member in tar:
+                    _, _, path = member.name.partition("/")
+                    if not member.isfile() or not path or member.size > self.max_file_bytes:
+                        continue
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        yield path, extracted.read()
+
+        return self._write_snapshot(repo_dir, head_sha, entries())
+
+    def _write_from_delta(
+        self,
+        repo_dir: Path,
+        head_sha: str,
+        base: RepositorySnapshot,
+        removed: set[str],
+        updated: dict[str, bytes],
+    ) -> RepositorySnapshot:
+        """이전 스냅샷의 파일에 변경분을 덮어써 새 스냅샷을 쓴다."""
+        def entries():
+            for path in base.files:
+                if path not in removed and path not in updated:
+                    yield path, base.read_bytes(path)
+            for path, content in updated.items():
+                if len(content) <= self.max_file_bytes:
+                    yield path, content
+
+        return self._write_snapshot(repo_dir, head_sha, entries())
+
+    def _write_snapshot(self, repo_dir: Path, head_sha: str, entries) -> RepositorySnapshot:
+        """(경로, 내용) 목록을 pack 파일과 인덱스로 쓴다.
+
+        임시 파일에 쓴 뒤 pack → 인덱스 순서로 교체하므로, 인덱스가 있으면 pack도 완성되어 있다.
+        """
+        pack_path = repo_dir / f"{head_sha}.pack"
+        index_path = repo_dir / f"{head_sha}.json"
+        tmp_suffix = f".{os.getpid()}.tmp"
+        files: dict[str, tuple[int, int, str]] = {}
+        offset = 0
+        with open(pack_path.with_suffix(tmp_suffix), "wb") as pack:
+            for path, content in entries:
+                pack.write(content)
+                files[path] = (offset, len(content), git_blob_sha(content))
+                offset += len(content)
+        os.replace(pack_path.with_suffix(tmp_suffix), pack_path)
+
+        index_tmp = index_path.with_suffix(f".json{tmp_suffix}")
+        index_tmp.write_text(json.dumps({"head_sha": head_sha, "files": files}))
+        os.replace(index_tmp, index_path)
+        return RepositorySnapshot(head_sha, pack_path, files)
+
+    def _prune(self, keep: Path) -> None:
+        """디스크 사용량이 ``max_bytes``를 넘으면 오래 사용하지 않은 스냅샷부터 삭제한다.
+
+        파일만 삭제하고 열린 mmap은 닫지 않는다. 다른 리뷰가 아직 읽는 중일 수 있으며, 삭제된
+        파일의 매핑은 마지막 사용자가 스냅샷을 놓을 때 해제된다.
+
+        Args:
+            keep: 삭제하지 않을 인덱스 경로 (방금 만든 스냅샷).
+        """
+        if self.max_bytes <= 0:
+            return
+        try:
+            snapshots = []
+            for index_path in self.root_dir.glob("*/*/*.json"):
+                pack_path = index_path.with_suffix(".pack")
+                size = index_path.stat().st_size + (pack_path.stat().st_size if pack_path.exists() else 0)
+                snapshots.append((index_path.stat().st_mtime, index_path, size))
+            total = sum(size for _, _, size in snapshots)
+            for _, index_path, size in sorted(snapshots):
+                if total <= self.max_bytes:
+                    break
+                if index_path == keep:
+                    continue
+                index_path.unlink(missing_ok=True)
+                index_path.with_suffix(".pack").unlink(missing_ok=True)
+                self._open.pop(index_path, None)
+                total -= size
+                logger.debug(f"저장소 스냅샷 삭제: {index_path}")
+        except OSError as e:
+            logger.warning(f"저장소 스냅샷 정리 실패: {e}")
+
+
+snapshot_cache = SnapshotCache(
+    root_dir=settings.github_snapshot_dir or None,
+    max_bytes=settings.github_snapshot_max_bytes,
+    max_file_bytes=settings.github_snapshot_max_file_bytes,
+    max_delta_files=settings.github_snapshot_max_delta_files,
+)
@@ -0,0 +1,120 @@
+"""프로세스 내 운영 지표 (카운터/게이지/관측값).
+
+외부 의존성 없이 간단한 지표를 누적하고 ``GET /metrics``로 JSON 스냅샷을 노출한다.
+지표는 프로세스 로컬이므로 여러 파드를 띄우면 파드별로 따로 집계된다.
+"""
+import threading
+
+_lock = threading.Lock()
+_counters: dict[str, dict[tuple[tuple[str, str], ...], float]] = {}
+_gauges: dict[str, dict[tuple[tuple[str, str], ...], float]] = {}
+_observations: dict[str, dict[tuple[tuple[str, str], ...], dict[str, float]]] = {}
+
+
+def _label_key(labels: dict[str, object]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name: str, value: float = 1, **labels: object) -> None:
+    """카운터를 증가시킨다.
+
+    Args:
+        name: 지표 이름 (예: ``webhook_events_dropped_total``).
+        value: 증가량.
+        **labels: 지표 라벨.
+    """
+    key = _label_key(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0) + value
+
+
+def set_gauge(name: str, value: float, **labels: object) -> None:
+    """게이지 값을 설정한다.
+
+    Args:
+        name: 지표 이름.
+        value: 현재 값.
+        **labels: 지표 라벨.
+    """
+    with _lock:
+        _gauges.setdefault(name, {})[_label_key(labels)] = value
+
+
+def add_gauge(name: str, delta: float, **labels: object) -> None:
+    """게이지 값을 ``delta``만큼 더한다 (음수면 감소).
+
+    Args:
+        name: 지표 이름.
+        delta: 변화량.
+        **labels: 지표 라벨.
+    """
+    key = _label_key(labels)
+    with _lock:
+        series = _gauges.setdefault(name, {})
+        series[key] = series.get(key, 0) + delta
+
+
+def observe(name: str, value: float, **labels: object) -> None:
+    """관측값(지연 시간 등)을 기록한다. 개수/합계/최댓값을 누적한다.
+
+    Args:
+        name: 지표 이름 (예: ``llm_queue_wait_seconds``).
+        value: 관측값.
+        **labels: 지표 라벨.
+    """
+    key = _label_key(labels)
+    with _lock:
+        stats = _observations.setdefault(name, {}).setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+        stats["count"] += 1
+        stats["sum"] += value
+        stats["max"] = max(stats["max"], value)
+
+
+def get_value(name: str, **labels: object) -> float:
+    """카운터 또는 게이지의 현재 값을 반환한다 (없으면 0).
+
+    Args:
+        name: 지표 이름.
+        **labels: 지표 라벨.
+
+    Returns:
+        현재 값.
+    """
+    key = _label_key(labels)
+    with _lock:
+        if name in _counters:
+            return _counters[name].get(key, 0)
+        return _gauges.get(name, {}).get(key, 0)
+
+
+def snapshot() -> dict:
+    """모든 지표의 현재 값을 직렬화 가능한 dict로 반환한다.
+
+    Returns:
+        ``{"counters": ..., "gauges": ..., "observations": ...}`` 형태의 dict.
+        각 지표는 ``[{"labels": {...}, "value": ...}]`` 목록이다.
+    """
+    def series(metrics: dict) -> dict:
+        return {
+            name: [{"labels": dict(key), "value": value} for key, value in values.items()]
+            for name, values in metrics.items()
+        }
+
+    with _lock:
+        return {
+            "counters": series(_counters),
+            "gauges": series(_gauges),
+            "observations": {
+                name: [{"labels": dict(key), **stats} for key, stats in values.items()]
+                for name, values in _observations.items()
+            },
+        }
+
+
+def reset() -> None:
+    """모든 지표를 초기화한다 (테스트용)."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _observations.clear()
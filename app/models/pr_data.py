@@ -30,6 +30,8 @@ class FileChange(BaseModel):
         patch (Optional[str]): 파일의 diff (unified diff 형식).
         blob_url (Optional[str]): 파일 전체 내용 URL.
         previous_filename (Optional[str]): 이름 변경된 경우 이전 파일명.
+        is_binary (bool): 바이너리 파일 여부 (바이너리 파일은 patch가 없다).
+        patch_truncated (bool): patch가 길이 한도에서 잘렸는지 여부 (잘린 뒤의 hunk는 빠져 있다).
     """
 
     filename: str = Field(..., description="파일 경로")
@@ -40,6 +42,8 @@ class FileChange(BaseModel):
     patch: Optional[str] = Field(None, description="파일의 diff (unified diff 형식)")
     blob_url: Optional[str] = Field(None, description="파일 전체 내용 URL")
     previous_filename: Optional[str] = Field(None, description="이름 변경된 경우 이전 파일명")
+    is_binary: bool = Field(False, description="바이너리 파일 여부")
+    patch_truncated: bool = Field(False, description="patch가 길이 한도에서 잘렸는지 여부")
 
     @property
     def is_new_file(self) -> bool:
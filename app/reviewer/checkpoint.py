@@ -0,0 +1,103 @@
+"""
+LanGraph 체크포인터 (Postgres)
+
+리뷰 그래프 실행 상태를 노드 단위로 Postgres에 저장해, 워커가 중간에 재시작되어도
+마지막으로 완료된 노드부터 이어서 실행할 수 있게 합니다.
+``langgraph-checkpoint-postgres``는 선택 의존성이며, 설치되지 않았거나 초기화에
+실패하면 체크포인트 없이 동작합니다.
+"""
+from contextlib import AsyncExitStack
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from loguru import logger
+
+from app.config import settings
+
+_exit_stack: AsyncExitStack | None = None
+_checkpointer: BaseCheckpointSaver | None = None
+
+
+def checkpoint_thread_id(repo_owner: str, repo_name: str, pr_number: int, head_sha: str) -> str:
+    """(저장소, PR, head_sha)로 체크포인트 thread ID를 만듭니다.
+
+    Args:
+        repo_owner: 리포지토리 소유자.
+        repo_name: 리포지토리 이름.
+        pr_number: PR 번호.
+        head_sha: 리뷰 대상 HEAD 커밋 SHA.
+
+    Returns:
+        ``"{owner}/{name}#{pr_number}@{head_sha}"`` 형식의 thread ID.
+    """
+    return f"{repo_owner}/{repo_name}#{pr_number}@{head_sha}"
+
+
+def _psycopg_conn_string(database_url: str) -> str:
+    """SQLAlchemy URL(``postgresql+asyncpg://``)을 psycopg용 URL로 바꿉니다."""
+    scheme, sep, rest = database_url.partition("://")
+    return f"{scheme.split('+', 1)[0]}{sep}{rest}"
+
+
+async def init_checkpointer() -> BaseCheckpointSaver | None:
+    """Postgres 체크포인터를 열고 테이블을 준비합니다. 이미 열려 있으면 그대로 반환합니다.
+
+    Returns:
+        체크포인터 인스턴스. 비활성화됐거나 사용할 수 없으면 None.
+    """
+    global _exit_stack, _checkpointer
+
+    if _checkpointer is not None or not settings.review_checkpointing:
+        return _checkpointer
+
+    try:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+    except ImportError:
+        logger.warning("langgraph-checkpoint-postgres 미설치 — 체크포인트 없이 리뷰를 실행합니다")
+        return None
+
+    stack = AsyncExitStack()
+    try:
+        saver = await stack.enter_async_context(
+            AsyncPostgresSaver.from_conn_string(_psycopg_conn_string(settings.database_url))
+        )
+        await saver.setup()
+    except Exception as e:
+        await stack.aclose()
+        logger.warning(f"체크포인터 초기화 실패 — 체크포인트 없이 리뷰를 실행합니다: {e}")
+        return None
+
+    _exit_stack, _checkpointer = stack, saver
+    logger.info("💾 LanGraph Postgres 체크포인터 준비 완료")
+    return _checkpointer
+
+
+def get_checkpointer() -> BaseCheckpointSaver | None:
+    """``init_checkpointer``로 연 체크포인터를 반환합니다.
+
+    Returns:
+        체크포인터 인스턴스. 초기화되지 않았으면 None.
+    """
+    return _checkpointer
+
+
+async def close_checkpointer() -> None:
+    """체크포인터 연결을 닫습니다."""
+    global _exit_stack, _checkpointer
+
+    if _exit_stack is not None:
+        await _exit_stack.aclose()
+    _exit_stack, _checkpointer = None, None
+
+
+async def clear_checkpoint(thread_id: str) -> None:
+    """리뷰가 끝난 thread의 체크포인트를 삭제합니다.
+
+    Args:
+        thread_id: ``checkpoint_thread_id``로 만든 thread ID.
+    """
+    if _checkpointer is None:
+        return
+    try:
+        await _checkpointer.adelete_thread(thread_id)
+    except Exception as e:
+        logger.warning(f"체크포인트 삭제 실패 ({thread_id}): {e}")
@@ -1,9 +1,18 @@
 """
 LanGraph Review Graph 정의
 """
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
 from loguru import logger
 
+from app.reviewer.checkpoint import get_checkpointer
+from app.reviewer.llm_limiter import llm_share_key
+from app.models import FileChange
+
 from app.reviewer.state import ReviewState
 from app.reviewer.nodes import (
     analyze_pr_intent,
@@ -12,7 +21,10 @@ from app.reviewer.nodes import (
     summarize_review,
     load_repo_skills,
     load_previous_review,
+    collect_pr_files,
+    load_file_patches,
 )
+from app.reviewer.nodes.file_collector import pending_pr_files
 
 MAX_RETRIES = 2  # 최대 review_all_files 실행 횟수 (초기 1회 + 재시도 1회)
 
@@ -70,10 +82,12 @@ def create_review_graph() -> StateGraph:
           ↓
         analyze_intent (PR 의도 분석)
           ↓
+        collect_files (백그라운드로 받던 변경 파일 목록 넘겨받기)
+          ↓
         classify_risk (위험도 분류)
           ↓ (조건부)
         LOW → summarize
-        MEDIUM/HIGH → review_all_files
+        MEDIUM/HIGH → load_patches (patch가 없으면 REST로 받기) → review_all_files
           ↓
         summarize (최종 요약)
           ↓ (조건부)
@@ -91,7 +105,9 @@ def create_review_graph() -> StateGraph:
     workflow.add_node("load_skills", load_repo_skills)
     workflow.add_node("load_previous_review", load_previous_review)
     workflow.add_node("analyze_intent", analyze_pr_intent)
+    workflow.add_node("collect_files", collect_pr_files)
     workflow.add_node("classify_risk", classify_risk)
+    workflow.add_node("load_patches", load_file_patches)
     workflow.add_node("review_all_files", review_all_files)
     workflow.add_node("summarize", summarize_review)
 
@@ -101,18 +117,21 @@ def create_review_graph() -> StateGraph:
     # 순차 엣지
     workflow.add_edge("load_skills", "load_previous_review")
     workflow.add_edge("load_previous_review", "analyze_intent")
-    workflow.add_edge("analyze_intent", "classify_risk")
+    workflow.add_edge("analyze_intent", "collect_files")
+    workflow.add_edge("collect_files", "classify_risk")
 
     # 조건부 엣지 1: 위험도에 따라 파일 리뷰 스킵 여부 결정
     workflow.add_conditional_edges(
         "classify_risk",
         route_by_risk,
         {
-            "review_all_files": "review_all_files",
+            "review_all_files": "load_patches",
             "summarize": "summarize",
         }
     )
 
+    workflow.add_edge("load_patches", "review_all_files")
+
     workflow.add_edge("review_all_files", "summarize")
 
     # 조건부 엣지 2: summarize 후 재시도 여부 결정
@@ -130,17 +149,29 @@ def create_review_graph() -> StateGraph:
     return workflow
 
 
-# 그래프 싱글톤 인스턴스
+# 그래프 싱글톤 인스턴스 (체크포인터별)
 _compiled_graph = None
+_compiled_checkpointed_graph = None
+_compiled_checkpointer = None
 
 
-def get_review_graph():
+def get_review_graph(checkpointer: BaseCheckpointSaver | None = None):
     """컴파일된 리뷰 그래프를 반환합니다 (싱글톤).
 
+    Args:
+        checkpointer: 노드 단위 실행 상태를 저장할 체크포인터. None이면 체크포인트 없이 컴파일합니다.
+
     Returns:
         컴파일된 StateGraph 인스턴스.
     """
-    global _compiled_graph
+    global _compiled_graph, _compiled_checkpointed_graph, _compiled_checkpointer
+
+    if checkpointer is not None:
+        if _compiled_checkpointed_graph is None or _compiled_checkpointer is not checkpointer:
+            logger.info("📦 리뷰 그래프 컴파일 중 (체크포인트 사용)...")
+            _compiled_checkpointed_graph = create_review_graph().compile(checkpointer=checkpointer)
+            _compiled_checkpointer = checkpointer
+        return _compiled_checkpointed_graph
 
     if _compiled_graph is None:
         logger.info("📦 리뷰 그래프 컴파일 중...")
@@ -156,15 +187,30 @@ async def run_review(
     pr_data,
     installation_id: str,
     repo_owner: str,
-    repo_name: str
+    repo_name: str,
+    on_risk_assessed: Callable[[dict], Awaitable[None]] | None = None,
+    callbacks: list[BaseCallbackHandler] | None = None,
+    thread_id: str | None = None,
+    pending_files: asyncio.Task[list[FileChange]] | None = None,
 ) -> dict:
     """PR 리뷰 그래프를 실행합니다.
 
+    ``thread_id``가 주어지고 체크포인터가 준비돼 있으면 노드가 끝날 때마다 상태를 저장하고,
+    같은 thread에 미완료 실행이 남아 있으면 마지막으로 완료된 노드 다음부터 이어서 실행합니다.
+    이미 완료된 실행이 남아 있으면(결과 게시 전 중단) 그래프를 다시 돌리지 않고 저장된 결과를 반환합니다.
+
     Args:
         pr_data: PRData 객체.
         installation_id: GitHub App Installation ID.
         repo_owner: 리포지토리 소유자.
         repo_name: 리포지토리 이름.
+        on_risk_assessed: ``classify_risk`` 노드가 끝난 직후 ``risk_assessment``로 호출되는 훅.
+            파일 리뷰가 시작되기 전에 스케줄링 우선순위를 조정하는 데 사용합니다.
+        callbacks: 그래프 내 모든 LLM 호출에 전달할 LangChain 콜백 (토큰 집계 등).
+        thread_id: 체크포인트 thread ID (``checkpoint_thread_id`` 참고).
+        pending_files: ``pr_data``의 변경 파일 목록을 수집 중인 태스크. 주면 ``collect_files`` 노드가
+            결과를 기다려 파일 목록을 채우므로, 앞 단계 노드가 파일 수집과 겹쳐 실행됩니다.
+            그래프가 결과를 쓰지 않고 끝나면 취소합니다.
 
     Returns:
         그래프 실행 완료 후의 최종 ReviewState.
@@ -181,9 +227,45 @@ async def run_review(
         repo_name=repo_name
     )
 
-    # 그래프 실행
-    graph = get_review_graph()
-    result = await graph.ainvoke(initial_state)
+    # LLM 호출 한도는 리뷰 단위로 공정 분배하고, 파일 수집 태스크는 collect_files 노드에 넘긴다
+    share_token = llm_share_key.set(thread_id or f"{repo_owner}/{repo_name}#{pr_data.pr_number}")
+    files_token = pending_pr_files.set(pending_files)
+    try:
+        checkpointer = get_checkpointer() if thread_id else None
+        graph = get_review_graph(checkpointer)
+        config: dict = {"callbacks": callbacks or []}
+        graph_input: dict | None = initial_state
+        result = initial_state
+
+        if checkpointer is not None:
+            config["configurable"] = {"thread_id": thread_id}
+            snapshot = await graph.aget_state(config)
+            if snapshot.values:
+                if not snapshot.next:
+                    logger.info(f"♻️  완료된 체크포인트 결과 재사용: {thread_id}")
+                    return snapshot.values
+                logger.info(f"♻️  체크포인트에서 재개: {thread_id} → {list(snapshot.next)}")
+                graph_input = None
+                result = snapshot.values
+
+        async for mode, chunk in graph.astream(
+            graph_input,
+            stream_mode=["updates", "values"],
+            config=config,
+        ):
+            if mode == "values":
+                result = chunk
+            elif on_risk_assessed is not None and "classify_risk" in chunk:
+                risk_assessment = (chunk["classify_risk"] or {}).get("risk_assessment") or {}
+                try:
+                    await on_risk_assessed(risk_assessment)
+                except Exception as e:
+                    logger.warning(f"위험도 훅 실행 실패: {e}")
+    finally:
+        pending_pr_files.reset(files_token)
+        llm_share_key.reset(share_token)
+        if pending_files is not None and not pending_files.done():
+            pending_files.cancel()
 
     logger.info("✅ PR 리뷰 완료")
 
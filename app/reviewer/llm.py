@@ -2,7 +2,13 @@
 LLM Provider Factory
 
 Anthropic Claude 또는 Google Gemini를 선택하여 사용할 수 있습니다.
+
+생성한 LLM 인스턴스는 (provider, temperature, 추가 설정)을 키로 프로세스 수명 동안 재사용해
+파일 × 스킬마다 클라이언트와 커넥션 풀을 새로 만들지 않습니다. 종료 시 ``close_llm_clients()``로
+커넥션을 닫습니다. 호출은 ``ainvoke_llm()``으로 해 provider/model별 동시성·속도 한도를 적용합니다.
 """
+import inspect
+import time
 from typing import Any
 from loguru import logger
 
@@ -10,12 +16,31 @@ from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_ollama import ChatOllama
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from app import metrics
 from app.config import settings
+from app.reviewer.llm_limiter import estimate_tokens, llm_limiter, rate_limit_retry_after
+
+# (provider, temperature, 추가 설정) → 재사용할 LLM 인스턴스
+_llm_clients: dict[tuple, BaseChatModel] = {}
+
+
+def _client_key(provider: str, temperature: float, kwargs: dict[str, Any]) -> tuple | None:
+    """LLM 인스턴스 캐시 키를 만듭니다. 해시할 수 없는 설정(콜백 목록 등)이 있으면 None."""
+    key = (provider, float(temperature), tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def get_llm(temperature: float = 0.0, **kwargs: Any) -> BaseChatModel:
     """설정에 따라 적절한 LLM을 반환하는 팩토리 함수.
 
+    같은 provider/temperature/추가 설정으로 이미 만든 인스턴스가 있으면 그대로 반환합니다.
+    LLM 인스턴스는 호출 간 상태를 갖지 않으므로 동시에 여러 리뷰에서 공유해도 됩니다.
+
     Args:
         temperature: LLM temperature. 0.0은 결정론적, 1.0은 창의적 응답을 생성합니다.
         **kwargs: 추가 LLM 설정.
@@ -27,7 +52,101 @@ def get_llm(temperature: float = 0.0, **kwargs: Any) -> BaseChatModel:
         ValueError: 지원하지 않는 provider이거나 API key가 없는 경우.
     """
     provider = settings.llm_provider.lower()
+    key = _client_key(provider, temperature, kwargs)
+    if key is not None and key in _llm_clients:
+        return _llm_clients[key]
+
+    llm = _create_llm(provider, temperature, **kwargs)
+    metrics.inc("llm_clients_created_total", provider=provider)
+    if key is not None:
+        _llm_clients[key] = llm
+    return llm
+
+
+def _provider_of(llm: BaseChatModel) -> str:
+    if isinstance(llm, ChatAnthropic):
+        return "anthropic"
+    if isinstance(llm, ChatGoogleGenerativeAI):
+        return "google"
+    if isinstance(llm, ChatOllama):
+        return "ollama"
+    return get_current_provider()
+
 
+async def ainvoke_llm(llm: BaseChatModel, prompt: Any) -> BaseMessage:
+    """provider/model별 동시성·속도 한도 안에서 LLM을 호출합니다.
+
+    차례를 기다리는 시간과 모델 응답 시간은 각각 ``llm_queue_wait_seconds``와
+    ``llm_request_seconds``로 기록합니다. provider가 429를 돌려주면 ``Retry-After`` 동안 같은 모델의
+    요청을 모두 멈추고 ``llm_rate_limit_max_retries``번까지 다시 시도합니다.
+
+    Args:
+        llm: ``get_llm()``이 반환한 LLM 인스턴스.
+        prompt: LLM 입력 (프롬프트 문자열 또는 메시지 목록).
+
+    Returns:
+        LLM 응답 메시지.
+
+    Raises:
+        Exception: LLM 호출이 실패한 경우 (rate limit 재시도를 다 쓴 경우 포함).
+    """
+    limiter = llm_limiter.get(_provider_of(llm), str(getattr(llm, "model", "unknown")))
+    reserved = estimate_tokens(prompt) + settings.llm_output_tokens_estimate
+    attempt = 0
+    while True:
+        await limiter.acquire(reserved)
+        started = time.monotonic()
+        used = None
+        try:
+            response = await llm.ainvoke(prompt)
+            used = (getattr(response, "usage_metadata", None) or {}).get("total_tokens")
+            return response
+        except Exception as e:
+            retry_after = rate_limit_retry_after(e)
+            if retry_after is None:
+                raise
+            limiter.block(retry_after)
+            if attempt >= settings.llm_rate_limit_max_retries:
+                raise
+            attempt += 1
+        finally:
+            limiter.release(reserved, used)
+            metrics.observe("llm_request_seconds", time.monotonic() - started, model=limiter.name)
+
+
+async def close_llm_clients() -> None:
+    """재사용 중인 LLM 인스턴스를 모두 버리고 각자 소유한 커넥션을 닫습니다.
+
+    Anthropic의 HTTP 클라이언트는 langchain-anthropic이 프로세스 전체에서 공유하므로 닫지 않습니다.
+    이후 ``get_llm()``을 호출하면 새 인스턴스를 만듭니다.
+    """
+    clients = list(_llm_clients.values())
+    _llm_clients.clear()
+    for llm in clients:
+        try:
+            if isinstance(llm, ChatOllama):
+                await _close(getattr(llm, "_async_client", None))
+                await _close(getattr(llm, "_client", None))
+            elif isinstance(llm, ChatGoogleGenerativeAI):
+                await _close(getattr(llm.async_client_running, "transport", None))
+                await _close(getattr(llm.client, "transport", None))
+        except Exception as e:
+            logger.warning(f"LLM 클라이언트 종료 실패 ({type(llm).__name__}): {e}")
+    if clients:
+        logger.debug(f"LLM 클라이언트 {len(clients)}개 종료")
+
+
+async def _close(client: Any) -> None:
+    """``close()``가 동기/비동기 어느 쪽이든 호출합니다."""
+    if client is None:
+        return
+    result = client.close()
+    if inspect.isawaitable(result):
+        await result
+
+
+def _create_llm(provider: str, temperature: float, **kwargs: Any) -> BaseChatModel:
+    """provider에 맞는 LLM 인스턴스를 새로 생성합니다."""
     if provider == "anthropic":
         return _get_anthropic_llm(temperature, **kwargs)
     elif provider == "google":
@@ -0,0 +1,248 @@
+"""provider/model별 LLM 호출 동시성·속도 제한.
+
+파일 × 스킬마다 ``asyncio.gather``로 LLM을 호출하므로, 큰 PR 하나가 수백 개의 요청을 한꺼번에
+보내 provider의 429(또는 로컬 Ollama 과부하)를 부른다. 프로세스 전체에서 provider/model마다
+하나의 ``ModelLimiter``가 다음을 적용한다.
+
+- 동시에 보내는 요청 수(``max_concurrent``)
+- 분당 요청 수(``rpm``)와 분당 토큰 수(``tpm``) 토큰 버킷. 토큰은 프롬프트 길이로 추정해 예약하고
+  응답의 실제 사용량으로 정산한다.
+- provider가 429와 ``Retry-After``를 돌려주면 그 시간 동안 해당 모델의 요청을 모두 멈춘다.
+- 대기 중인 요청은 리뷰(``llm_share_key``)별 큐에 넣고 리뷰 사이를 번갈아 가며 보내, 큰 PR이
+  동시에 진행 중인 다른 리뷰를 굶기지 않게 한다.
+
+대기 시간(``llm_queue_wait_seconds``)은 모델 응답 시간(``llm_request_seconds``)과 따로 기록한다.
+"""
+import asyncio
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any
+
+from loguru import logger
+
+from app import metrics
+from app.config import settings
+
+# 공정 분배 단위. 리뷰 그래프 실행 동안 리뷰 식별자로 설정된다
+llm_share_key: ContextVar[str] = ContextVar("llm_share_key", default="default")
+
+# Retry-After 헤더 없이 받은 429의 기본 대기 시간 (초)
+DEFAULT_RETRY_AFTER_SECONDS = 10.0
+# 프롬프트 토큰 수 추정에 쓰는 토큰당 평균 글자 수
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(prompt: Any) -> int:
+    """프롬프트의 입력 토큰 수를 글자 수로 추정한다."""
+    text = prompt if isinstance(prompt, str) else str(prompt)
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def rate_limit_retry_after(error: BaseException) -> float | None:
+    """provider의 rate limit(429) 예외면 기다릴 시간을 반환한다.
+
+    Anthropic/Ollama SDK 예외의 ``status_code``, Google API 예외의 ``code``로 429를 판별하고,
+    응답의 ``Retry-After`` 헤더가 있으면 그 값을 쓴다.
+
+    Args:
+        error: LLM 호출에서 발생한 예외.
+
+    Returns:
+        대기 시간 (초). rate limit 예외가 아니면 None.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status is None and isinstance(getattr(error, "code", None), int):
+        status = error.code
+    if status != 429:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(float(headers.get("retry-after")), 1.0)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+class ModelLimiter:
+    """provider/model 하나의 LLM 요청 동시성·속도 제한.
+
+    Attributes:
+        name: 지표 라벨과 로그에 쓰는 ``provider:model``.
+        max_concurrent: 동시 요청 수 한도 (0이면 무제한).
+        rpm: 분당 요청 수 한도 (0이면 무제한).
+        tpm: 분당 토큰 수 한도 (0이면 무제한).
+    """
+
+    def __init__(self, name: str, max_concurrent: int, rpm: int, tpm: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.rpm = rpm
+        self.tpm = tpm
+        self.in_flight = 0
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        # 공정 분배 키 → 대기 중인 (future, 예약 토큰) 큐. 삽입 순서가 다음 차례 순서다
+        self._waiters: dict[str, deque[tuple[asyncio.Future, int]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def waiting(self) -> int:
+        """대기 중인 요청 수."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, tokens: int) -> None:
+        """요청을 보낼 차례가 될 때까지 기다리고, 동시성 슬롯과 버킷 예산을 예약한다.
+
+        Args:
+            tokens: 이 요청에 예약할 토큰 수 (추정치).
+        """
+        key = llm_share_key.get()
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append((future, tokens))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소되었으면 돌려준다
+                self.release(tokens, tokens)
+            else:
+                self._discard(key, future)
+            raise
+        metrics.observe("llm_queue_wait_seconds", time.monotonic() - started, model=self.name)
+
+    def release(self, reserved_tokens: int, used_tokens: int | None) -> None:
+        """요청이 끝나면 슬롯을 반납하고, 예약한 토큰을 실제 사용량으로 정산한다.
+
+        Args:
+            reserved_tokens: ``acquire``에서 예약한 토큰 수.
+            used_tokens: 응답이 알려 준 실제 토큰 수 (모르면 None, 예약량을 그대로 쓴 것으로 본다).
+        """
+        self.in_flight -= 1
+        if self.tpm and used_tokens is not None:
+            self._refill(time.monotonic())
+            self._tokens = min(float(self.tpm), self._tokens + reserved_tokens - used_tokens)
+        metrics.set_gauge("llm_in_flight", self.in_flight, model=self.name)
+        self._dispatch()
+
+    def block(self, seconds: float) -> None:
+        """provider가 rate limit을 알려 오면 ``seconds`` 동안 새 요청을 보내지 않는다."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        metrics.inc("llm_rate_limited_total", model=self.name)
+        logger.warning(f"🚦 LLM rate limit ({self.name}): {seconds:.1f}초 동안 요청 중단")
+        self._schedule(seconds)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        if self.rpm:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60)
+
+    def _wait_for(self, tokens: int, now: float) -> float:
+        """예약 토큰이 ``tokens``인 요청을 보내기까지 기다려야 하는 시간을 계산한다."""
+        wait = self._blocked_until - now
+        if self.rpm and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm:
+            needed = min(tokens, self.tpm)
+            if self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) * 60 / self.tpm)
+        return wait
+
+    def _dispatch(self) -> None:
+        """보낼 수 있는 만큼 대기 중인 요청에 리뷰를 번갈아 가며 차례를 준다."""
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters and (not self.max_concurrent or self.in_flight < self.max_concurrent):
+            key = next(iter(self._waiters))
+            queue = self._waiters.pop(key)
+            future, tokens = queue[0]
+            if future.done():
+                queue.popleft()
+                if queue:
+                    self._waiters[key] = queue
+                continue
+            wait = self._wait_for(tokens, now)
+            if wait > 0:
+                # 차례는 그대로 두고 예산이 찰 때 다시 시도한다
+                self._waiters = {key: queue, **self._waiters}
+                self._schedule(wait)
+                return
+            queue.popleft()
+            if queue:
+                # 같은 리뷰의 다음 요청은 다른 리뷰들 뒤로 보낸다
+                self._waiters[key] = queue
+            self.in_flight += 1
+            if self.rpm:
+                self._requests -= 1
+            if self.tpm:
+                self._tokens -= min(tokens, self.tpm)
+            future.set_result(None)
+        metrics.set_gauge("llm_in_flight", self.in_flight, model=self.name)
+
+    def _schedule(self, wait: float) -> None:
+        if self._timer is not None and not self._timer.cancelled():
+            return
+        self._timer = asyncio.get_running_loop().call_later(wait, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _discard(self, key: str, future: asyncio.Future) -> None:
+        """취소된 대기 요청을 큐에서 뺀다."""
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        for item in queue:
+            if item[0] is future:
+                queue.remove(item)
+                break
+        if not queue:
+            del self._waiters[key]
+
+
+class LLMLimiter:
+    """provider/model별 ``ModelLimiter`` 레지스트리."""
+
+    def __init__(self):
+        self._limiters: dict[str, ModelLimiter] = {}
+
+    def get(self, provider: str, model: str) -> ModelLimiter:
+        """provider/model의 limiter를 반환한다. 처음이면 설정과 override로 한도를 정해 만든다.
+
+        override는 ``provider``, ``provider:model`` 순서로 적용한다.
+
+        Args:
+            provider: LLM provider 이름.
+            model: 모델 이름.
+
+        Returns:
+            해당 모델의 ModelLimiter.
+        """
+        name = f"{provider}:{model}"
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limits = {
+                "max_concurrent": settings.llm_max_concurrent_requests,
+                "rpm": settings.llm_requests_per_minute,
+                "tpm": settings.llm_tokens_per_minute,
+            }
+            limits.update(settings.llm_limit_overrides.get(provider, {}))
+            limits.update(settings.llm_limit_overrides.get(name, {}))
+            limiter = self._limiters[name] = ModelLimiter(
+                name,
+                max_concurrent=int(limits["max_concurrent"]),
+                rpm=int(limits["rpm"]),
+                tpm=int(limits["tpm"]),
+            )
+        return limiter
+
+
+llm_limiter = LLMLimiter()
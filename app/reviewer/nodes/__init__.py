@@ -4,6 +4,7 @@ from .file_reviewer import review_all_files
 from .summarizer import summarize_review
 from .skill_loader import load_repo_skills
 from .previous_review_loader import load_previous_review
+from .file_collector import collect_pr_files, load_file_patches
 
 __all__ = [
     "analyze_pr_intent",
@@ -12,4 +13,6 @@ __all__ = [
     "summarize_review",
     "load_repo_skills",
     "load_previous_review",
+    "collect_pr_files",
+    "load_file_patches",
 ]
@@ -0,0 +1,69 @@
+"""File Collector Nodes — 변경 파일 목록과 파일 리뷰에 필요한 patch를 PR 데이터에 채웁니다."""
+import asyncio
+from contextvars import ContextVar
+
+from loguru import logger
+
+from app.github import pr_collector
+from app.models import FileChange
+from app.reviewer.state import ReviewState
+
+# 파이프라인이 그래프 실행 전에 시작한 변경 파일 수집 태스크. 리뷰 그래프 실행 동안 설정된다
+pending_pr_files: ContextVar[asyncio.Task[list[FileChange]] | None] = ContextVar("pending_pr_files", default=None)
+
+
+async def collect_pr_files(state: ReviewState) -> dict:
+    """변경 파일 목록이 필요한 노드(classify_risk) 직전에 파일 수집 결과를 넘겨받는 노드.
+
+    파이프라인은 PR 메타데이터만 받은 뒤 파일 페이지 수집을 백그라운드로 시작하고 그래프를
+    실행하므로, Skills/이전 리뷰 로드와 의도 분석이 파일 수집과 겹쳐 진행됩니다. 이 노드는
+    ``pending_pr_files`` 태스크를 기다려 ``pr_data.files``를 채웁니다.
+
+    태스크가 없으면(수집을 마친 PR 데이터로 실행했거나, 체크포인트에서 재개된 경우) 파일이
+    이미 있으면 그대로 두고, 없으면 여기서 직접 수집합니다.
+
+    Args:
+        state: 현재 리뷰 상태.
+
+    Returns:
+        파일 목록을 채운 ``pr_data``를 포함하는 상태 업데이트 딕셔너리. 변경이 없으면 빈 딕셔너리.
+    """
+    pr_data = state["pr_data"]
+    task = pending_pr_files.get()
+
+    if task is not None:
+        files = await task
+    elif pr_data.files or not pr_data.changed_files_count:
+        return {}
+    else:
+        files = await pr_collector.collect_files(
+            state["installation_id"],
+            state["repo_owner"],
+            state["repo_name"],
+            pr_data.pr_number,
+            total=pr_data.changed_files_count,
+        )
+
+    logger.info(f"📂 변경 파일 {len(files)}개 수집 완료")
+    return {"pr_data": pr_data.model_copy(update={"files": files})}
+
+
+async def load_file_patches(state: ReviewState) -> dict:
+    """파일 리뷰 직전에 변경 파일의 patch를 채우는 노드.
+
+    GraphQL 수집기는 patch 없이 파일 목록을 받으므로, 파일 리뷰가 실제로 진행될 때만 REST files
+    API로 patch를 받습니다. 다른 수집기는 patch를 이미 갖고 있어 아무것도 하지 않습니다.
+
+    Args:
+        state: 현재 리뷰 상태.
+
+    Returns:
+        patch를 채운 ``pr_data``를 포함하는 상태 업데이트 딕셔너리. 변경이 없으면 빈 딕셔너리.
+    """
+    pr_data = state["pr_data"]
+    loaded = await pr_collector.load_patches(
+        state["installation_id"], state["repo_owner"], state["repo_name"], pr_data
+    )
+    if loaded is pr_data:
+        return {}
+    return {"pr_data": loaded}
@@ -5,14 +5,19 @@ import asyncio
 import json
 from datetime import datetime
 
+from langchain_core.runnables import RunnableConfig
 from loguru import logger
 
+from app.database import async_session_factory
 from app.github import github_client
+from app.github.rate_limit import PRIORITY_LOW, RateLimitBudgetExceeded
+from app.github.snapshot import snapshot_cache
+from app.services.file_result_service import load_file_results, save_file_result
 from app.reviewer.state import ReviewState
 from app.reviewer.prompts import create_file_review_prompt
 from app.reviewer.prompts.skill_agent_prompt import create_skill_agent_prompt
 from app.reviewer.skill_router import get_applicable_skills
-from app.reviewer.llm import get_llm, get_current_provider
+from app.reviewer.llm import ainvoke_llm, get_llm, get_current_provider
 from app.reviewer.utils import parse_llm_json_response
 from app.reviewer.file_filter import should_skip_file
 from app.reviewer.diff_limit import get_diff_limit
@@ -20,7 +25,7 @@ from app.models import FileChange
 
 # 라우터/뷰/API 파일이 포함된 경로 패턴 → 앱 진입점을 컨텍스트로 제공
 _ROUTE_PATH_PATTERNS = ("routers/", "routes/", "views/", "endpoints/", "api/")
-# 앱 진입점 후보 (순서대로 시도)
+# 앱 진입점 후보 (앞쪽이 우선)
 _ENTRY_CANDIDATES = ("main.py", "app.py", "application.py", "server.py", "asgi.py")
 
 
@@ -36,6 +41,14 @@ async def _fetch_context_files(
     현재 규칙:
     - 라우터/엔드포인트 파일이 포함된 경우 앱 진입점(main.py 등)을 함께 제공합니다.
 
+    저장소 스냅샷 캐시가 켜져 있으면 HEAD 커밋의 스냅샷에서 읽습니다. 아니면 최상위 트리
+    한 번으로 후보 파일의 존재 여부와 blob SHA를 확인하고, 내용은 blob SHA로 조회해 blob
+    캐시를 거칩니다. 진입점 파일은 푸시 사이에 거의 바뀌지 않으므로 대부분 다운로드 없이
+    캐시에서 읽힙니다. 트리 조회가 실패하면 후보 경로를 동시에 조회합니다.
+
+    컨텍스트는 리뷰에 필수가 아니므로 저우선순위로 조회하며, GitHub rate limit 예산이
+    부족하면 가장 먼저 생략됩니다.
+
     Args:
         changed_files: PR에서 변경된 파일 목록.
         installation_id: GitHub App Installation ID.
@@ -52,23 +65,77 @@ async def _fetch_context_files(
     if not needs_entry_file:
         return {}
 
-    context: dict[str, str] = {}
-    for candidate in _ENTRY_CANDIDATES:
+    if snapshot_cache.enabled:
         try:
-            content = await github_client.get_file_content(
+            snapshot = await snapshot_cache.get(github_client, installation_id, repo_owner, repo_name, head_sha)
+            candidate = next((c for c in _ENTRY_CANDIDATES if c in snapshot), None)
+            if candidate is None:
+                return {}
+            logger.info(f"📎 컨텍스트 파일 로드 (스냅샷): {candidate}")
+            return {candidate: snapshot.read_text(candidate)}
+        except Exception as e:
+            logger.warning(f"⚠️ 저장소 스냅샷을 사용할 수 없어 API로 조회합니다: {e}")
+
+    try:
+        tree = await github_client.get_tree(
+            installation_id, repo_owner, repo_name, head_sha, priority=PRIORITY_LOW
+        )
+        blob_shas = {entry["path"]: entry["sha"] for entry in tree if entry["type"] == "blob"}
+        candidate = next((c for c in _ENTRY_CANDIDATES if c in blob_shas), None)
+        if candidate is None:
+            return {}
+        content = await github_client.get_blob_content(
+            installation_id, repo_owner, repo_name, blob_shas[candidate], priority=PRIORITY_LOW
+        )
+    except RateLimitBudgetExceeded as e:
+        logger.warning(f"⚠️ 컨텍스트 파일 조회 생략: {e}")
+        return {}
+    except Exception as e:
+        logger.warning(f"⚠️ 트리 조회 실패, 진입점 후보를 직접 조회합니다: {e}")
+        return await _probe_entry_candidates(installation_id, repo_owner, repo_name, head_sha)
+
+    logger.info(f"📎 컨텍스트 파일 로드: {candidate}")
+    return {candidate: content}
+
+
+async def _probe_entry_candidates(
+    installation_id: str,
+    repo_owner: str,
+    repo_name: str,
+    head_sha: str,
+) -> dict[str, str]:
+    """진입점 후보 경로를 동시에 조회해 우선순위가 가장 높은 파일 하나를 반환합니다.
+
+    Args:
+        installation_id: GitHub App Installation ID.
+        repo_owner: 리포지토리 소유자.
+        repo_name: 리포지토리 이름.
+        head_sha: HEAD 커밋 SHA.
+
+    Returns:
+        {파일경로: 파일내용} 딕셔너리. 후보가 하나도 없으면 빈 딕셔너리.
+    """
+    results = await asyncio.gather(
+        *(
+            github_client.get_file_content(
                 installation_id=installation_id,
                 repo_owner=repo_owner,
                 repo_name=repo_name,
                 file_path=candidate,
                 ref=head_sha,
+                priority=PRIORITY_LOW,
             )
-            context[candidate] = content
+            for candidate in _ENTRY_CANDIDATES
+        ),
+        return_exceptions=True,
+    )
+    for candidate, result in zip(_ENTRY_CANDIDATES, results):
+        if not isinstance(result, BaseException):
             logger.info(f"📎 컨텍스트 파일 로드: {candidate}")
-            break
-        except Exception:
-            continue
-
-    return context
+            return {candidate: result}
+    if any(isinstance(result, RateLimitBudgetExceeded) for result in results):
+        logger.warning("⚠️ 컨텍스트 파일 조회 생략: GitHub rate limit 예산 부족")
+    return {}
 
 
 async def _run_skill_agent(
@@ -100,7 +167,7 @@ async def _run_skill_agent(
             pr_files=pr_files,
             previous_review=previous_review,
         )
-        response = await llm.ainvoke(prompt)
+        response = await ainvoke_llm(llm, prompt)
         result = parse_llm_json_response(response.content)
         result.setdefault("skill", skill.get("name", "unknown"))
         result.setdefault("verdict", "pass")
@@ -226,7 +293,7 @@ async def review_single_file(
                 pr_files, None, previous_review, diff_max_chars,
                 system_prompt=system_prompt,
             )
-            response = await llm.ainvoke(prompt)
+            response = await ainvoke_llm(llm, prompt)
             response_text = response.content
 
             try:
@@ -284,11 +351,52 @@ async def review_single_file(
         }
 
 
-async def review_all_files(state: ReviewState) -> dict:
+async def _load_completed_reviews(thread_id: str, pass_number: int) -> dict[str, dict]:
+    """이전 실행(워커 재시작 전)에서 이미 끝난 파일 리뷰 결과를 불러옵니다.
+
+    Args:
+        thread_id: 체크포인트 thread ID.
+        pass_number: ``review_all_files`` 실행 회차.
+
+    Returns:
+        {파일 경로: ``review_single_file`` 결과}. 조회 실패 시 빈 dict.
+    """
+    try:
+        async with async_session_factory() as session:
+            return await load_file_results(session, thread_id, pass_number)
+    except Exception as e:
+        logger.warning(f"⚠️ 파일별 중간 결과 조회 실패, 전체 재리뷰: {e}")
+        return {}
+
+
+async def _save_completed_review(thread_id: str, pass_number: int, result: dict) -> None:
+    """파일 하나의 리뷰 결과를 즉시 저장합니다. 실패해도 리뷰는 계속 진행합니다.
+
+    Args:
+        thread_id: 체크포인트 thread ID.
+        pass_number: ``review_all_files`` 실행 회차.
+        result: ``review_single_file`` 결과.
+    """
+    try:
+        async with async_session_factory() as session:
+            await save_file_result(
+                session, thread_id, pass_number, result["review"]["filename"],
+                {"review": result["review"], "message": result["message"]},
+            )
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"⚠️ 파일별 중간 결과 저장 실패 ({result['review'].get('filename')}): {e}")
+
+
+async def review_all_files(state: ReviewState, config: RunnableConfig | None = None) -> dict:
     """모든 파일을 병렬로 리뷰하는 노드.
 
+    체크포인트 thread로 실행 중이면 파일 하나가 끝날 때마다 결과를 저장하고,
+    재시작 후 다시 실행될 때 이미 끝난 파일은 저장된 결과를 재사용합니다.
+
     Args:
         state: 현재 리뷰 상태.
+        config: LanGraph 실행 설정. ``configurable.thread_id``가 있으면 파일별 결과를 저장합니다.
 
     Returns:
         ``file_reviews``, ``messages``, ``errors``, ``retry_count``가 포함된 상태 업데이트 딕셔너리.
@@ -336,14 +444,24 @@ async def review_all_files(state: ReviewState) -> dict:
         head_sha=pr_data.head_sha,
     )
 
-    review_tasks = [
-        review_single_file(
+    thread_id = ((config or {}).get("configurable") or {}).get("thread_id")
+    completed = await _load_completed_reviews(thread_id, retry_count) if thread_id else {}
+    if completed:
+        logger.info(f"♻️  이전 실행에서 완료된 {len(completed)}개 파일 리뷰 재사용")
+
+    async def review_and_save(file: FileChange, idx: int) -> dict:
+        if file.filename in completed:
+            return {**completed[file.filename], "error": None}
+        result = await review_single_file(
             file, idx, total_files, pr_intent, risk_assessment,
             context_files, files, repo_skills, previous_review, diff_max_chars,
             system_prompt=system_prompt,
         )
-        for idx, file in enumerate(files)
-    ]
+        if thread_id and result["error"] is None:
+            await _save_completed_review(thread_id, retry_count, result)
+        return result
+
+    review_tasks = [review_and_save(file, idx) for idx, file in enumerate(files)]
 
     results = await asyncio.gather(*review_tasks, return_exceptions=True)
 
@@ -8,7 +8,7 @@ from loguru import logger
 
 from app.reviewer.state import ReviewState
 from app.reviewer.prompts import create_intent_analysis_prompt
-from app.reviewer.llm import get_llm
+from app.reviewer.llm import ainvoke_llm, get_llm
 from app.reviewer.utils import parse_llm_json_response
 
 
@@ -33,7 +33,7 @@ async def analyze_pr_intent(state: ReviewState) -> dict:
         prompt = create_intent_analysis_prompt(pr_data)
 
         # LLM 호출
-        response = await llm.ainvoke(prompt)
+        response = await ainvoke_llm(llm, prompt)
         response_text = response.content
 
         logger.debug(f"Intent 분석 응답: {response_text[:200]}...")
@@ -8,7 +8,7 @@ from loguru import logger
 
 from app.reviewer.state import ReviewState
 from app.reviewer.prompts import create_risk_assessment_prompt
-from app.reviewer.llm import get_llm
+from app.reviewer.llm import ainvoke_llm, get_llm
 from app.reviewer.utils import parse_llm_json_response
 
 
@@ -34,7 +34,7 @@ async def classify_risk(state: ReviewState) -> dict:
         prompt = create_risk_assessment_prompt(pr_data, pr_intent)
 
         # LLM 호출
-        response = await llm.ainvoke(prompt)
+        response = await ainvoke_llm(llm, prompt)
         response_text = response.content
 
         logger.debug(f"Risk 평가 응답: {response_text[:200]}...")
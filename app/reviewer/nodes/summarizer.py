@@ -8,7 +8,7 @@ from loguru import logger
 
 from app.reviewer.state import ReviewState
 from app.reviewer.prompts import create_summary_prompt
-from app.reviewer.llm import get_llm
+from app.reviewer.llm import ainvoke_llm, get_llm
 from app.reviewer.utils import parse_llm_json_response
 
 
@@ -44,7 +44,7 @@ async def summarize_review(state: ReviewState) -> dict:
         )
 
         # LLM 호출
-        response = await llm.ainvoke(prompt)
+        response = await ainvoke_llm(llm, prompt)
         response_text = response.content
 
         logger.debug(f"Summary 응답: {response_text[:200]}...")
@@ -105,6 +105,7 @@ def create_skill_agent_prompt(
     {{
       "severity": "high | medium | low",
       "type": "bug | security | performance | style | logic",
+      "line": "문제가 있는 변경 후 파일의 라인 번호 (diff의 @@ 헤더 기준으로 계산한 정수, 특정할 수 없으면 null)",
       "message": "구체적인 문제 설명",
       "suggestion": "해결 방법 제안"
     }}
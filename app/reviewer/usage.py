@@ -0,0 +1,43 @@
+"""
+LLM 토큰 사용량 집계 콜백
+"""
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+
+
+class TokenUsageCallback(AsyncCallbackHandler):
+    """리뷰 한 건 동안 LLM 호출에 사용된 토큰 수를 누적하는 콜백.
+
+    ``run_review(callbacks=[...])``로 그래프 config에 전달하면 각 노드의 LLM 호출에 전파됩니다.
+
+    Attributes:
+        total_tokens: 누적된 입력+출력 토큰 수.
+    """
+
+    def __init__(self) -> None:
+        self.total_tokens = 0
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """LLM 호출이 끝날 때마다 응답의 토큰 사용량을 더합니다.
+
+        Args:
+            response: LLM 호출 결과.
+            **kwargs: 콜백 부가 정보 (사용하지 않음).
+        """
+        tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    tokens += usage.get("total_tokens", 0)
+
+        # usage_metadata를 채우지 않는 provider는 llm_output의 집계값 사용
+        if not tokens and response.llm_output:
+            usage = response.llm_output.get("token_usage") or response.llm_output.get("usage") or {}
+            tokens = usage.get("total_tokens") or (
+                usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+            )
+
+        self.total_tokens += tokens
@@ -8,9 +8,8 @@ from app.database import get_db
 from app.database.models.pull_request import PullRequest
 from app.database.models.repository import Repository
 from app.database.models.skill import Skill
-from app.github import github_client
 from app.schemas.repository import RepositoryListItem, RepositorySystemPromptUpdate
-from app.services.review_service import update_pr_state
+from app.services.pr_sync import reconcile_repository_prs
 
 router = APIRouter(prefix="/repositories", tags=["repositories"])
 
@@ -157,6 +156,7 @@ async def sync_pull_request_states(
     """GitHub에서 PR 상태를 가져와 DB와 동기화한다.
 
     DB에 open으로 저장된 PR 중 GitHub에서 실제로 closed/merged인 것들을 업데이트한다.
+    전체 PR을 나열하지 않고 open PR만 직접 조회하거나, 마지막 동기화 이후 갱신된 PR까지만 읽는다.
 
     Args:
         repo_id: 저장소 내부 PK.
@@ -172,33 +172,5 @@ async def sync_pull_request_states(
     if repo is None:
         raise HTTPException(status_code=404, detail="Repository not found")
 
-    open_prs_result = await session.execute(
-        select(PullRequest).where(
-            PullRequest.repository_id == repo_id,
-            PullRequest.state == "open",
-        )
-    )
-    open_prs = open_prs_result.scalars().all()
-
-    if not open_prs:
-        return {"updated": 0, "details": []}
-
-    gh_prs = await github_client.list_prs(
-        installation_id=repo.installation_id,
-        repo_owner=repo.owner,
-        repo_name=repo.name,
-        state="all",
-    )
-    gh_pr_map = {p["number"]: p for p in gh_prs}
-
-    updated = []
-    for pr in open_prs:
-        gh_pr = gh_pr_map.get(pr.pr_number)
-        if gh_pr is None:
-            continue
-        if gh_pr["state"] == "closed":
-            new_state = "merged" if gh_pr.get("merged_at") else "closed"
-            await update_pr_state(session, repo.github_repo_id, pr.pr_number, new_state)
-            updated.append({"pr_number": pr.pr_number, "new_state": new_state})
-
+    updated = await reconcile_repository_prs(session, repo)
     return {"updated": len(updated), "details": updated}
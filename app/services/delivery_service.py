@@ -0,0 +1,56 @@
+"""웹훅 delivery 중복 처리 방지 서비스."""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import WebhookDelivery
+
+
+async def record_delivery(
+    session: AsyncSession,
+    delivery_id: str,
+    event: str,
+) -> bool:
+    """delivery ID를 기록합니다. 이미 기록된 ID면 아무것도 하지 않습니다.
+
+    ``INSERT … ON CONFLICT DO NOTHING``을 사용하므로 동시에 같은 delivery가 들어와도
+    하나만 True를 받습니다. 기록은 호출자의 트랜잭션과 함께 commit/rollback되므로
+    처리 도중 실패한 delivery는 GitHub 재전송 시 다시 처리됩니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        delivery_id: ``X-GitHub-Delivery`` 헤더 값.
+        event: ``X-GitHub-Event`` 헤더 값.
+
+    Returns:
+        새로 기록했으면 True, 이미 처리된 delivery면 False.
+    """
+    result = await session.execute(
+        insert(WebhookDelivery)
+        .values(delivery_id=delivery_id, event=event)
+        .on_conflict_do_nothing(index_elements=[WebhookDelivery.delivery_id])
+        .returning(WebhookDelivery.delivery_id)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+async def purge_expired_deliveries(
+    session: AsyncSession,
+    ttl_hours: int,
+) -> int:
+    """보관 기간이 지난 delivery 기록을 삭제합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        ttl_hours: 보관 기간 (시간).
+
+    Returns:
+        삭제된 row 수.
+    """
+    threshold = datetime.now(timezone.utc) - timedelta(hours=ttl_hours)
+    result = await session.execute(
+        delete(WebhookDelivery).where(WebhookDelivery.created_at < threshold)
+    )
+    return result.rowcount
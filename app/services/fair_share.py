@@ -0,0 +1,88 @@
+"""Installation별 공정 분배(weighted fair share) 정책.
+
+여러 GitHub App installation이 하나의 배포를 공유할 때, 한 installation의 대량 PR이
+다른 installation의 리뷰를 굶기지 않도록 워커가 다음 작업을 고르는 기준을 제공한다.
+"""
+from typing import Callable, NamedTuple
+
+from app.config import settings
+from app.database.models import ReviewJob
+
+
+class InstallationLimits(NamedTuple):
+    """installation 하나에 적용되는 스케줄링 한도.
+
+    Attributes:
+        weight: 공정 분배 가중치. 클수록 동시에 더 많은 슬롯을 배분받는다.
+        max_concurrent: 동시에 실행할 수 있는 최대 리뷰 수 (0이면 무제한).
+        daily_token_quota: 하루(UTC) LLM 토큰 한도 (0이면 무제한).
+    """
+
+    weight: float
+    max_concurrent: int
+    daily_token_quota: int
+
+
+def get_installation_limits(installation_id: str) -> InstallationLimits:
+    """설정의 기본값과 installation별 override를 합쳐 한도를 반환한다.
+
+    Args:
+        installation_id: GitHub App Installation ID.
+
+    Returns:
+        해당 installation의 InstallationLimits.
+    """
+    override = settings.installation_limit_overrides.get(installation_id, {})
+    return InstallationLimits(
+        weight=max(float(override.get("weight", 1.0)), 0.01),
+        max_concurrent=int(override.get("max_concurrent", settings.installation_max_concurrent_reviews)),
+        daily_token_quota=int(override.get("daily_token_quota", settings.installation_daily_token_quota)),
+    )
+
+
+def is_installation_blocked(
+    limits: InstallationLimits,
+    running: int,
+    tokens_today: int,
+) -> bool:
+    """동시 실행 한도나 일일 토큰 한도에 도달해 새 작업을 시작할 수 없는지 판단한다.
+
+    Args:
+        limits: installation 한도.
+        running: 현재 실행 중인 작업 수.
+        tokens_today: 오늘(UTC) 사용한 토큰 수.
+
+    Returns:
+        새 작업을 시작할 수 없으면 True.
+    """
+    if limits.max_concurrent and running >= limits.max_concurrent:
+        return True
+    if limits.daily_token_quota and tokens_today >= limits.daily_token_quota:
+        return True
+    return False
+
+
+def pick_fair_share_job(
+    candidates: list[ReviewJob],
+    running_by_installation: dict[str, int],
+    limits_for: Callable[[str], InstallationLimits],
+) -> ReviewJob | None:
+    """우선순위 순으로 정렬된 후보 중 실행 중 작업 수/가중치가 가장 작은 installation의 작업을 고른다.
+
+    같은 비율이면 후보 순서(우선순위)가 앞선 작업을 고른다.
+
+    Args:
+        candidates: 우선순위 내림차순으로 정렬된 대기 작업.
+        running_by_installation: installation별 실행 중 작업 수.
+        limits_for: installation ID → InstallationLimits 조회 함수.
+
+    Returns:
+        실행할 작업. 후보가 없으면 None.
+    """
+    best: ReviewJob | None = None
+    best_share = 0.0
+    for job in candidates:
+        share = running_by_installation.get(job.installation_id, 0) / limits_for(job.installation_id).weight
+        if best is None or share < best_share:
+            best, best_share = job, share
+    return best
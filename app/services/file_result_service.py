@@ -0,0 +1,78 @@
+"""리뷰 실행 중 파일별 중간 결과 저장 서비스.
+
+워커가 ``review_all_files`` 도중 재시작되어도 이미 리뷰한 파일은 다시 LLM을 호출하지 않도록
+파일 하나가 끝날 때마다 결과를 저장한다.
+"""
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import ReviewFileResult
+
+
+async def load_file_results(
+    session: AsyncSession,
+    thread_id: str,
+    pass_number: int,
+) -> dict[str, dict]:
+    """해당 실행 회차에서 이미 완료된 파일 리뷰 결과를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        thread_id: 체크포인트 thread ID.
+        pass_number: ``review_all_files`` 실행 회차.
+
+    Returns:
+        {파일 경로: ``review_single_file`` 결과}.
+    """
+    result = await session.execute(
+        select(ReviewFileResult.filename, ReviewFileResult.result).where(
+            ReviewFileResult.thread_id == thread_id,
+            ReviewFileResult.pass_number == pass_number,
+        )
+    )
+    return {filename: file_result for filename, file_result in result.all()}
+
+
+async def save_file_result(
+    session: AsyncSession,
+    thread_id: str,
+    pass_number: int,
+    filename: str,
+    file_result: dict,
+) -> None:
+    """파일 하나의 리뷰 결과를 저장합니다. 이미 있으면 무시합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        thread_id: 체크포인트 thread ID.
+        pass_number: ``review_all_files`` 실행 회차.
+        filename: 파일 경로.
+        file_result: ``review_single_file`` 결과.
+    """
+    await session.execute(
+        insert(ReviewFileResult)
+        .values(
+            thread_id=thread_id,
+            pass_number=pass_number,
+            filename=filename,
+            result=file_result,
+        )
+        .on_conflict_do_nothing(constraint="uq_review_file_results_thread_file")
+    )
+
+
+async def delete_file_results(session: AsyncSession, thread_id: str) -> int:
+    """thread의 파일별 중간 결과를 모두 삭제합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        thread_id: 체크포인트 thread ID.
+
+    Returns:
+        삭제된 row 수.
+    """
+    result = await session.execute(
+        delete(ReviewFileResult).where(ReviewFileResult.thread_id == thread_id)
+    )
+    return result.rowcount
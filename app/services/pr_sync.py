@@ -0,0 +1,260 @@
+"""PR 상태를 GitHub와 증분으로 동기화하는 reconciler.
+
+웹훅을 놓쳐 DB에 open으로 남은 PR을 찾아 closed/merged로 바로잡는다. 저장소의 PR을
+전부 나열하지 않고 다음 중 하나만 조회한다.
+
+- DB의 open PR이 ``direct_fetch_max``개 이하이거나 동기화 기록(``prs_synced_at``)이 없으면
+  해당 PR 번호만 동시에 조회한다.
+- 그 밖에는 closed PR을 ``sort=updated&direction=desc``로 읽다가 마지막 동기화 시점보다
+  먼저 갱신된 PR이 나오면 멈춘다.
+
+워커의 주기 동기화는 GitHub 조회 동안 DB 커넥션과 행 잠금을 잡지 않는다. 짧은 트랜잭션으로
+대상 저장소를 맡고(``prs_sync_claimed_at``), 세션 없이 GitHub를 조회한 뒤, 다시 짧은
+트랜잭션으로 PR 상태와 기준점을 기록한다.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session_factory, session_scope
+from app.database.models import PullRequest, Repository
+from app.github import github_client
+
+# GitHub와 서버의 시계 차이, 동기화 도중 갱신된 PR을 놓치지 않도록 기준점을 앞당기는 시간
+WATERMARK_SKEW = timedelta(minutes=5)
+# 동기화를 맡은 워커가 끝내지 못하고 죽었을 때 다른 워커가 다시 맡을 수 있기까지의 시간
+SYNC_CLAIM_LEASE = timedelta(minutes=10)
+
+
+def _parse_github_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _state_of(gh_pr: dict) -> str:
+    if gh_pr["state"] != "closed":
+        return "open"
+    return "merged" if gh_pr.get("merged_at") else "closed"
+
+
+async def _fetch_open_pr_states(repo: Repository, pr_numbers: list[int]) -> tuple[dict[int, str], bool]:
+    """PR 번호별로 상세를 동시에 조회해 현재 상태와 모든 조회가 성공했는지를 반환한다.
+
+    조회에 실패한 PR은 상태에서 제외한다.
+    """
+    semaphore = asyncio.Semaphore(settings.github_page_concurrency)
+
+    async def fetch(pr_number: int) -> tuple[int, str] | None:
+        async with semaphore:
+            try:
+                gh_pr = await github_client.get_pr_details(
+                    repo.installation_id, repo.owner, repo.name, pr_number
+                )
+            except Exception as e:
+                logger.warning(f"{repo.owner}/{repo.name} PR #{pr_number} 조회 실패: {e}")
+                return None
+        return pr_number, _state_of(gh_pr)
+
+    results = await asyncio.gather(*(fetch(number) for number in pr_numbers))
+    states = dict(result for result in results if result is not None)
+    return states, len(states) == len(pr_numbers)
+
+
+async def _fetch_closed_since(repo: Repository, pr_numbers: set[int], since: datetime) -> dict[int, str]:
+    """``since`` 이후 갱신된 closed PR을 최근 갱신 순으로 읽어 ``pr_numbers``의 상태를 반환한다."""
+    states: dict[int, str] = {}
+    pages = 0
+    async for page in github_client.iter_prs(
+        repo.installation_id, repo.owner, repo.name, state="closed", sort="updated", direction="desc"
+    ):
+        pages += 1
+        for gh_pr in page:
+            if _parse_github_time(gh_pr["updated_at"]) < since:
+                logger.debug(f"{repo.owner}/{repo.name} PR 목록 {pages}페이지에서 동기화 기준점 도달")
+                return states
+            if gh_pr["number"] in pr_numbers:
+                states[gh_pr["number"]] = _state_of(gh_pr)
+    return states
+
+
+async def fetch_pr_states(repo: Repository, open_pr_numbers: list[int]) -> tuple[dict[int, str], bool]:
+    """DB에 open으로 남은 PR들의 GitHub 상태를 조회한다. DB에는 접근하지 않는다.
+
+    Args:
+        repo: 동기화할 저장소 (``installation_id``, ``owner``, ``name``, ``prs_synced_at``만 읽는다).
+        open_pr_numbers: DB에 open으로 저장된 PR 번호 목록.
+
+    Returns:
+        (PR 번호별 상태, 모든 조회가 성공했는지 여부). 실패한 조회가 있으면 기준점을 옮기지 않는다.
+
+    Raises:
+        httpx.HTTPStatusError: PR 목록 조회가 실패한 경우
+    """
+    if not open_pr_numbers:
+        return {}, True
+    if repo.prs_synced_at is None or len(open_pr_numbers) <= settings.pr_sync_direct_fetch_max:
+        return await _fetch_open_pr_states(repo, open_pr_numbers)
+    return await _fetch_closed_since(repo, set(open_pr_numbers), repo.prs_synced_at), True
+
+
+async def reconcile_repository_prs(session: AsyncSession, repo: Repository) -> list[dict]:
+    """DB에 open으로 남은 PR 중 GitHub에서 닫힌 것을 찾아 상태를 갱신하고 기준점을 옮긴다.
+
+    기준점(``prs_synced_at``)은 조회를 시작한 시각에서 ``WATERMARK_SKEW``를 뺀 값이며,
+    모든 조회가 성공했을 때만 갱신된다. 일부 PR 조회가 실패하면 조회된 PR의 상태만 반영하고
+    기준점은 그대로 두어, 다음 주기에 다시 동기화한다. commit은 호출자가 한다.
+
+    Args:
+        session: 비동기 DB 세션.
+        repo: 동기화할 저장소.
+
+    Returns:
+        ``[{"pr_number": ..., "new_state": ...}, ...]`` 상태가 바뀐 PR 목록.
+
+    Raises:
+        httpx.HTTPStatusError: PR 목록 조회가 실패한 경우
+    """
+    started_at = datetime.now(timezone.utc)
+    result = await session.execute(
+        select(PullRequest).where(
+            PullRequest.repository_id == repo.id,
+            PullRequest.state == "open",
+        )
+    )
+    open_prs = {pr.pr_number: pr for pr in result.scalars().all()}
+
+    states, complete = await fetch_pr_states(repo, list(open_prs))
+
+    updated = []
+    for pr_number, new_state in states.items():
+        if new_state != "open":
+            open_prs[pr_number].state = new_state
+            updated.append({"pr_number": pr_number, "new_state": new_state})
+
+    if complete:
+        repo.prs_synced_at = started_at - WATERMARK_SKEW
+    else:
+        logger.warning(f"{repo.owner}/{repo.name} 일부 PR 조회 실패, 동기화 기준점 유지")
+    if updated:
+        logger.info(f"🔄 {repo.owner}/{repo.name} PR 상태 {len(updated)}개 동기화")
+    return updated
+
+
+async def _claim_due_repositories(interval_seconds: int) -> list[Repository]:
+    """동기화할 때가 된 활성 저장소를 짧은 트랜잭션으로 맡는다.
+
+    ``FOR UPDATE SKIP LOCKED``로 고른 저장소의 ``prs_sync_claimed_at``을 지금으로 바꾸고 바로
+    commit하므로, 다른 워커는 임대(``SYNC_CLAIM_LEASE``)가 끝나기 전까지 같은 저장소를 고르지 않는다.
+
+    Args:
+        interval_seconds: 저장소별 최소 동기화 간격 (초).
+
+    Returns:
+        맡은 저장소 목록 (세션에서 분리된 상태).
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(seconds=interval_seconds)
+    async with session_scope() as session:
+        result = await session.execute(
+            select(Repository)
+            .where(
+                Repository.is_active.is_(True),
+                or_(Repository.prs_synced_at.is_(None), Repository.prs_synced_at < cutoff),
+                or_(
+                    Repository.prs_sync_claimed_at.is_(None),
+                    Repository.prs_sync_claimed_at < now - SYNC_CLAIM_LEASE,
+                ),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        repos = list(result.scalars().all())
+        for repo in repos:
+            repo.prs_sync_claimed_at = now
+    return repos
+
+
+async def _record_sync_result(repo: Repository, states: dict[int, str], synced_at: datetime | None) -> list[dict]:
+    """조회한 PR 상태와 기준점을 짧은 트랜잭션으로 기록하고 저장소의 동기화 임대를 푼다.
+
+    Args:
+        repo: 맡았던 저장소.
+        states: PR 번호별 GitHub 상태 (``fetch_pr_states`` 결과).
+        synced_at: 새 기준점. None이면 기준점을 그대로 둔다.
+
+    Returns:
+        ``[{"pr_number": ..., "new_state": ...}, ...]`` 상태가 바뀐 PR 목록.
+    """
+    closed = {number: state for number, state in states.items() if state != "open"}
+    updated = []
+    async with session_scope() as session:
+        for new_state in set(closed.values()):
+            numbers = [number for number, state in closed.items() if state == new_state]
+            result = await session.execute(
+                update(PullRequest)
+                .where(
+                    PullRequest.repository_id == repo.id,
+                    PullRequest.pr_number.in_(numbers),
+                    PullRequest.state == "open",
+                )
+                .values(state=new_state)
+                .returning(PullRequest.pr_number)
+            )
+            updated.extend({"pr_number": number, "new_state": new_state} for number in result.scalars().all())
+
+        values: dict = {"prs_sync_claimed_at": None}
+        if synced_at is not None:
+            values["prs_synced_at"] = synced_at
+        await session.execute(update(Repository).where(Repository.id == repo.id).values(**values))
+    return updated
+
+
+async def reconcile_active_repositories(interval_seconds: int, concurrency: int) -> int:
+    """마지막 동기화 후 ``interval_seconds``가 지난 활성 저장소를 동시에 최대 ``concurrency``개씩 동기화한다.
+
+    대상 저장소를 짧은 트랜잭션으로 맡은 뒤, 저장소마다 open PR 번호를 읽고 세션을 닫은 상태에서
+    GitHub를 조회하고, 결과를 다시 짧은 트랜잭션으로 기록한다. GitHub 조회 동안에는 DB 커넥션과
+    행 잠금을 잡지 않는다. 한 저장소의 실패는 다른 저장소에 영향을 주지 않으며, 실패한 저장소는
+    임대를 풀어 다음 주기에 다시 시도한다.
+
+    Args:
+        interval_seconds: 저장소별 최소 동기화 간격 (초).
+        concurrency: 동시에 동기화할 저장소 수.
+
+    Returns:
+        상태가 바뀐 PR 수 합계.
+    """
+    repos = await _claim_due_repositories(interval_seconds)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def sync(repo: Repository) -> int:
+        async with semaphore:
+            started_at = datetime.now(timezone.utc)
+            try:
+                async with async_session_factory() as session:
+                    result = await session.execute(
+                        select(PullRequest.pr_number).where(
+                            PullRequest.repository_id == repo.id,
+                            PullRequest.state == "open",
+                        )
+                    )
+                    open_pr_numbers = list(result.scalars().all())
+
+                states, complete = await fetch_pr_states(repo, open_pr_numbers)
+            except Exception as e:
+                logger.warning(f"{repo.owner}/{repo.name} PR 상태 동기화 실패: {e}")
+                await _record_sync_result(repo, {}, None)
+                return 0
+
+            if not complete:
+                logger.warning(f"{repo.owner}/{repo.name} 일부 PR 조회 실패, 동기화 기준점 유지")
+            updated = await _record_sync_result(
+                repo, states, started_at - WATERMARK_SKEW if complete else None
+            )
+            if updated:
+                logger.info(f"🔄 {repo.owner}/{repo.name} PR 상태 {len(updated)}개 동기화")
+            return len(updated)
+
+    return sum(await asyncio.gather(*(sync(repo) for repo in repos)))
@@ -0,0 +1,253 @@
+"""리뷰 결과를 GitHub에 게시하는 서비스.
+
+리뷰 한 건당 GitHub 쓰기 요청 수를 이슈 수와 관계없이 일정하게 유지한다.
+
+- 요약은 PR 코멘트 하나로 게시하고, 재리뷰 때는 새로 달지 않고 그 코멘트를 수정한다.
+- 라인을 특정한 이슈는 인라인 코멘트로 모아 ``POST /pulls/{n}/reviews`` 한 번으로 제출한다.
+  GitHub 요청 크기 한도를 넘을 때만 여러 리뷰로 나눈다.
+
+게시는 DB에 ``post_status=pending``으로 저장된 리뷰를 대상으로 한다. GitHub 장애로 게시가
+실패하면 리뷰는 pending으로 남고, 워커 주기 작업이 그래프를 다시 실행하지 않고 저장된 결과로
+재게시한다.
+"""
+import json
+
+import httpx
+from loguru import logger
+
+from app.config import settings
+from app.database import async_session_factory, session_scope
+from app.github import github_client
+from app.github.diff_parser import commentable_lines
+from app.models import FileChange
+from app.services.review_service import (
+    REVIEW_POST_PENDING,
+    REVIEW_POST_POSTED,
+    claim_pending_review_posts,
+    get_review_post,
+    record_review_post,
+)
+
+# GitHub 코멘트 본문 최대 길이
+COMMENT_BODY_MAX_CHARS = 65536
+# 리뷰 요청 하나의 JSON 본문 크기 상한 (GitHub 요청 크기 한도보다 여유 있게)
+REVIEW_PAYLOAD_MAX_CHARS = 512 * 1024
+
+_SEVERITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+def _format_issue(issue: dict) -> str:
+    severity = str(issue.get("severity", "low")).lower()
+    header = f"{_SEVERITY_EMOJI.get(severity, '🟢')} **[{severity.upper()}] {issue.get('type', 'issue')}**"
+    if issue.get("skill"):
+        header += f" · {issue['skill']}"
+    body = f"{header}\n\n{issue.get('message', '')}"
+    if issue.get("suggestion"):
+        body += f"\n\n💡 {issue['suggestion']}"
+    return body[:COMMENT_BODY_MAX_CHARS]
+
+
+def build_inline_comments(file_reviews: list[dict], files: list[FileChange]) -> list[dict]:
+    """파일 리뷰의 이슈 중 diff 안의 라인을 가리키는 것을 인라인 코멘트로 바꾼다.
+
+    ``line``이 없거나 diff hunk 밖(코멘트를 달 수 없는 라인)인 이슈는 요약에만 남긴다.
+
+    Args:
+        file_reviews: 파일별 리뷰 결과 (``issues``의 각 항목에 ``line``이 있을 수 있음).
+        files: PR 변경 파일 목록 (patch로 코멘트 가능한 라인을 계산).
+
+    Returns:
+        리뷰 API의 ``comments`` 항목 목록 (``path``, ``line``, ``side``, ``body``).
+    """
+    patches = {f.filename: f.patch for f in files}
+    comments = []
+    for file_review in file_reviews:
+        filename = file_review.get("filename")
+        if filename not in patches:
+            continue
+        allowed = commentable_lines(patches[filename])
+        for issue in file_review.get("issues", []):
+            if not isinstance(issue, dict):
+                continue
+            line = issue.get("line")
+            if isinstance(line, str) and line.isdigit():
+                line = int(line)
+            if not isinstance(line, int) or line not in allowed:
+                continue
+            comments.append({"path": filename, "line": line, "side": "RIGHT", "body": _format_issue(issue)})
+    return comments
+
+
+def _split_comments(comments: list[dict], max_comments: int) -> list[list[dict]]:
+    """코멘트를 리뷰 하나당 개수/요청 크기 한도에 맞게 나눈다."""
+    batches: list[list[dict]] = []
+    batch: list[dict] = []
+    size = 0
+    for comment in comments:
+        comment_size = len(json.dumps(comment, ensure_ascii=False))
+        if batch and (len(batch) >= max_comments or size + comment_size > REVIEW_PAYLOAD_MAX_CHARS):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(comment)
+        size += comment_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def post_summary_comment(
+    installation_id: str,
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    body: str,
+    summary_comment_id: int | None = None,
+) -> int:
+    """리뷰 요약 코멘트를 게시한다. 이전 요약 코멘트가 있으면 그 내용을 수정한다.
+
+    Args:
+        installation_id: GitHub App Installation ID.
+        repo_owner: 저장소 소유자.
+        repo_name: 저장소 이름.
+        pr_number: PR 번호.
+        body: 요약 본문.
+        summary_comment_id: 이전 리뷰에서 게시한 요약 코멘트 ID.
+
+    Returns:
+        요약 코멘트 ID (수정했으면 기존 ID, 새로 작성했으면 새 ID).
+
+    Raises:
+        httpx.HTTPStatusError: GitHub API 호출이 실패한 경우
+    """
+    body = body[:COMMENT_BODY_MAX_CHARS]
+    if summary_comment_id is not None:
+        try:
+            await github_client.update_issue_comment(
+                installation_id, repo_owner, repo_name, summary_comment_id, body
+            )
+            return summary_comment_id
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != httpx.codes.NOT_FOUND:
+                raise
+            logger.info(f"이전 요약 코멘트 {summary_comment_id}가 삭제되어 새로 작성합니다")
+
+    comment = await github_client.create_pr_comment(
+        installation_id=installation_id,
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        pull_number=pr_number,
+        comment_body=body,
+    )
+    return comment["id"]
+
+
+async def post_inline_review(
+    installation_id: str,
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    head_sha: str,
+    comments: list[dict],
+) -> int:
+    """인라인 코멘트를 리뷰로 묶어 제출한다. 실패해도 예외를 던지지 않는다.
+
+    이슈는 요약 코멘트에도 모두 포함되므로, 인라인 게시 실패(diff가 바뀌어 라인이
+    맞지 않는 422 등)는 경고만 남긴다. 전송 오류나 ``CircuitOpenError``도 그 배치만 포기하고
+    다음 배치로 넘어간다. 예외를 올리면 리뷰가 게시 대기로 남아, 재시도 때 이미 제출한 앞
+    배치를 다시 게시하기 때문이다.
+
+    Args:
+        installation_id: GitHub App Installation ID.
+        repo_owner: 저장소 소유자.
+        repo_name: 저장소 이름.
+        pr_number: PR 번호.
+        head_sha: 리뷰한 커밋 SHA (라인 번호 기준).
+        comments: ``build_inline_comments`` 결과.
+
+    Returns:
+        게시에 성공한 인라인 코멘트 수.
+    """
+    batches = _split_comments(comments, settings.github_review_max_comments)
+    posted = 0
+    for index, batch in enumerate(batches, start=1):
+        body = f"🔍 AI 코드 리뷰 인라인 코멘트 {len(batch)}개 (전체 요약은 PR 코멘트를 확인하세요)"
+        if len(batches) > 1:
+            body += f" [{index}/{len(batches)}]"
+        try:
+            await github_client.create_review(
+                installation_id, repo_owner, repo_name, pr_number, head_sha, body, batch
+            )
+            posted += len(batch)
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"PR #{pr_number} 인라인 리뷰 게시 실패 ({e.response.status_code}): {e.response.text[:200]}")
+        except Exception as e:
+            logger.warning(f"PR #{pr_number} 인라인 리뷰 [{index}/{len(batches)}] 게시 실패: {type(e).__name__}: {e}")
+    return posted
+
+
+async def publish_review(review_id: int) -> str | None:
+    """저장된 리뷰를 GitHub에 게시하고 결과를 기록한다. 실패해도 예외를 던지지 않는다.
+
+    요약 코멘트를 게시(또는 이전 요약 코멘트를 수정)한 뒤 인라인 코멘트를 리뷰로 제출한다.
+    GitHub 호출 동안에는 DB 커넥션을 잡지 않는다.
+
+    Args:
+        review_id: 게시할 Review PK (``post_status=pending``).
+
+    Returns:
+        기록한 ``post_status``. 리뷰가 없거나 이미 게시가 끝났으면 None.
+    """
+    async with async_session_factory() as session:
+        loaded = await get_review_post(session, review_id)
+    if loaded is None or loaded[0].post_status != REVIEW_POST_PENDING:
+        return None
+    review, pr, repo = loaded
+
+    summary_comment_id = None
+    error = None
+    try:
+        summary_comment_id = await post_summary_comment(
+            repo.installation_id,
+            repo.owner,
+            repo.name,
+            pr.pr_number,
+            review.final_review or "리뷰 생성 실패",
+            pr.summary_comment_id,
+        )
+        if review.inline_comments:
+            posted = await post_inline_review(
+                repo.installation_id, repo.owner, repo.name, pr.pr_number, review.head_sha, review.inline_comments
+            )
+            logger.info(f"💬 인라인 코멘트 {posted}/{len(review.inline_comments)}개 게시")
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    async with session_scope() as session:
+        status = await record_review_post(
+            session, review_id, summary_comment_id, error, settings.review_post_max_attempts
+        )
+    if status == REVIEW_POST_POSTED:
+        logger.info(f"💬 {repo.owner}/{repo.name} PR #{pr.pr_number} 리뷰 게시 완료 (review={review_id})")
+    else:
+        logger.warning(
+            f"{repo.owner}/{repo.name} PR #{pr.pr_number} 리뷰 게시 실패 → {status} (review={review_id}): {error}"
+        )
+    return status
+
+
+async def retry_pending_review_posts(limit: int = 20) -> int:
+    """게시가 끝나지 않은 리뷰를 가져가 다시 게시한다.
+
+    Args:
+        limit: 한 번에 재게시할 최대 리뷰 수.
+
+    Returns:
+        게시에 성공한 리뷰 수.
+    """
+    async with session_scope() as session:
+        review_ids = await claim_pending_review_posts(session, settings.review_post_retry_delay_seconds, limit)
+    posted = 0
+    for review_id in review_ids:
+        if await publish_review(review_id) == REVIEW_POST_POSTED:
+            posted += 1
+    return posted
@@ -0,0 +1,561 @@
+"""Postgres 기반 리뷰 작업 큐 서비스.
+
+웹훅은 ``enqueue_review_job``으로 작업 row만 등록하고 즉시 응답하며,
+워커는 ``claim_next_review_job``으로 ``SELECT … FOR UPDATE SKIP LOCKED``
+방식으로 작업을 하나씩 가져가 실행한다.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import ColumnElement, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import ReviewJob
+from app.services.fair_share import InstallationLimits, is_installation_blocked, pick_fair_share_job
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_SUPERSEDED = "superseded"
+
+ACTIVE_JOB_STATUSES = (JOB_PENDING, JOB_RUNNING)
+
+# 작업 claim을 워커 간 직렬화하는 advisory lock 키 (installation별 동시 실행 한도를 정확히 지키기 위함)
+CLAIM_ADVISORY_LOCK_KEY = 0x5245_5649  # "REVI"
+# 공정 분배 시 한 번에 검토하는 installation 수 (installation마다 최우선 대기 작업 하나씩)
+CLAIM_CANDIDATE_LIMIT = 50
+
+# 트리거 출처별 기본 우선순위 (클수록 먼저 실행)
+TRIGGER_PRIORITIES = {
+    "re_review_command": 3,
+    "ready_for_review": 2,
+    "push": 1,
+    "label_removed": 0,
+}
+
+
+def job_priority(trigger_source: str, triage_priority: int | None = None) -> int:
+    """트리거 출처와 PR 트리아지 우선순위로 작업 우선순위를 계산합니다.
+
+    Args:
+        trigger_source: 리뷰 트리거 출처.
+        triage_priority: ``PullRequest.triage_priority`` 값 (없으면 None).
+
+    Returns:
+        작업 우선순위. 값이 클수록 먼저 실행됩니다.
+    """
+    return TRIGGER_PRIORITIES.get(trigger_source, 0) + (triage_priority or 0)
+
+
+async def enqueue_review_job(
+    session: AsyncSession,
+    installation_id: str,
+    github_repo_id: int,
+    github_pr_id: int,
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    head_sha: str | None = None,
+    trigger_source: str = "push",
+    delay_seconds: int = 0,
+    priority: int = 0,
+) -> ReviewJob | None:
+    """리뷰 작업을 큐에 등록합니다.
+
+    같은 (저장소, PR, head_sha)에 대기/실행 중인 작업이 이미 있으면 등록하지 않습니다.
+    ``uq_review_jobs_active_head`` 부분 유니크 인덱스와 ``ON CONFLICT DO NOTHING``으로
+    동시에 들어온 웹훅 사이에서도 하나만 등록됩니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        installation_id: GitHub App Installation ID.
+        github_repo_id: GitHub 저장소 ID.
+        github_pr_id: GitHub PR ID.
+        repo_owner: 저장소 소유자 login.
+        repo_name: 저장소 이름.
+        pr_number: PR 번호.
+        head_sha: 리뷰 대상 HEAD 커밋 SHA.
+        trigger_source: 리뷰 트리거 출처.
+        delay_seconds: 이 시간(초)이 지난 뒤에 워커가 가져가도록 지연 (debounce).
+        priority: 작업 우선순위 (``job_priority`` 참고).
+
+    Returns:
+        새로 등록된 ReviewJob 인스턴스 (status=pending). 이미 진행 중인 작업이 있으면 None.
+    """
+    values = {
+        "installation_id": installation_id,
+        "github_repo_id": github_repo_id,
+        "github_pr_id": github_pr_id,
+        "repo_owner": repo_owner,
+        "repo_name": repo_name,
+        "pr_number": pr_number,
+        "head_sha": head_sha,
+        "trigger_source": trigger_source,
+        "status": JOB_PENDING,
+        "priority": priority,
+    }
+    if delay_seconds > 0:
+        values["run_after"] = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+
+    return await session.scalar(
+        insert(ReviewJob)
+        .values(**values)
+        .on_conflict_do_nothing(
+            index_elements=["github_repo_id", "pr_number", "head_sha"],
+            index_where=text("status IN ('pending', 'running')"),
+        )
+        .returning(ReviewJob)
+    )
+
+
+async def find_active_review_job(
+    session: AsyncSession,
+    github_repo_id: int,
+    pr_number: int,
+    head_sha: str,
+) -> ReviewJob | None:
+    """같은 (저장소, PR, head_sha)로 대기/실행 중인 작업을 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        github_repo_id: GitHub 저장소 ID.
+        pr_number: PR 번호.
+        head_sha: 커밋 SHA.
+
+    Returns:
+        진행 중인 ReviewJob. 없으면 None.
+    """
+    result = await session.execute(
+        select(ReviewJob)
+        .where(
+            ReviewJob.github_repo_id == github_repo_id,
+            ReviewJob.pr_number == pr_number,
+            ReviewJob.head_sha == head_sha,
+            ReviewJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def supersede_review_jobs(
+    session: AsyncSession,
+    github_repo_id: int,
+    pr_number: int,
+    head_sha: str,
+) -> int:
+    """같은 PR의 다른 head_sha를 대상으로 하는 대기/실행 중 작업을 superseded로 표시합니다.
+
+    pending 작업은 워커가 더 이상 가져가지 않고, running 작업은 워커가 상태 변경을
+    감지해 실행을 취소합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        github_repo_id: GitHub 저장소 ID.
+        pr_number: PR 번호.
+        head_sha: 새로 등록되는 최신 HEAD 커밋 SHA.
+
+    Returns:
+        superseded로 전환된 작업 수.
+    """
+    result = await session.execute(
+        update(ReviewJob)
+        .where(
+            ReviewJob.github_repo_id == github_repo_id,
+            ReviewJob.pr_number == pr_number,
+            ReviewJob.status.in_(ACTIVE_JOB_STATUSES),
+            or_(ReviewJob.head_sha.is_(None), ReviewJob.head_sha != head_sha),
+        )
+        .values(
+            status=JOB_SUPERSEDED,
+            finished_at=datetime.now(timezone.utc),
+        )
+    )
+    return result.rowcount
+
+
+async def bump_review_job_priority(
+    session: AsyncSession,
+    github_repo_id: int,
+    pr_number: int,
+    boost: int,
+) -> int:
+    """같은 PR의 대기 중인 작업 우선순위를 ``boost``만큼 올립니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        github_repo_id: GitHub 저장소 ID.
+        pr_number: PR 번호.
+        boost: 더할 우선순위 값.
+
+    Returns:
+        우선순위가 변경된 작업 수.
+    """
+    result = await session.execute(
+        update(ReviewJob)
+        .where(
+            ReviewJob.github_repo_id == github_repo_id,
+            ReviewJob.pr_number == pr_number,
+            ReviewJob.status == JOB_PENDING,
+        )
+        .values(priority=ReviewJob.priority + boost)
+    )
+    return result.rowcount
+
+
+async def get_review_job_status(session: AsyncSession, job_id: int) -> str | None:
+    """작업의 현재 상태를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        job_id: ReviewJob PK.
+
+    Returns:
+        상태 문자열. 작업이 없으면 None.
+    """
+    return await session.scalar(select(ReviewJob.status).where(ReviewJob.id == job_id))
+
+
+async def count_running_jobs_by_installation(session: AsyncSession) -> dict[str, int]:
+    """installation별 실행 중인 작업 수를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+
+    Returns:
+        {installation_id: 실행 중 작업 수}.
+    """
+    result = await session.execute(
+        select(ReviewJob.installation_id, func.count())
+        .where(ReviewJob.status == JOB_RUNNING)
+        .group_by(ReviewJob.installation_id)
+    )
+    return {installation_id: count for installation_id, count in result.all()}
+
+
+async def tokens_used_today_by_installation(session: AsyncSession) -> dict[str, int]:
+    """대기 작업이 있는 installation별로 오늘(UTC) 사용한 LLM 토큰 수를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+
+    Returns:
+        {installation_id: 오늘 사용한 토큰 수}.
+    """
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    pending_installations = (
+        select(ReviewJob.installation_id).where(ReviewJob.status == JOB_PENDING).distinct()
+    )
+    result = await session.execute(
+        select(ReviewJob.installation_id, func.coalesce(func.sum(ReviewJob.tokens_used), 0))
+        .where(
+            ReviewJob.started_at >= today,
+            ReviewJob.installation_id.in_(pending_installations),
+        )
+        .group_by(ReviewJob.installation_id)
+    )
+    return {installation_id: int(tokens) for installation_id, tokens in result.all()}
+
+
+async def count_pending_review_jobs(session: AsyncSession) -> int:
+    """대기 중인 작업 수(큐 깊이)를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+
+    Returns:
+        pending 상태 작업 수.
+    """
+    return await session.scalar(
+        select(func.count()).select_from(ReviewJob).where(ReviewJob.status == JOB_PENDING)
+    ) or 0
+
+
+async def get_queue_stats(session: AsyncSession) -> dict:
+    """큐 상태(대기/실행 중 작업 수, 가장 오래 기다린 작업의 대기 시간)를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+
+    Returns:
+        ``{"pending": int, "running": int, "oldest_pending_seconds": float}``.
+    """
+    result = await session.execute(
+        select(
+            func.count().filter(ReviewJob.status == JOB_PENDING),
+            func.count().filter(ReviewJob.status == JOB_RUNNING),
+            func.min(ReviewJob.run_after).filter(ReviewJob.status == JOB_PENDING),
+        ).where(ReviewJob.status.in_(ACTIVE_JOB_STATUSES))
+    )
+    pending, running, oldest_run_after = result.one()
+    oldest_pending_seconds = 0.0
+    if oldest_run_after is not None:
+        oldest_pending_seconds = max(
+            (datetime.now(timezone.utc) - oldest_run_after).total_seconds(), 0.0
+        )
+    return {
+        "pending": pending,
+        "running": running,
+        "oldest_pending_seconds": oldest_pending_seconds,
+    }
+
+
+async def heartbeat_review_job(session: AsyncSession, job_id: int) -> str | None:
+    """실행 중인 작업의 heartbeat 시각을 갱신하고 현재 상태를 반환합니다.
+
+    ``requeue_stale_review_jobs``는 heartbeat가 끊긴 작업을 워커 비정상 종료로 판단합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        job_id: ReviewJob PK.
+
+    Returns:
+        상태 문자열. 작업이 없으면 None.
+    """
+    return await session.scalar(
+        update(ReviewJob)
+        .where(ReviewJob.id == job_id)
+        .values(heartbeat_at=func.now())
+        .returning(ReviewJob.status)
+    )
+
+
+async def claim_next_review_job(
+    session: AsyncSession,
+    worker_id: str,
+    aging_seconds: int,
+    limits_for: Callable[[str], InstallationLimits] | None = None,
+    max_running: int = 0,
+) -> ReviewJob | None:
+    """실행 가능한 다음 작업을 가져와 running 상태로 전환합니다.
+
+    우선순위가 높은 작업부터 가져가되, 대기한 시간 ``aging_seconds``마다 우선순위가
+    1씩 오르는 것으로 계산해 낮은 우선순위 작업도 결국 실행되도록 합니다 (aging).
+    ``limits_for``가 주어지면 installation별 동시 실행/일일 토큰 한도에 도달한 installation을
+    제외하고, 남은 후보 중 실행 중 작업 수/가중치가 가장 작은 installation의 작업을 고릅니다.
+    ``max_running``이 주어지면 전체 워커를 합친 실행 중 작업 수가 한도에 도달했을 때
+    작업을 가져가지 않습니다 (admission control).
+    ``FOR UPDATE SKIP LOCKED``로 다른 워커가 잡고 있는 row는 건너뛰므로
+    여러 워커 프로세스가 동시에 호출해도 같은 작업을 중복 실행하지 않습니다.
+    호출자가 commit해야 잠금이 풀리고 상태 변경이 확정됩니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        worker_id: 작업을 가져가는 워커 식별자.
+        aging_seconds: 우선순위가 1 오르는 데 필요한 대기 시간(초).
+        limits_for: installation ID → InstallationLimits 조회 함수. None이면 공정 분배 없이
+            우선순위만으로 고릅니다.
+        max_running: 전체 워커 합산 동시 실행 한도 (0이면 무제한).
+
+    Returns:
+        running으로 전환된 ReviewJob. 실행 가능한 작업이 없으면 None.
+    """
+    waited_seconds = func.extract("epoch", func.now() - ReviewJob.run_after)
+    effective_priority = ReviewJob.priority + waited_seconds / max(aging_seconds, 1)
+    runnable = (ReviewJob.status == JOB_PENDING, ReviewJob.run_after <= func.now())
+    query = (
+        select(ReviewJob)
+        .where(*runnable)
+        .order_by(effective_priority.desc(), ReviewJob.run_after, ReviewJob.id)
+        .with_for_update(skip_locked=True)
+    )
+
+    if limits_for is None and max_running <= 0:
+        result = await session.execute(query.limit(1))
+        job = result.scalar_one_or_none()
+    else:
+        # 실행 중 작업 수를 센 뒤 claim하기까지 다른 워커가 끼어들지 않도록 트랜잭션 단위로 직렬화
+        await session.execute(select(func.pg_advisory_xact_lock(CLAIM_ADVISORY_LOCK_KEY)))
+        running = await count_running_jobs_by_installation(session)
+        if max_running > 0 and sum(running.values()) >= max_running:
+            return None
+        if limits_for is None:
+            result = await session.execute(query.limit(1))
+            job = result.scalar_one_or_none()
+        else:
+            job = await _pick_fair_share_candidate(session, runnable, effective_priority, running, limits_for)
+
+    if job is None:
+        return None
+
+    job.status = JOB_RUNNING
+    job.attempts += 1
+    job.started_at = datetime.now(timezone.utc)
+    job.heartbeat_at = job.started_at
+    job.locked_by = worker_id
+    await session.flush()
+    return job
+
+
+async def _pick_fair_share_candidate(
+    session: AsyncSession,
+    runnable: tuple,
+    effective_priority: ColumnElement,
+    running: dict[str, int],
+    limits_for: Callable[[str], InstallationLimits],
+) -> ReviewJob | None:
+    """installation마다 최우선 대기 작업 하나를 후보로 뽑아 공정 분배 기준으로 작업을 고릅니다.
+
+    대기 작업이 많은 installation이 후보를 모두 차지해 다른 installation이 보이지 않는 일이
+    없도록, 후보는 ``row_number() OVER (PARTITION BY installation_id)``로 installation별
+    1순위 작업만 추립니다. 한도에 도달한 installation은 제외합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        runnable: 실행 가능한 대기 작업 조건.
+        effective_priority: aging을 반영한 작업 우선순위 식.
+        running: installation별 실행 중 작업 수.
+        limits_for: installation ID → InstallationLimits 조회 함수.
+
+    Returns:
+        선택된 ReviewJob. 후보가 없으면 None.
+    """
+    tokens_today = await tokens_used_today_by_installation(session)
+    blocked = [
+        installation_id
+        for installation_id in set(running) | set(tokens_today)
+        if is_installation_blocked(
+            limits_for(installation_id),
+            running.get(installation_id, 0),
+            tokens_today.get(installation_id, 0),
+        )
+    ]
+    conditions = list(runnable)
+    if blocked:
+        conditions.append(ReviewJob.installation_id.notin_(blocked))
+
+    # installation별 1순위 작업 (윈도 함수와 FOR UPDATE는 함께 쓸 수 없어 잠금은 따로 건다)
+    ranked = (
+        select(
+            ReviewJob.id,
+            ReviewJob.run_after,
+            effective_priority.label("effective_priority"),
+            func.row_number()
+            .over(
+                partition_by=ReviewJob.installation_id,
+                order_by=(effective_priority.desc(), ReviewJob.run_after, ReviewJob.id),
+            )
+            .label("rank"),
+        )
+        .where(*conditions)
+        .subquery()
+    )
+    heads = (
+        select(ranked.c.id)
+        .where(ranked.c.rank == 1)
+        .order_by(ranked.c.effective_priority.desc(), ranked.c.run_after, ranked.c.id)
+        .limit(CLAIM_CANDIDATE_LIMIT)
+    )
+    head_ids = list((await session.execute(heads)).scalars().all())
+    if not head_ids:
+        return None
+
+    result = await session.execute(
+        select(ReviewJob)
+        .where(ReviewJob.id.in_(head_ids), ReviewJob.status == JOB_PENDING)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = {job.id: job for job in result.scalars().all()}
+    candidates = [jobs[job_id] for job_id in head_ids if job_id in jobs]
+    return pick_fair_share_job(candidates, running, limits_for)
+
+
+async def add_review_job_tokens(session: AsyncSession, job_id: int, tokens: int) -> None:
+    """작업이 사용한 LLM 토큰 수를 누적합니다 (재시도 포함).
+
+    Args:
+        session: 비동기 DB 세션.
+        job_id: ReviewJob PK.
+        tokens: 이번 실행에서 사용한 토큰 수.
+    """
+    await session.execute(
+        update(ReviewJob)
+        .where(ReviewJob.id == job_id)
+        .values(tokens_used=ReviewJob.tokens_used + tokens)
+    )
+
+
+async def complete_review_job(session: AsyncSession, job_id: int) -> None:
+    """작업을 성공 상태로 표시합니다. 실행 중 superseded로 바뀐 작업은 건드리지 않습니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        job_id: ReviewJob PK.
+    """
+    await session.execute(
+        update(ReviewJob)
+        .where(ReviewJob.id == job_id, ReviewJob.status == JOB_RUNNING)
+        .values(
+            status=JOB_SUCCEEDED,
+            finished_at=datetime.now(timezone.utc),
+            last_error=None,
+        )
+    )
+
+
+async def fail_review_job(
+    session: AsyncSession,
+    job_id: int,
+    error: str,
+    max_attempts: int,
+    retry_delay_seconds: int,
+) -> str:
+    """작업 실패를 기록합니다. 시도 횟수가 남아 있으면 지연 후 재시도하도록 되돌립니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        job_id: ReviewJob PK.
+        error: 실패 메시지.
+        max_attempts: 최대 시도 횟수.
+        retry_delay_seconds: 재시도 기본 지연 (시도 횟수에 비례해 증가).
+
+    Returns:
+        변경된 상태 (``"pending"`` 또는 ``"failed"``). 이미 superseded된 작업은 그대로 반환합니다.
+    """
+    job = await session.get(ReviewJob, job_id)
+    if job is None:
+        return JOB_FAILED
+    if job.status != JOB_RUNNING:
+        return job.status
+
+    job.last_error = error[:2000]
+    job.locked_by = None
+    if job.attempts < max_attempts:
+        job.status = JOB_PENDING
+        job.run_after = datetime.now(timezone.utc) + timedelta(
+            seconds=retry_delay_seconds * job.attempts
+        )
+    else:
+        job.status = JOB_FAILED
+        job.finished_at = datetime.now(timezone.utc)
+    await session.flush()
+    return job.status
+
+
+async def requeue_stale_review_jobs(
+    session: AsyncSession,
+    stale_after_seconds: int,
+) -> int:
+    """heartbeat가 끊긴 채 running 상태로 남은 작업(워커 비정상 종료 등)을 pending으로 되돌립니다.
+
+    되돌린 작업은 다음 실행 시 LanGraph 체크포인트에서 이어서 진행됩니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        stale_after_seconds: 마지막 heartbeat(없으면 시작 시각) 이후 이 시간이 지나면 비정상으로 판단.
+
+    Returns:
+        되돌린 작업 수.
+    """
+    threshold = datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)
+    result = await session.execute(
+        update(ReviewJob)
+        .where(
+            ReviewJob.status == JOB_RUNNING,
+            func.coalesce(ReviewJob.heartbeat_at, ReviewJob.started_at) < threshold,
+        )
+        .values(status=JOB_PENDING, locked_by=None)
+    )
+    return result.rowcount
@@ -1,13 +1,20 @@
 """리뷰 결과 영속화 서비스."""
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, update
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import PullRequest, Repository, Review, ReviewComment
 from app.github import github_client
 from app.models import PRData
 
+# Review.post_status 값
+REVIEW_POST_PENDING = "pending"
+REVIEW_POST_POSTED = "posted"
+REVIEW_POST_FAILED = "failed"
+# post_error에 남길 실패 사유 최대 길이
+POST_ERROR_MAX_CHARS = 2000
+
 
 async def upsert_repository(
     session: AsyncSession,
@@ -324,9 +331,13 @@ async def persist_review_result(
     pr_data: PRData,
     review_result: dict,
     trigger_source: str = "push",
+    inline_comments: list[dict] | None = None,
 ) -> Review:
     """리뷰 결과 전체를 DB에 영속화하는 진입점.
 
+    리뷰는 GitHub 게시 전에 ``post_status=pending``으로 저장한다. 게시가 실패해도 그래프를
+    다시 실행하지 않고 저장된 결과로 재게시할 수 있다.
+
     실행 순서:
     1. repositories upsert
     2. pull_requests upsert
@@ -340,6 +351,8 @@ async def persist_review_result(
         github_pr_id: webhook payload["pull_request"]["id"].
         pr_data: PR 수집 결과 (PRData 인스턴스).
         review_result: LangGraph run_review() 반환 dict.
+        trigger_source: 리뷰 트리거 출처.
+        inline_comments: 게시할 인라인 코멘트 목록 (``build_inline_comments`` 결과).
 
     Returns:
         새로 생성된 Review 인스턴스.
@@ -370,6 +383,8 @@ async def persist_review_result(
         review_result=review_result,
         trigger_source=trigger_source,
     )
+    review.post_status = REVIEW_POST_PENDING
+    review.inline_comments = inline_comments or []
 
     await save_review_comments(
         session,
@@ -409,6 +424,103 @@ async def get_most_recent_review(
     return result.scalar_one_or_none()
 
 
+async def get_review_post(
+    session: AsyncSession,
+    review_id: int,
+) -> tuple[Review, PullRequest, Repository] | None:
+    """GitHub 게시에 필요한 리뷰, PR, 저장소를 함께 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        review_id: Review PK.
+
+    Returns:
+        ``(review, pull_request, repository)``. 리뷰가 없으면 None.
+    """
+    result = await session.execute(
+        select(Review, PullRequest, Repository)
+        .join(PullRequest, Review.pull_request_id == PullRequest.id)
+        .join(Repository, PullRequest.repository_id == Repository.id)
+        .where(Review.id == review_id)
+    )
+    row = result.one_or_none()
+    return tuple(row) if row is not None else None
+
+
+async def claim_pending_review_posts(
+    session: AsyncSession,
+    retry_delay_seconds: int,
+    limit: int,
+) -> list[int]:
+    """게시가 끝나지 않은 채 ``retry_delay_seconds`` 이상 지난 리뷰를 재게시 대상으로 가져갑니다.
+
+    가져간 리뷰의 ``updated_at``을 현재 시각으로 바꿔, 다른 워커가 같은 리뷰를 다시 가져가지
+    않게 합니다. commit은 호출자가 합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        retry_delay_seconds: 마지막 게시 시도(또는 저장) 이후 최소 대기 시간 (초).
+        limit: 한 번에 가져갈 최대 리뷰 수.
+
+    Returns:
+        가져간 Review PK 목록.
+    """
+    threshold = datetime.now(timezone.utc) - timedelta(seconds=retry_delay_seconds)
+    due = (
+        select(Review.id)
+        .where(Review.post_status == REVIEW_POST_PENDING, Review.updated_at < threshold)
+        .order_by(Review.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(
+        update(Review)
+        .where(Review.id.in_(due.scalar_subquery()))
+        .values(updated_at=func.now())
+        .returning(Review.id)
+    )
+    return sorted(result.scalars().all())
+
+
+async def record_review_post(
+    session: AsyncSession,
+    review_id: int,
+    summary_comment_id: int | None,
+    error: str | None,
+    max_attempts: int,
+) -> str:
+    """GitHub 게시 시도 결과를 기록합니다.
+
+    요약 코멘트를 게시했으면 실패하더라도 그 ID를 PR에 남겨, 재시도 때 새 코멘트를 만들지 않고
+    같은 코멘트를 수정하게 합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        review_id: Review PK.
+        summary_comment_id: 게시한 요약 코멘트 ID (게시하지 못했으면 None).
+        error: 실패 사유 (성공했으면 None).
+        max_attempts: 최대 게시 시도 횟수. 실패한 채 도달하면 failed로 포기합니다.
+
+    Returns:
+        기록한 ``post_status``.
+    """
+    review = await session.get(Review, review_id)
+    review.post_attempts += 1
+    if summary_comment_id is not None:
+        await session.execute(
+            update(PullRequest)
+            .where(PullRequest.id == review.pull_request_id)
+            .values(summary_comment_id=summary_comment_id)
+        )
+    if error is None:
+        review.post_status = REVIEW_POST_POSTED
+        review.post_error = None
+    else:
+        review.post_error = error[:POST_ERROR_MAX_CHARS]
+        review.post_status = REVIEW_POST_FAILED if review.post_attempts >= max_attempts else REVIEW_POST_PENDING
+    return review.post_status
+
+
 async def review_exists_for_head_sha(
     session: AsyncSession,
     github_repo_id: int,
@@ -440,6 +552,61 @@ async def review_exists_for_head_sha(
     return result.scalar_one_or_none() is not None
 
 
+async def get_pr_scheduling_hints(
+    session: AsyncSession,
+    github_repo_id: int,
+    pr_number: int,
+) -> tuple[int | None, str | None]:
+    """리뷰 작업 스케줄링에 쓰는 PR의 트리아지 우선순위와 직전 위험도를 조회합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        github_repo_id: GitHub 저장소 ID.
+        pr_number: PR 번호.
+
+    Returns:
+        ``(triage_priority, risk_level)``. PR이 없으면 ``(None, None)``.
+    """
+    result = await session.execute(
+        select(PullRequest.triage_priority, PullRequest.risk_level)
+        .join(Repository, PullRequest.repository_id == Repository.id)
+        .where(
+            Repository.github_repo_id == github_repo_id,
+            PullRequest.pr_number == pr_number,
+        )
+    )
+    row = result.first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+async def raise_pr_triage_priority(
+    session: AsyncSession,
+    github_repo_id: int,
+    pr_number: int,
+    priority: int,
+) -> None:
+    """PR의 트리아지 우선순위를 최소 ``priority``로 올립니다. 이미 더 높으면 유지합니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        github_repo_id: GitHub 저장소 ID.
+        pr_number: PR 번호.
+        priority: 설정할 최소 우선순위.
+    """
+    repo_ids = select(Repository.id).where(Repository.github_repo_id == github_repo_id)
+    await session.execute(
+        update(PullRequest)
+        .where(
+            PullRequest.repository_id.in_(repo_ids.scalar_subquery()),
+            PullRequest.pr_number == pr_number,
+            or_(PullRequest.triage_priority.is_(None), PullRequest.triage_priority < priority),
+        )
+        .values(triage_priority=priority)
+    )
+
+
 async def recalculate_effective_risk(
     session: AsyncSession,
     review_id: int,
@@ -1,4 +1,13 @@
-from .dispatcher import dispatch_event
+from .deliveries import recent_deliveries
+from .dispatcher import dispatch_event, is_handled_action, is_handled_event, may_enqueue_review, peek_action
 from .validator import verify_webhook_signature
 
-__all__ = ["dispatch_event", "verify_webhook_signature"]
+__all__ = [
+    "dispatch_event",
+    "is_handled_action",
+    "is_handled_event",
+    "may_enqueue_review",
+    "peek_action",
+    "recent_deliveries",
+    "verify_webhook_signature",
+]
@@ -0,0 +1,57 @@
+"""최근 처리한 웹훅 delivery ID의 인메모리 LRU 캐시."""
+import time
+from collections import OrderedDict
+
+from app.config import settings
+
+
+class RecentDeliveryCache:
+    """TTL이 있는 크기 제한 LRU. DB 조회 없이 재전송된 delivery를 걸러낸다.
+
+    프로세스 로컬 캐시이므로 다른 API 파드가 처리한 delivery는 알지 못한다.
+    최종 판단은 ``webhook_deliveries`` 테이블이 담당하고, 이 캐시는 그 앞단에서
+    같은 파드로 들어온 재전송을 DB 왕복 없이 차단하는 용도다.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, delivery_id: str) -> bool:
+        """delivery ID가 캐시에 있고 만료되지 않았는지 확인한다.
+
+        Args:
+            delivery_id: ``X-GitHub-Delivery`` 헤더 값.
+
+        Returns:
+            최근 처리된 delivery면 True.
+        """
+        seen_at = self._entries.get(delivery_id)
+        if seen_at is None:
+            return False
+        if time.monotonic() - seen_at > self.ttl_seconds:
+            del self._entries[delivery_id]
+            return False
+        self._entries.move_to_end(delivery_id)
+        return True
+
+    def add(self, delivery_id: str) -> None:
+        """delivery ID를 기록하고, 크기를 넘으면 가장 오래된 항목부터 버린다.
+
+        Args:
+            delivery_id: ``X-GitHub-Delivery`` 헤더 값.
+        """
+        self._entries[delivery_id] = time.monotonic()
+        self._entries.move_to_end(delivery_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+recent_deliveries = RecentDeliveryCache(
+    maxsize=settings.webhook_delivery_cache_size,
+    ttl_seconds=settings.webhook_delivery_ttl_hours * 3600,
+)
@@ -1,8 +1,90 @@
 """GitHub 웹훅 이벤트 디스패처."""
+import re
+
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .handlers import handle_installation, handle_installation_repositories, handle_issue_comment, handle_pull_request
+from .handlers.pull_request import SKIP_REVIEW_LABELS
+
+# 이벤트별로 핸들러가 실제 처리하는 action. 여기 없는 이벤트/액션은 본문 파싱과 DB 접근 없이 버린다.
+HANDLED_ACTIONS: dict[str, frozenset[str]] = {
+    "pull_request": frozenset(
+        {"opened", "synchronize", "closed", "ready_for_review", "labeled", "unlabeled"}
+    ),
+    "installation": frozenset({"created", "deleted"}),
+    "installation_repositories": frozenset({"added", "removed"}),
+    "issue_comment": frozenset({"created"}),
+}
+
+# 리뷰 작업을 등록할 수 있는 pull_request 액션 (unlabeled는 스킵 라벨 제거일 때만)
+REVIEW_TRIGGER_ACTIONS = frozenset({"opened", "synchronize", "ready_for_review", "unlabeled"})
+
+# GitHub 페이로드는 "action"이 첫 번째 키로 직렬화되므로 앞부분만 보고 액션을 알 수 있다
+_ACTION_PREFIX_RE = re.compile(rb'^\s*\{\s*"action"\s*:\s*"([^"\\]{1,64})"')
+_ACTION_PEEK_BYTES = 256
+
+
+def is_handled_event(event: str) -> bool:
+    """``X-GitHub-Event`` 헤더만으로 처리 대상 이벤트인지 판단한다.
+
+    Args:
+        event: x-github-event 헤더 값.
+
+    Returns:
+        핸들러가 있는 이벤트면 True.
+    """
+    return event in HANDLED_ACTIONS
+
+
+def is_handled_action(event: str, action: str) -> bool:
+    """이벤트/액션 조합을 처리하는 핸들러가 있는지 판단한다.
+
+    Args:
+        event: x-github-event 헤더 값.
+        action: payload["action"] 값.
+
+    Returns:
+        처리 대상이면 True.
+    """
+    return action in HANDLED_ACTIONS.get(event, frozenset())
+
+
+def may_enqueue_review(event: str, action: str, payload: dict) -> bool:
+    """이 delivery가 리뷰 작업을 등록할 수 있는지 판단한다 (큐 포화 시 거절 대상).
+
+    closed/labeled 같은 상태 갱신이나 일반 코멘트는 큐에 작업을 더하지 않으므로 포화 중에도 처리한다.
+
+    Args:
+        event: x-github-event 헤더 값.
+        action: payload["action"] 값.
+        payload: 웹훅 페이로드.
+
+    Returns:
+        리뷰를 등록할 수 있으면 True.
+    """
+    if event == "pull_request":
+        if action == "unlabeled":
+            return str((payload.get("label") or {}).get("name", "")).lower() in SKIP_REVIEW_LABELS
+        return action in REVIEW_TRIGGER_ACTIONS
+    if event == "issue_comment":
+        return "/re-review" in str((payload.get("comment") or {}).get("body") or "").lower()
+    return False
+
+
+def peek_action(body: bytes) -> str | None:
+    """본문 전체를 파싱하지 않고 앞부분에서 ``action`` 값을 읽는다.
+
+    Args:
+        body: 웹훅 요청 본문 (raw bytes).
+
+    Returns:
+        action 값. 첫 키가 action이 아니거나 형식을 알 수 없으면 None (전체 파싱 필요).
+    """
+    match = _ACTION_PREFIX_RE.match(body[:_ACTION_PEEK_BYTES])
+    if match is None:
+        return None
+    return match.group(1).decode()
 
 
 async def dispatch_event(
@@ -1,13 +1,20 @@
-"""웹훅 핸들러 공유 파이프라인 함수."""
+"""웹훅 핸들러 공유 함수."""
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.github import github_client, pr_collector
-from app.reviewer import run_review
-from app.services.review_service import mark_comments_addressed, persist_review_result
+from app.config import settings
+from app.database.models import ReviewJob
+from app.services.review_queue import (
+    count_pending_review_jobs,
+    enqueue_review_job,
+    find_active_review_job,
+    job_priority,
+    supersede_review_jobs,
+)
+from app.services.review_service import get_pr_scheduling_hints, review_exists_for_head_sha
 
 
-async def run_full_review_pipeline(
+async def enqueue_review(
     session: AsyncSession,
     installation_id: str,
     github_repo_id: int,
@@ -15,9 +22,22 @@ async def run_full_review_pipeline(
     repo_owner: str,
     repo_name: str,
     pr_number: int,
+    head_sha: str | None = None,
     trigger_source: str = "push",
-) -> None:
-    """PR 데이터 수집 → LangGraph 리뷰 → DB 저장 → GitHub 코멘트 게시 파이프라인.
+    force: bool = False,
+) -> ReviewJob | None:
+    """리뷰 작업을 큐에 등록한다. 실제 리뷰는 워커(worker.py)가 비동기로 실행한다.
+
+    모든 트리거 경로가 이 함수를 거치므로 (저장소, PR, head_sha) 하나에는 리뷰가 최대 하나만 돈다.
+    - 같은 head_sha로 대기/실행 중인 작업이 있으면 등록하지 않는다 (``force``여도 동일).
+    - 같은 head_sha의 리뷰가 이미 저장돼 있으면 등록하지 않는다. ``force=True``(/re-review)는 예외.
+
+    같은 PR에 다른 head_sha로 대기/실행 중인 작업은 superseded 처리되어 폐기되거나 취소된다.
+    우선순위는 트리거 출처(re_review_command > ready_for_review > push > label_removed)에
+    PR의 ``triage_priority``를 더해 정한다.
+    push 트리거는 ``review_debounce_seconds``만큼 지연 등록되어, 연속 push가 마지막 커밋 하나로 합쳐진다.
+    큐가 포화(``review_saturation_queue_depth``)면 직전 위험도가 LOW인 PR의 자동 리뷰는
+    ``review_low_risk_defer_seconds``만큼 지연되고 우선순위도 한 단계 낮아진다 (/re-review 제외).
 
     Args:
         session: 비동기 DB 세션.
@@ -27,67 +47,60 @@ async def run_full_review_pipeline(
         repo_owner: 저장소 소유자 login.
         repo_name: 저장소 이름.
         pr_number: PR 번호.
+        head_sha: 리뷰 대상 HEAD 커밋 SHA.
         trigger_source: 리뷰 트리거 출처 (push, ready_for_review, re_review_command, label_removed).
+        force: 같은 head_sha의 기존 리뷰가 있어도 다시 리뷰할지 여부.
+
+    Returns:
+        등록된 ReviewJob. 중복으로 건너뛰었으면 None.
     """
-    logger.info(f"📋 PR 데이터 수집 시작: {repo_owner}/{repo_name} #{pr_number}")
-    pr_data = await pr_collector.collect_pr_data(
-        installation_id=installation_id,
-        repo_owner=repo_owner,
-        repo_name=repo_name,
-        pull_number=pr_number,
-        include_commits=True,
-    )
-    logger.info(
-        f"📋 PR 데이터 수집 완료: {pr_data.changed_files_count}개 파일, "
-        f"{pr_data.commits_count}개 커밋"
-    )
+    if head_sha:
+        active_job = await find_active_review_job(session, github_repo_id, pr_number, head_sha)
+        if active_job is not None:
+            logger.info(f"PR #{pr_number} {head_sha[:7]} 리뷰 작업 #{active_job.id} 이미 진행 중, 스킵")
+            return None
+        if not force and await review_exists_for_head_sha(session, github_repo_id, pr_number, head_sha):
+            logger.info(f"PR #{pr_number} {head_sha[:7]} 리뷰 이미 존재, 스킵")
+            return None
 
-    logger.info(f"🤖 AI 코드 리뷰 시작: PR #{pr_number}")
-    review_result = await run_review(
-        pr_data=pr_data,
-        installation_id=installation_id,
-        repo_owner=repo_owner,
-        repo_name=repo_name,
-    )
-    logger.info(
-        f"🤖 AI 코드 리뷰 완료: decision={review_result.get('review_decision')}, "
-        f"errors={review_result.get('errors')}"
-    )
+        superseded = await supersede_review_jobs(session, github_repo_id, pr_number, head_sha)
+        if superseded:
+            logger.info(f"♻️  PR #{pr_number} 이전 커밋 리뷰 작업 {superseded}개 대체 → {head_sha[:7]}")
 
-    # 이전 리뷰 코멘트 중 이번 변경으로 해결된 항목 자동 업데이트
-    resolved_ids: list[int] = []
-    for fr in review_result.get("file_reviews", []):
-        resolved_ids.extend(fr.get("resolved_comment_ids", []))
-    if resolved_ids:
-        logger.info(f"✅ 해결된 이전 이슈 {len(resolved_ids)}개 자동 처리: {resolved_ids}")
-        await mark_comments_addressed(session, resolved_ids)
+    delay_seconds = settings.review_debounce_seconds if trigger_source == "push" else 0
+    triage_priority, risk_level = await get_pr_scheduling_hints(session, github_repo_id, pr_number)
+    priority = job_priority(trigger_source, triage_priority)
 
-    logger.info("💾 DB 저장 시작")
-    await persist_review_result(
-        session=session,
+    if not force and risk_level == "LOW" and await _is_saturated(session):
+        delay_seconds = max(delay_seconds, settings.review_low_risk_defer_seconds)
+        priority -= 1
+        logger.info(f"⏳ 큐 포화 → LOW 위험도 PR #{pr_number} 리뷰 {delay_seconds}초 지연")
+    job = await enqueue_review_job(
+        session,
         installation_id=installation_id,
         github_repo_id=github_repo_id,
         github_pr_id=github_pr_id,
-        pr_data=pr_data,
-        review_result=review_result,
-        trigger_source=trigger_source,
-    )
-    logger.info("💾 DB 저장 완료")
-
-    final_review = review_result.get("final_review", "리뷰 생성 실패")
-    review_decision = review_result.get("review_decision", "COMMENT")
-
-    logger.info(f"💬 GitHub 코멘트 게시 시작: PR #{pr_number}")
-    await github_client.create_pr_comment(
-        installation_id=installation_id,
         repo_owner=repo_owner,
         repo_name=repo_name,
-        pull_number=pr_number,
-        comment_body=final_review,
+        pr_number=pr_number,
+        head_sha=head_sha,
+        trigger_source=trigger_source,
+        delay_seconds=delay_seconds,
+        priority=priority,
     )
+    if job is None:
+        logger.info(f"PR #{pr_number} 동일 커밋 리뷰 작업이 동시에 등록됨, 스킵")
+        return None
 
     logger.info(
-        f"✅ PR #{pr_number} 리뷰 완료: {review_decision} - "
-        f"{pr_data.changed_files_count} files, "
-        f"{len(review_result.get('file_reviews', []))} reviews"
+        f"📥 리뷰 작업 등록: job #{job.id} {repo_owner}/{repo_name} #{pr_number} "
+        f"({trigger_source}, priority={priority}, head={head_sha[:7] if head_sha else '-'})"
     )
+    return job
+
+
+async def _is_saturated(session: AsyncSession) -> bool:
+    """대기 작업 수가 ``review_saturation_queue_depth`` 이상인지 확인한다."""
+    if settings.review_saturation_queue_depth <= 0:
+        return False
+    return await count_pending_review_jobs(session) >= settings.review_saturation_queue_depth
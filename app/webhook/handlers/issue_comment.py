@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.github import github_client
 from app.services.review_service import get_most_recent_review
 
-from ._helpers import run_full_review_pipeline
+from ._helpers import enqueue_review
 
 REVIEW_COOLDOWN_SECONDS = 60
 ALLOWED_ASSOCIATIONS = {"OWNER", "MEMBER", "COLLABORATOR"}
@@ -91,8 +91,8 @@ async def handle_issue_comment(
     )
     github_pr_id: int = pr_details["id"]
 
-    logger.info(f"PR #{pr_number} /re-review 커맨드로 리뷰 재실행")
-    await run_full_review_pipeline(
+    logger.info(f"PR #{pr_number} /re-review 커맨드로 리뷰 재등록")
+    await enqueue_review(
         session=session,
         installation_id=installation_id,
         github_repo_id=github_repo_id,
@@ -100,5 +100,7 @@ async def handle_issue_comment(
         repo_owner=repo_owner,
         repo_name=repo_name,
         pr_number=pr_number,
+        head_sha=pr_details["head"]["sha"],
         trigger_source="re_review_command",
+        force=True,
     )
@@ -3,9 +3,9 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.github import github_client
-from app.services.review_service import review_exists_for_head_sha, update_pr_state
+from app.services.review_service import update_pr_state
 
-from ._helpers import run_full_review_pipeline
+from ._helpers import enqueue_review
 
 SKIP_REVIEW_LABELS = {"skip-review", "wip"}
 
@@ -44,7 +44,7 @@ async def handle_pull_request(
         repo_owner: str = repo["owner"]["login"]
         repo_name: str = repo["name"]
 
-        await run_full_review_pipeline(
+        await enqueue_review(
             session=session,
             installation_id=installation_id,
             github_repo_id=github_repo_id,
@@ -52,20 +52,16 @@ async def handle_pull_request(
             repo_owner=repo_owner,
             repo_name=repo_name,
             pr_number=pr_number,
+            head_sha=pr["head"]["sha"],
         )
 
     elif action == "ready_for_review":
-        head_sha: str = pr["head"]["sha"]
-        if await review_exists_for_head_sha(session, github_repo_id, pr_number, head_sha):
-            logger.info(f"PR #{pr_number} {head_sha[:7]} 리뷰 이미 존재, 스킵")
-            return
-
         installation_id = str(payload["installation"]["id"])
         github_pr_id = pr["id"]
         repo_owner = repo["owner"]["login"]
         repo_name = repo["name"]
 
-        await run_full_review_pipeline(
+        await enqueue_review(
             session=session,
             installation_id=installation_id,
             github_repo_id=github_repo_id,
@@ -73,6 +69,7 @@ async def handle_pull_request(
             repo_owner=repo_owner,
             repo_name=repo_name,
             pr_number=pr_number,
+            head_sha=pr["head"]["sha"],
             trigger_source="ready_for_review",
         )
 
@@ -115,8 +112,8 @@ async def handle_pull_request(
             logger.info(f"PR #{pr_number} 드래프트 상태, 리뷰 건너뜀")
             return
 
-        logger.info(f"PR #{pr_number} 스킵 라벨 '{label_name}' 제거, 리뷰 실행")
-        await run_full_review_pipeline(
+        logger.info(f"PR #{pr_number} 스킵 라벨 '{label_name}' 제거, 리뷰 등록")
+        await enqueue_review(
             session=session,
             installation_id=installation_id,
             github_repo_id=github_repo_id,
@@ -124,6 +121,7 @@ async def handle_pull_request(
             repo_owner=repo_owner,
             repo_name=repo_name,
             pr_number=pr_number,
+            head_sha=pr["head"]["sha"],
             trigger_source="label_removed",
         )
 
@@ -0,0 +1,4 @@
+from .pipeline import run_full_review_pipeline
+from .runner import ReviewWorker
+
+__all__ = ["ReviewWorker", "run_full_review_pipeline"]
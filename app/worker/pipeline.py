@@ -0,0 +1,182 @@
+"""리뷰 작업 실행 파이프라인."""
+import asyncio
+
+from langchain_core.callbacks import BaseCallbackHandler
+from loguru import logger
+
+from app.config import settings
+from app.database import async_session_factory, session_scope
+from app.github import pr_collector
+from app.reviewer import run_review
+from app.reviewer.checkpoint import checkpoint_thread_id, clear_checkpoint
+from app.services.file_result_service import delete_file_results
+from app.services.review_posting import build_inline_comments, publish_review
+from app.services.review_queue import bump_review_job_priority, complete_review_job
+from app.services.review_service import (
+    mark_comments_addressed,
+    persist_review_result,
+    raise_pr_triage_priority,
+)
+
+
+async def boost_high_risk_priority(
+    github_repo_id: int,
+    pr_number: int,
+    risk_assessment: dict,
+) -> None:
+    """위험도가 HIGH로 분류된 PR의 트리아지 우선순위와 대기 중인 작업 우선순위를 올린다.
+
+    리뷰 도중(classify_risk 직후) 호출되므로 파이프라인 세션과 별도로 즉시 commit한다.
+
+    Args:
+        github_repo_id: GitHub 저장소 ID.
+        pr_number: PR 번호.
+        risk_assessment: ``classify_risk`` 노드 결과.
+    """
+    if str(risk_assessment.get("level", "")).upper() != "HIGH":
+        return
+
+    boost = settings.review_high_risk_priority_boost
+    async with async_session_factory() as session:
+        await raise_pr_triage_priority(session, github_repo_id, pr_number, boost)
+        bumped = await bump_review_job_priority(session, github_repo_id, pr_number, boost)
+        await session.commit()
+    logger.info(f"🔺 PR #{pr_number} HIGH 위험도 → 우선순위 +{boost} (대기 작업 {bumped}개)")
+
+
+async def discard_review_progress(thread_id: str) -> None:
+    """리뷰 thread의 LanGraph 체크포인트와 파일별 중간 결과를 삭제한다.
+
+    결과 게시가 끝났거나, 작업이 대체·최종 실패해 더 이상 이어서 실행할 일이 없을 때 호출한다.
+
+    Args:
+        thread_id: 체크포인트 thread ID.
+    """
+    await clear_checkpoint(thread_id)
+    try:
+        async with async_session_factory() as session:
+            await delete_file_results(session, thread_id)
+            await session.commit()
+    except Exception as e:
+        logger.warning(f"파일별 중간 결과 삭제 실패 ({thread_id}): {e}")
+
+
+async def run_full_review_pipeline(
+    installation_id: str,
+    github_repo_id: int,
+    github_pr_id: int,
+    repo_owner: str,
+    repo_name: str,
+    pr_number: int,
+    trigger_source: str = "push",
+    callbacks: list[BaseCallbackHandler] | None = None,
+    job_id: int | None = None,
+) -> None:
+    """PR 데이터 수집 → LangGraph 리뷰 → DB 저장 → GitHub 코멘트 게시 파이프라인.
+
+    요약은 PR 코멘트 하나로 게시하며 재리뷰 때는 이전 요약 코멘트를 수정한다. 라인을 특정한
+    이슈는 인라인 코멘트로 모아 리뷰 하나로 제출한다.
+
+    리뷰 결과는 게시 전에 ``post_status=pending``으로 저장하고 작업을 완료 처리한다. GitHub 장애로
+    게시가 실패해도 LLM 토큰을 다시 쓰지 않도록 작업을 재시도하지 않고, 워커 주기 작업이 저장된
+    결과로 재게시한다.
+
+    PR 상세와 커밋을 먼저 받은 뒤 변경 파일 페이지 수집을 백그라운드로 시작하고 바로 그래프를
+    실행한다. 파일 목록이 필요 없는 앞 단계(Skills/이전 리뷰 로드, 의도 분석)는 파일 수집과 겹쳐
+    진행되고, ``collect_files`` 노드가 수집 결과를 넘겨받는다.
+
+    수 분이 걸리는 수집·LLM 리뷰·코멘트 게시 동안에는 DB 커넥션을 잡지 않는다.
+    그래프 노드는 필요한 컨텍스트를 각자 짧은 세션으로 읽고, 결과 저장과 작업 완료 처리는
+    하나의 짧은 트랜잭션으로 기록한다.
+
+    Args:
+        installation_id: GitHub App Installation ID.
+        github_repo_id: GitHub 저장소 ID.
+        github_pr_id: GitHub PR ID.
+        repo_owner: 저장소 소유자 login.
+        repo_name: 저장소 이름.
+        pr_number: PR 번호.
+        trigger_source: 리뷰 트리거 출처 (push, ready_for_review, re_review_command, label_removed).
+        callbacks: 리뷰 그래프의 LLM 호출에 전달할 LangChain 콜백.
+        job_id: 결과 저장과 같은 트랜잭션에서 완료 처리할 ReviewJob PK.
+    """
+    logger.info(f"📋 PR 데이터 수집 시작: {repo_owner}/{repo_name} #{pr_number}")
+    pr_data = await pr_collector.collect_pr_metadata(
+        installation_id=installation_id,
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        pull_number=pr_number,
+        include_commits=True,
+    )
+    logger.info(
+        f"📋 PR 메타데이터 수집 완료: {pr_data.changed_files_count}개 파일, "
+        f"{pr_data.commits_count}개 커밋 (파일 목록은 리뷰와 동시에 수집)"
+    )
+
+    # 같은 (저장소, PR, head_sha)의 중단된 실행이 있으면 체크포인트에서 이어서 진행
+    thread_id = checkpoint_thread_id(repo_owner, repo_name, pr_number, pr_data.head_sha)
+
+    # 파일 목록을 메타데이터와 함께 받는 수집기(GraphQL)가 아니면 파일 페이지를 백그라운드로 수집
+    files_task = None
+    if not pr_data.files and pr_data.changed_files_count:
+        files_task = asyncio.create_task(pr_collector.collect_files(
+            installation_id, repo_owner, repo_name, pr_number, total=pr_data.changed_files_count
+        ))
+
+    logger.info(f"🤖 AI 코드 리뷰 시작: PR #{pr_number}")
+    review_result = await run_review(
+        pr_data=pr_data,
+        installation_id=installation_id,
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        on_risk_assessed=lambda risk: boost_high_risk_priority(github_repo_id, pr_number, risk),
+        callbacks=callbacks,
+        thread_id=thread_id,
+        pending_files=files_task,
+    )
+    logger.info(
+        f"🤖 AI 코드 리뷰 완료: decision={review_result.get('review_decision')}, "
+        f"errors={review_result.get('errors')}"
+    )
+    # 파일 목록은 그래프의 collect_files 노드가 채운 PR 데이터에 있다
+    pr_data = review_result.get("pr_data") or pr_data
+
+    review_decision = review_result.get("review_decision", "COMMENT")
+
+    inline_comments = build_inline_comments(review_result.get("file_reviews", []), pr_data.files)
+
+    # 이전 리뷰 코멘트 중 이번 변경으로 해결된 항목 자동 업데이트
+    resolved_ids: list[int] = []
+    for fr in review_result.get("file_reviews", []):
+        resolved_ids.extend(fr.get("resolved_comment_ids", []))
+
+    logger.info("💾 DB 저장 시작")
+    async with session_scope() as session:
+        if resolved_ids:
+            logger.info(f"✅ 해결된 이전 이슈 {len(resolved_ids)}개 자동 처리: {resolved_ids}")
+            await mark_comments_addressed(session, resolved_ids)
+        review = await persist_review_result(
+            session=session,
+            installation_id=installation_id,
+            github_repo_id=github_repo_id,
+            github_pr_id=github_pr_id,
+            pr_data=pr_data,
+            review_result=review_result,
+            trigger_source=trigger_source,
+            inline_comments=inline_comments,
+        )
+        review_id = review.id
+        if job_id is not None:
+            await complete_review_job(session, job_id)
+    logger.info("💾 DB 저장 완료")
+
+    await discard_review_progress(thread_id)
+
+    logger.info(f"💬 GitHub 코멘트 게시 시작: PR #{pr_number}")
+    await publish_review(review_id)
+
+    logger.info(
+        f"✅ PR #{pr_number} 리뷰 완료: {review_decision} - "
+        f"{pr_data.changed_files_count} files, "
+        f"{len(review_result.get('file_reviews', []))} reviews"
+    )
@@ -0,0 +1,272 @@
+"""리뷰 작업 큐를 소비하는 워커."""
+import asyncio
+import os
+import socket
+
+from loguru import logger
+
+from app import metrics
+from app.config import settings
+from app.database import async_session_factory
+from app.database.models import ReviewJob
+from app.github import github_client
+from app.reviewer.checkpoint import checkpoint_thread_id, close_checkpointer, init_checkpointer
+from app.reviewer.llm import close_llm_clients
+from app.reviewer.usage import TokenUsageCallback
+from app.services.delivery_service import purge_expired_deliveries
+from app.services.fair_share import get_installation_limits
+from app.services.pr_sync import reconcile_active_repositories
+from app.services.review_posting import retry_pending_review_posts
+from app.services.review_queue import (
+    JOB_FAILED,
+    JOB_SUPERSEDED,
+    add_review_job_tokens,
+    claim_next_review_job,
+    fail_review_job,
+    heartbeat_review_job,
+    requeue_stale_review_jobs,
+)
+
+from .pipeline import discard_review_progress, run_full_review_pipeline
+
+
+class ReviewWorker:
+    """``review_jobs`` 테이블에서 작업을 가져와 리뷰 파이프라인을 실행하는 워커.
+
+    하나의 프로세스 안에서 ``concurrency``개의 슬롯이 각자 큐를 폴링하며,
+    여러 프로세스(파드)를 띄워도 ``SKIP LOCKED`` 덕분에 작업이 중복 실행되지 않는다.
+    작업 선택 시 installation별 동시 실행/토큰 한도와 가중치 기반 공정 분배를 적용한다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        self.concurrency = concurrency or settings.review_worker_concurrency
+        self.poll_interval = poll_interval or settings.review_worker_poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop_event = asyncio.Event()
+
+    def stop(self) -> None:
+        """진행 중인 작업을 마친 뒤 워커를 종료하도록 요청한다."""
+        logger.info(f"🛑 워커 종료 요청: {self.worker_id}")
+        self._stop_event.set()
+
+    async def run(self) -> None:
+        """stop()이 호출될 때까지 작업을 처리한다.
+
+        시작 시 체크포인터를 열고 heartbeat가 끊긴 작업을 재등록한다. 재등록된 작업은
+        체크포인트에서 마지막으로 완료된 노드 다음부터 이어서 실행된다.
+        종료 시 체크포인터와 GitHub API 공유 HTTP 클라이언트를 닫는다.
+        """
+        await init_checkpointer()
+        await self._requeue_stale()
+
+        logger.info(f"👷 리뷰 워커 시작: {self.worker_id} (concurrency={self.concurrency})")
+        try:
+            await asyncio.gather(
+                self._maintenance_loop(),
+                *(self._slot_loop(slot) for slot in range(self.concurrency)),
+            )
+        finally:
+            await close_checkpointer()
+            await close_llm_clients()
+            await github_client.aclose()
+        logger.info(f"👋 리뷰 워커 종료: {self.worker_id}")
+
+    async def _requeue_stale(self) -> None:
+        """heartbeat가 끊긴 running 작업(비정상 종료된 워커의 작업)을 pending으로 되돌린다."""
+        async with async_session_factory() as session:
+            requeued = await requeue_stale_review_jobs(session, settings.review_job_stale_seconds)
+            await session.commit()
+        if requeued:
+            logger.warning(f"♻️  중단된 리뷰 작업 {requeued}개 재등록")
+
+    async def _slot_loop(self, slot: int) -> None:
+        """슬롯 하나가 큐를 폴링하며 작업을 순차 실행하는 루프.
+
+        Args:
+            slot: 슬롯 번호 (로깅용).
+        """
+        while not self._stop_event.is_set():
+            try:
+                job = await self._claim()
+            except Exception as e:
+                logger.error(f"[slot {slot}] 작업 조회 실패: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._execute(job, slot)
+
+    async def _maintenance_loop(self) -> None:
+        """``worker_maintenance_interval``마다 주기 작업을 실행하는 루프."""
+        while not self._stop_event.is_set():
+            try:
+                await self._run_maintenance()
+            except Exception as e:
+                logger.error(f"워커 주기 작업 실패: {e}")
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(), timeout=settings.worker_maintenance_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_maintenance(self) -> None:
+        """중단된 작업 재등록, 만료된 웹훅 delivery 기록 정리, PR 상태 동기화, 밀린 리뷰 재게시를 실행한다."""
+        await self._requeue_stale()
+        async with async_session_factory() as session:
+            purged = await purge_expired_deliveries(session, settings.webhook_delivery_ttl_hours)
+            await session.commit()
+        if purged:
+            logger.info(f"🧹 만료된 웹훅 delivery 기록 {purged}개 삭제")
+
+        if settings.pr_sync_interval_seconds > 0:
+            synced = await reconcile_active_repositories(
+                settings.pr_sync_interval_seconds, settings.pr_sync_concurrency
+            )
+            if synced:
+                logger.info(f"🔄 웹훅 누락으로 남은 PR 상태 {synced}개 동기화")
+
+        reposted = await retry_pending_review_posts()
+        if reposted:
+            logger.info(f"💬 게시가 밀린 리뷰 {reposted}개 재게시")
+
+        hold = metrics.snapshot()["observations"].get("db_connection_hold_seconds", [{}])[0]
+        logger.info(
+            f"📊 DB 풀: 사용 중 {metrics.get_value('db_pool_checked_out'):.0f}개, "
+            f"커넥션 점유 {hold.get('count', 0)}회 (최대 {hold.get('max', 0.0):.2f}초)"
+        )
+
+    async def _claim(self) -> ReviewJob | None:
+        """다음 작업을 가져오고 곧바로 commit해 잠금을 해제한다."""
+        async with async_session_factory() as session:
+            job = await claim_next_review_job(
+                session,
+                self.worker_id,
+                settings.review_priority_aging_seconds,
+                limits_for=get_installation_limits,
+                max_running=settings.review_global_max_running,
+            )
+            await session.commit()
+            return job
+
+    async def _execute(self, job: ReviewJob, slot: int) -> None:
+        """작업 하나를 실행하고 결과 상태를 기록한다.
+
+        실행 중 같은 PR에 새 head_sha 작업이 등록되어 superseded로 바뀌면
+        파이프라인을 취소하고 결과를 기록하지 않는다.
+
+        Args:
+            job: running 상태로 전환된 작업.
+            slot: 슬롯 번호 (로깅용).
+        """
+        logger.info(
+            f"[slot {slot}] ▶️  작업 #{job.id} 실행: {job.repo_owner}/{job.repo_name} "
+            f"#{job.pr_number} ({job.trigger_source}, attempt={job.attempts})"
+        )
+        usage = TokenUsageCallback()
+        pipeline_task = asyncio.create_task(self._run_pipeline(job, usage))
+        watcher_task = asyncio.create_task(self._watch_superseded(job.id, pipeline_task))
+        try:
+            await pipeline_task
+            logger.info(f"[slot {slot}] ✅ 작업 #{job.id} 완료")
+        except asyncio.CancelledError:
+            if not watcher_task.done() or watcher_task.result() is not True:
+                raise
+            logger.info(f"[slot {slot}] ⏭️  작업 #{job.id} 취소: 더 최신 커밋의 리뷰로 대체됨")
+            await self._discard_progress(job)
+        except Exception as e:
+            logger.exception(f"[slot {slot}] ❌ 작업 #{job.id} 실패: {e}")
+            async with async_session_factory() as session:
+                status = await fail_review_job(
+                    session,
+                    job.id,
+                    error=str(e),
+                    max_attempts=settings.review_job_max_attempts,
+                    retry_delay_seconds=settings.review_job_retry_delay_seconds,
+                )
+                await session.commit()
+            logger.info(f"[slot {slot}] 작업 #{job.id} 상태 → {status}")
+            if status in (JOB_FAILED, JOB_SUPERSEDED):
+                await self._discard_progress(job)
+        finally:
+            if not watcher_task.done():
+                watcher_task.cancel()
+            if usage.total_tokens:
+                await self._record_tokens(job.id, usage.total_tokens)
+
+    async def _run_pipeline(self, job: ReviewJob, usage: TokenUsageCallback) -> None:
+        """리뷰 파이프라인을 실행한다. 작업 완료 처리는 파이프라인이 결과 저장과 함께 수행한다.
+
+        Args:
+            job: 실행할 작업.
+            usage: LLM 토큰 사용량을 집계할 콜백.
+        """
+        await run_full_review_pipeline(
+            installation_id=job.installation_id,
+            github_repo_id=job.github_repo_id,
+            github_pr_id=job.github_pr_id,
+            repo_owner=job.repo_owner,
+            repo_name=job.repo_name,
+            pr_number=job.pr_number,
+            trigger_source=job.trigger_source,
+            callbacks=[usage],
+            job_id=job.id,
+        )
+
+    async def _discard_progress(self, job: ReviewJob) -> None:
+        """더 이상 이어서 실행하지 않을 작업의 체크포인트와 파일별 중간 결과를 삭제한다.
+
+        Args:
+            job: 대체되었거나 최종 실패한 작업.
+        """
+        if job.head_sha:
+            await discard_review_progress(
+                checkpoint_thread_id(job.repo_owner, job.repo_name, job.pr_number, job.head_sha)
+            )
+
+    async def _record_tokens(self, job_id: int, tokens: int) -> None:
+        """작업이 사용한 LLM 토큰 수를 기록한다. 실패해도 작업 결과에는 영향을 주지 않는다.
+
+        Args:
+            job_id: ReviewJob PK.
+            tokens: 이번 실행에서 사용한 토큰 수.
+        """
+        try:
+            async with async_session_factory() as session:
+                await add_review_job_tokens(session, job_id, tokens)
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"작업 #{job_id} 토큰 사용량 기록 실패: {e}")
+
+    async def _watch_superseded(self, job_id: int, pipeline_task: asyncio.Task) -> bool:
+        """작업 heartbeat를 갱신하며 superseded로 바뀌는지 확인하고, 바뀌면 파이프라인을 취소한다.
+
+        Args:
+            job_id: 감시할 ReviewJob PK.
+            pipeline_task: 취소 대상 파이프라인 태스크.
+
+        Returns:
+            파이프라인을 취소했으면 True.
+        """
+        while not pipeline_task.done():
+            await asyncio.sleep(settings.review_supersede_check_interval)
+            try:
+                async with async_session_factory() as session:
+                    status = await heartbeat_review_job(session, job_id)
+                    await session.commit()
+            except Exception as e:
+                logger.warning(f"작업 #{job_id} 상태 확인 실패: {e}")
+                continue
+            if status == JOB_SUPERSEDED:
+                pipeline_task.cancel()
+                return True
+        return False
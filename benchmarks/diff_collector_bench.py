@@ -0,0 +1,126 @@
+"""PR 변경 파일 수집 방식 벤치마크: files API 페이지 vs unified diff 한 번의 다운로드.
+
+같은 PR(파일 ``--files``개, 파일당 hunk 라인 ``--lines``개)을 대역 응답으로 만들어
+``PRDataCollector``(files API, 100개씩 페이지 요청)와 ``DiffPRDataCollector``
+(``application/vnd.github.diff`` 스트리밍 + 로컬 파싱)의 파일 목록 수집을 비교한다.
+요청 수, 응답 바이트, 지연 시간, 파싱 중 최대 메모리를 출력한다::
+
+    python benchmarks/diff_collector_bench.py --files 1000 --lines 40 --latency-ms 30
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from github_client_bench import _prepare_env  # noqa: E402
+
+
+def build_pr(files: int, lines: int) -> tuple[list[dict], bytes]:
+    """같은 변경 내용을 files API JSON 항목과 unified diff 본문으로 만든다."""
+    entries = []
+    diff_parts = []
+    for i in range(files):
+        name = f"src/module_{i}/file_{i}.py"
+        hunk = [f"@@ -1,{lines} +1,{lines} @@"]
+        hunk += [f"-    value_{n} = compute({n})" for n in range(lines // 2)]
+        hunk += [f"+    value_{n} = compute({n}, cache=True)" for n in range(lines // 2)]
+        patch = "\n".join(hunk)
+        entries.append({
+            "sha": "0" * 40,
+            "filename": name,
+            "status": "modified",
+            "additions": lines // 2,
+            "deletions": lines // 2,
+            "changes": lines // 2 * 2,
+            "blob_url": f"https://github.com/o/r/blob/{'0' * 40}/{name}",
+            "raw_url": f"https://github.com/o/r/raw/{'0' * 40}/{name}",
+            "contents_url": f"https://api.github.com/repos/o/r/contents/{name}?ref={'0' * 40}",
+            "patch": patch,
+        })
+        diff_parts.append(
+            f"diff --git a/{name} b/{name}\nindex 1111111..2222222 100644\n--- a/{name}\n+++ b/{name}\n{patch}\n"
+        )
+    return entries, "".join(diff_parts).encode()
+
+
+async def main(args: argparse.Namespace) -> None:
+    _prepare_env()
+    import httpx
+    from loguru import logger
+
+    from app.github.client import GitHubClient
+    from app.github.diff_collector import DiffPRDataCollector
+    from app.github.pr_collector import PRDataCollector
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    entries, diff_body = build_pr(args.files, args.lines)
+    stats = {"requests": 0, "bytes": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(args.latency_ms / 1000)
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_bench", "expires_at": "2099-01-01T00:00:00Z"})
+        stats["requests"] += 1
+        if request.headers["accept"] == "application/vnd.github.diff":
+            body = diff_body
+        else:
+            page = int(request.url.params.get("page", 1))
+            per_page = int(request.url.params.get("per_page", 30))
+            body = json.dumps(entries[(page - 1) * per_page: page * per_page]).encode()
+        stats["bytes"] += len(body)
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    client = GitHubClient(base_url="https://api.bench")
+    client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    for label, collector in (
+        ("files-api", PRDataCollector(client)),
+        ("diff", DiffPRDataCollector(client)),
+    ):
+        if isinstance(collector, DiffPRDataCollector):
+            async def fetch(collector=collector):
+                data = await collector._fetch_files("1", "o", "r", 1)
+                return [collector._convert_to_file_change(f) for f in data]
+        else:
+            async def fetch(collector=collector):
+                data = await client.get_pr_files("1", "o", "r", 1, total=args.files)
+                return [collector._convert_to_file_change(f) for f in data]
+
+        await fetch()  # 토큰 발급 + 워밍업
+        stats.update(requests=0, bytes=0)
+        timings = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            files = await fetch()
+            timings.append(time.perf_counter() - started)
+        requests, received = stats["requests"], stats["bytes"]
+
+        # tracemalloc은 실행을 느리게 하므로 지연 측정과 따로 한 번 더 실행한다
+        tracemalloc.start()
+        await fetch()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{label:>9}: {len(files)} files  median {statistics.median(timings) * 1000:7.1f}ms  "
+            f"requests/PR {requests / args.rounds:.0f}  "
+            f"bytes/PR {received / args.rounds / 1024:8.1f}KiB  peak mem {peak / 1024 / 1024:6.1f}MiB"
+        )
+
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000, help="PR의 변경 파일 수")
+    parser.add_argument("--lines", type=int, default=40, help="파일당 hunk 라인 수")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="요청당 응답 지연")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,186 @@
+"""GitHubClient 커넥션 재사용 벤치마크.
+
+로컬 대역(stand-in) GitHub API 서버를 띄우고, 리뷰 1건이 GitHub에 보내는 요청 묶음
+(PR 상세 → 변경 파일 → 커밋 → 컨텍스트 파일 N개 → 코멘트 작성)의 지연 시간을 비교한다.
+
+- per-call: 요청마다 커넥션을 새로 여는 기존 방식 (매 호출 후 클라이언트를 닫음)
+- shared: 프로세스 공유 클라이언트로 keep-alive 커넥션을 재사용하는 방식
+
+대역 서버는 새 커넥션마다 ``--handshake-ms``만큼 지연해 TCP+TLS 핸드셰이크 비용을 흉내 낸다::
+
+    python benchmarks/github_client_bench.py --reviews 20 --context-files 5 --handshake-ms 40
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _prepare_env() -> None:
+    """앱 설정 로드에 필요한 환경 변수와 임시 GitHub App 개인키를 준비한다."""
+    if "GITHUB_PRIVATE_KEY_PATH" not in os.environ:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        key_file = tempfile.NamedTemporaryFile(suffix=".pem", delete=False)
+        key_file.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        key_file.close()
+        os.environ["GITHUB_PRIVATE_KEY_PATH"] = key_file.name
+    os.environ.setdefault("GITHUB_APP_ID", "1")
+    os.environ.setdefault("GITHUB_WEBHOOK_SECRET", "bench")
+
+
+class StandInServer:
+    """GitHub REST API 응답을 흉내 내는 최소 HTTP/1.1 keep-alive 서버.
+
+    Attributes:
+        handshake_delay: 새 커넥션을 받을 때마다 적용하는 지연 (초).
+        request_delay: 요청마다 적용하는 서버 처리 지연 (초).
+        connections: 지금까지 받은 커넥션 수.
+    """
+
+    def __init__(self, handshake_delay: float, request_delay: float):
+        self.handshake_delay = handshake_delay
+        self.request_delay = request_delay
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> str:
+        """서버를 임의 포트로 시작하고 베이스 URL을 반환한다."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """서버를 종료한다."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.handshake_delay)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                content_length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b""):
+                        break
+                    name, _, value = header.decode().partition(":")
+                    if name.lower() == "content-length":
+                        content_length = int(value.strip())
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                await asyncio.sleep(self.request_delay)
+                body = self._route(method, path.split("?", 1)[0])
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _route(method: str, path: str) -> bytes:
+        if path.endswith("/access_tokens"):
+            return json.dumps({"token": "ghs_bench", "expires_at": "2099-01-01T00:00:00Z"}).encode()
+        if path.endswith("/files"):
+            return json.dumps(
+                [{"filename": f"src/f{i}.py", "status": "modified", "patch": "@@ -1 +1 @@\n-a\n+b"} for i in range(10)]
+            ).encode()
+        if path.endswith("/commits"):
+            return json.dumps([{"sha": "0" * 40, "commit": {"message": "bench"}}]).encode()
+        if "/contents/" in path:
+            return b"print('hello')\n" * 50
+        if method == "POST":
+            return json.dumps({"id": 1}).encode()
+        return json.dumps({"number": 1, "title": "bench", "head": {"sha": "0" * 40}}).encode()
+
+
+async def run_review_requests(client, context_files: int) -> float:
+    """리뷰 1건이 보내는 GitHub 요청 묶음을 실행하고 걸린 시간을 반환한다."""
+    started = time.perf_counter()
+    await client.get_pr_details("1", "owner", "repo", 1)
+    await client.get_pr_files("1", "owner", "repo", 1)
+    await client.get_pr_commits("1", "owner", "repo", 1)
+    for i in range(context_files):
+        await client.get_file_content("1", "owner", "repo", f"src/f{i}.py", ref="0" * 40)
+    await client.create_pr_comment("1", "owner", "repo", 1, "bench")
+    return time.perf_counter() - started
+
+
+async def main(args: argparse.Namespace) -> None:
+    _prepare_env()
+    from loguru import logger
+
+    from app.github.client import GitHubClient
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    class PerCallGitHubClient(GitHubClient):
+        """매 요청 후 클라이언트를 닫아 요청마다 새 커넥션을 여는 기존 동작을 재현한다."""
+
+        async def _request(self, *a, **kw):
+            try:
+                return await super()._request(*a, **kw)
+            finally:
+                await self.aclose()
+
+        async def _get(self, *a, **kw):
+            try:
+                return await super()._get(*a, **kw)
+            finally:
+                await self.aclose()
+
+    server = StandInServer(args.handshake_ms / 1000, args.latency_ms / 1000)
+    base_url = await server.start()
+    try:
+        for label, client in (
+            ("per-call", PerCallGitHubClient(base_url=base_url)),
+            ("shared", GitHubClient(base_url=base_url)),
+        ):
+            await run_review_requests(client, args.context_files)  # 토큰 발급 + 워밍업
+            connections_before = server.connections
+            timings = [await run_review_requests(client, args.context_files) for _ in range(args.reviews)]
+            await client.aclose()
+            print(
+                f"{label:>9}: median {statistics.median(timings) * 1000:7.1f}ms  "
+                f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1] * 1000:7.1f}ms  "
+                f"connections/review {(server.connections - connections_before) / args.reviews:.1f}"
+            )
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reviews", type=int, default=20, help="측정할 리뷰 수")
+    parser.add_argument("--context-files", type=int, default=5, help="리뷰당 조회하는 컨텍스트 파일 수")
+    parser.add_argument("--handshake-ms", type=float, default=40.0, help="새 커넥션당 지연 (TCP+TLS 핸드셰이크 흉내)")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="요청당 서버 처리 지연")
+    asyncio.run(main(parser.parse_args()))
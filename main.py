@@ -1,16 +1,40 @@
 import json
+from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.responses import JSONResponse
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app import metrics as app_metrics
+from app.database import engine, session_scope
 from app.dependencies.auth import get_current_user
+from app.github import github_client
 from app.routers import auth, pull_requests, repositories, reviews, skills, stats
-from app.webhook import dispatch_event, verify_webhook_signature
+from app.config import settings
+from app.services.delivery_service import record_delivery
+from app.services.review_queue import count_pending_review_jobs, get_queue_stats
+from app.webhook import (
+    dispatch_event,
+    is_handled_action,
+    is_handled_event,
+    may_enqueue_review,
+    peek_action,
+    recent_deliveries,
+    verify_webhook_signature,
+)
 
-app = FastAPI(title="Almagest Reviewer")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명 주기. 종료 시 GitHub API 공유 HTTP 클라이언트의 커넥션을 닫는다."""
+    yield
+    await github_client.aclose()
+
+
+app = FastAPI(title="Almagest Reviewer", lifespan=lifespan)
+
+# 큐 포화로 거절할 때 재전송 권장 간격
+SATURATED_RETRY_AFTER_SECONDS = 60
 
 # 인증 라우터 (보호 없음 — 로그인 자체는 인증 불필요)
 app.include_router(auth.router, prefix="/api")
@@ -34,29 +58,97 @@ async def health_check():
     return {"status": "ok", "service": "almagest-reviewer"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """프로세스 내 운영 지표 스냅샷을 반환한다. 리뷰 큐 깊이는 요청 시점에 DB에서 조회한다.
+
+    Returns:
+        카운터/게이지/관측값 dict.
+    """
+    try:
+        async with session_scope() as session:
+            stats = await get_queue_stats(session)
+        app_metrics.set_gauge("review_queue_depth", stats["pending"])
+        app_metrics.set_gauge("review_jobs_running", stats["running"])
+        app_metrics.set_gauge("review_queue_oldest_pending_seconds", stats["oldest_pending_seconds"])
+    except Exception as e:
+        logger.warning(f"리뷰 큐 지표 조회 실패: {e}")
+    app_metrics.set_gauge("db_pool_size", engine.pool.size())
+    return app_metrics.snapshot()
+
+
 @app.post("/webhook")
-async def github_webhook(request: Request, session: AsyncSession = Depends(get_db)):
+async def github_webhook(request: Request):
     """GitHub App 웹훅 이벤트를 처리한다.
 
+    리뷰는 작업 큐에 등록만 하고 즉시 202를 반환한다. 실제 리뷰는 워커(worker.py)가 실행한다.
+    처리하지 않는 이벤트/액션은 헤더와 본문 앞부분만 보고 JSON 파싱·DB 세션 획득 없이 버린다.
+    GitHub 재전송으로 같은 ``X-GitHub-Delivery``가 다시 들어오면 본문 파싱 전에 무시한다.
+
+    큐 깊이가 ``review_queue_max_depth`` 이상이면 리뷰 작업을 등록할 delivery(opened/synchronize/
+    ready_for_review, 스킵 라벨 제거, ``/re-review`` 코멘트)만 delivery를 기록하지 않고
+    503(``{"status": "saturated"}``)으로 거절한다. closed 등 상태 갱신과 일반 코멘트는 포화 중에도 처리한다.
+    GitHub는 실패한 delivery를 자동으로 재전송하지 않으므로, 거절된 리뷰는 다음 push나 ``/re-review``,
+    또는 App 설정의 수동 redeliver로 다시 등록된다.
+
     Args:
         request: 웹훅 요청 (X-Hub-Signature-256 서명 포함).
-        session: 비동기 DB 세션.
 
     Returns:
-        처리 결과 JSON (``{"status": "success"}``).
+        처리 결과 JSON (``{"status": "accepted"}``, 202 / ``{"status": "ignored"}``, 200 /
+        ``{"status": "saturated"}``, 503).
 
     Raises:
         HTTPException: 웹훅 서명 검증 실패 시 403.
     """
     verified_body = await verify_webhook_signature(request)
-    payload = json.loads(verified_body)
 
     event = request.headers.get("x-github-event", "unknown")
-    action = payload.get("action", "none")
-    logger.info(f"📩 이벤트 수신: event={event}, action={action}")
+    delivery_id = request.headers.get("x-github-delivery")
+
+    if not is_handled_event(event):
+        app_metrics.inc("webhook_events_dropped_total", event=event, reason="event")
+        logger.debug(f"처리하지 않는 이벤트 무시: {event}")
+        return JSONResponse({"status": "ignored"})
 
-    await dispatch_event(event, action, payload, session)
+    action = peek_action(verified_body)
+    if action is not None and not is_handled_action(event, action):
+        app_metrics.inc("webhook_events_dropped_total", event=event, reason="action")
+        logger.debug(f"처리하지 않는 {event} 액션 무시: {action}")
+        return JSONResponse({"status": "ignored"})
 
-    return JSONResponse({"status": "success"})
+    if delivery_id and recent_deliveries.contains(delivery_id):
+        app_metrics.inc("webhook_events_dropped_total", event=event, reason="duplicate")
+        logger.info(f"🔁 중복 delivery 무시: {delivery_id} (event={event})")
+        return JSONResponse({"status": "duplicate"})
 
+    payload = json.loads(verified_body)
+    action = payload.get("action", "none")
 
+    async with session_scope() as session:
+        if settings.review_queue_max_depth > 0 and may_enqueue_review(event, action, payload):
+            queue_depth = await count_pending_review_jobs(session)
+            if queue_depth >= settings.review_queue_max_depth:
+                app_metrics.inc("webhook_events_dropped_total", event=event, reason="saturated")
+                logger.warning(f"🚦 리뷰 큐 포화 ({queue_depth}개 대기) → {event}.{action} 거절: {delivery_id}")
+                return JSONResponse(
+                    {"status": "saturated", "queue_depth": queue_depth},
+                    status_code=503,
+                    headers={"Retry-After": str(SATURATED_RETRY_AFTER_SECONDS)},
+                )
+
+        if delivery_id and not await record_delivery(session, delivery_id, event):
+            recent_deliveries.add(delivery_id)
+            app_metrics.inc("webhook_events_dropped_total", event=event, reason="duplicate")
+            logger.info(f"🔁 중복 delivery 무시: {delivery_id} (event={event})")
+            return JSONResponse({"status": "duplicate"})
+
+        logger.info(f"📩 이벤트 수신: event={event}, action={action}, delivery={delivery_id}")
+
+        await dispatch_event(event, action, payload, session)
+
+    if delivery_id:
+        recent_deliveries.add(delivery_id)
+    app_metrics.inc("webhook_events_accepted_total", event=event)
+
+    return JSONResponse({"status": "accepted"}, status_code=202)
@@ -0,0 +1,135 @@
+"""blob SHA 기반 파일 내용 캐시와 컨텍스트 파일 조회 단위 테스트."""
+import os
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.github.blob_cache import BlobCache
+from app.github.cache import ResponseCache
+from app.github.client import GitHubClient
+from app.github.rate_limit import GitHubRateLimiter, RateLimitBudgetExceeded
+from app.models import FileChange
+from app.reviewer.nodes.file_reviewer import _fetch_context_files
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used():
+    """메모리 계층은 한도를 넘으면 가장 오래 사용하지 않은 blob부터 버린다."""
+    cache = BlobCache(max_entries=2, max_bytes=1 << 20)
+    await cache.put("1", b"one")
+    await cache.put("2", b"two")
+    await cache.get("1")
+    await cache.put("3", b"three")
+
+    assert await cache.get("2") is None
+    assert await cache.get("1") == b"one"
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_memory_eviction(tmp_path):
+    """메모리에서 밀려난 blob도 디스크 계층에서 다시 읽는다."""
+    cache = BlobCache(max_entries=1, max_bytes=1 << 20, disk_dir=tmp_path)
+    await cache.put(SHA_A, b"print('a')")
+    await cache.put(SHA_B, b"print('b')")
+
+    assert await cache.get(SHA_A) == b"print('a')"
+    assert (tmp_path / "aa" / SHA_A).exists()
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_prunes_by_total_size(tmp_path):
+    """디스크 계층이 크기 한도를 넘으면 오래 사용하지 않은 파일부터 삭제한다."""
+    cache = BlobCache(max_entries=10, max_bytes=1 << 20, disk_dir=tmp_path, disk_max_bytes=10)
+    await cache.put(SHA_A, b"x" * 8)
+    os.utime(tmp_path / "aa" / SHA_A, (0, 0))
+    await cache.put(SHA_B, b"y" * 8)
+    cache._prune_disk()
+
+    assert not (tmp_path / "aa" / SHA_A).exists()
+    assert (tmp_path / "bb" / SHA_B).exists()
+
+
+@pytest.mark.asyncio
+async def test_get_blob_content_downloads_each_sha_once():
+    """같은 blob SHA는 한 번만 다운로드한다."""
+    blob_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        blob_requests.append(request)
+        return httpx.Response(200, content=b"app = FastAPI()\n")
+
+    client = GitHubClient(
+        base_url="https://api.test",
+        cache=ResponseCache(100, 1 << 20),
+        rate_limiter=GitHubRateLimiter(0.2, 0.1, max_wait_seconds=60),
+        blob_cache=BlobCache(100, 1 << 20),
+    )
+    client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    first = await client.get_blob_content("1", "o", "r", SHA_A)
+    second = await client.get_blob_content("1", "o", "other-repo", SHA_A)
+
+    assert first == second == "app = FastAPI()\n"
+    assert [r.url.path for r in blob_requests] == [f"/repos/o/r/git/blobs/{SHA_A}"]
+    await client.aclose()
+
+
+ROUTER_CHANGE = [FileChange(filename="app/routers/users.py", status="modified")]
+
+
+@pytest.mark.asyncio
+@patch("app.reviewer.nodes.file_reviewer.github_client")
+async def test_context_files_resolve_entry_point_from_tree(mock_client):
+    """트리에서 가장 우선순위가 높은 진입점을 찾아 blob SHA로 조회한다."""
+    mock_client.get_tree = AsyncMock(return_value=[
+        {"path": "app.py", "type": "blob", "sha": SHA_B},
+        {"path": "main.py", "type": "blob", "sha": SHA_A},
+        {"path": "server.py", "type": "tree", "sha": "c" * 40},
+    ])
+    mock_client.get_blob_content = AsyncMock(return_value="app = FastAPI()")
+    mock_client.get_file_content = AsyncMock()
+
+    context = await _fetch_context_files(ROUTER_CHANGE, "1", "o", "r", "h" * 40)
+
+    assert context == {"main.py": "app = FastAPI()"}
+    assert mock_client.get_blob_content.await_args.args[3] == SHA_A
+    mock_client.get_file_content.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.reviewer.nodes.file_reviewer.github_client")
+async def test_context_files_probe_candidates_concurrently_when_tree_fails(mock_client):
+    """트리 조회가 실패하면 후보를 동시에 조회하고 우선순위가 높은 파일을 고른다."""
+    request = httpx.Request("GET", "https://api.test")
+    not_found = httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+
+    async def get_file_content(file_path, **_):
+        if file_path in ("app.py", "asgi.py"):
+            return f"# {file_path}"
+        raise not_found
+
+    mock_client.get_tree = AsyncMock(side_effect=not_found)
+    mock_client.get_file_content = AsyncMock(side_effect=get_file_content)
+
+    context = await _fetch_context_files(ROUTER_CHANGE, "1", "o", "r", "h" * 40)
+
+    assert context == {"app.py": "# app.py"}
+    assert mock_client.get_file_content.await_count == 5
+
+
+@pytest.mark.asyncio
+@patch("app.reviewer.nodes.file_reviewer.github_client")
+async def test_context_files_skipped_when_budget_exhausted(mock_client):
+    """rate limit 예산이 부족하면 컨텍스트 조회를 생략한다."""
+    mock_client.get_tree = AsyncMock(side_effect=RateLimitBudgetExceeded("low"))
+    mock_client.get_file_content = AsyncMock()
+
+    assert await _fetch_context_files(ROUTER_CHANGE, "1", "o", "r", "h" * 40) == {}
+    mock_client.get_file_content.assert_not_awaited()
@@ -0,0 +1,200 @@
+"""unified diff 파서와 diff 기반 PR 수집기 단위 테스트."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.github.diff_collector import DiffPRDataCollector
+from app.github.diff_parser import commentable_lines, iter_file_changes, parse_unified_diff
+
+SAMPLE_DIFF = """\
+diff --git a/app/main.py b/app/main.py
+index 83db48f..bf269f4 100644
+--- a/app/main.py
++++ b/app/main.py
+@@ -1,3 +1,4 @@
+ import os
+-import sys
++import json
++import re
+ 
+diff --git a/docs/new file.md b/docs/new file.md
+new file mode 100644
+index 0000000..e69de29
+--- /dev/null
++++ b/docs/new file.md
+@@ -0,0 +1,2 @@
++# Title
++--- not a header
+diff --git a/old.py b/old.py
+deleted file mode 100644
+index e69de29..0000000
+--- a/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-print("bye")
+diff --git a/src/a.py b/src/b.py
+similarity index 90%
+rename from src/a.py
+rename to src/b.py
+index 1111111..2222222 100644
+--- a/src/a.py
++++ b/src/b.py
+@@ -1 +1 @@
+-x = 1
++x = 2
+diff --git a/logo.png b/logo.png
+index 3333333..4444444 100644
+Binary files a/logo.png and b/logo.png differ
+diff --git "a/\\355\\225\\234\\352\\270\\200.txt" "b/\\355\\225\\234\\352\\270\\200.txt"
+index 5555555..6666666 100644
+--- "a/\\355\\225\\234\\352\\270\\200.txt"
++++ "b/\\355\\225\\234\\352\\270\\200.txt"
+@@ -1 +1 @@
+-a
++b
+"""
+
+
+def test_parse_unified_diff_reads_status_counts_and_patch():
+    """파일별 상태, 추가/삭제 수, patch를 files API와 같은 형태로 읽는다."""
+    files = parse_unified_diff(SAMPLE_DIFF)
+
+    assert [f.filename for f in files] == ["app/main.py", "docs/new file.md", "old.py", "src/b.py", "logo.png", "한글.txt"]
+    modified, added, removed, renamed, binary, quoted = files
+
+    assert (modified.status, modified.additions, modified.deletions, modified.changes) == ("modified", 2, 1, 3)
+    assert modified.patch.startswith("@@ -1,3 +1,4 @@")
+    assert modified.patch.splitlines()[-1] == " "
+
+    # hunk 안의 "---"로 시작하는 줄은 헤더가 아니라 삭제/추가 라인이다
+    assert (added.status, added.additions, added.deletions) == ("added", 2, 0)
+    assert (removed.status, removed.additions, removed.deletions) == ("removed", 0, 1)
+    assert (renamed.status, renamed.previous_filename) == ("renamed", "src/a.py")
+    assert binary.is_binary and binary.patch is None and binary.changes == 0
+    assert (quoted.additions, quoted.deletions) == (1, 1)
+
+
+def test_parse_unified_diff_truncates_long_patch_but_keeps_counts():
+    """patch가 max_patch_chars를 넘으면 잘라내고 라인 수는 끝까지 센다."""
+    body = "\n".join(f"+line {i}" for i in range(100))
+    diff = f"diff --git a/big.txt b/big.txt\n--- a/big.txt\n+++ b/big.txt\n@@ -0,0 +1,100 @@\n{body}\n"
+
+    (big,) = parse_unified_diff(diff, max_patch_chars=100)
+
+    assert big.additions == 100
+    assert len(big.patch) <= 100
+
+
+def test_truncation_stops_at_oversized_line_without_shifting_lines():
+    """한도를 넘는 줄 뒤의 짧은 줄은 patch에 붙이지 않아 라인 번호가 어긋나지 않는다."""
+    long_line = "+" + "x" * 60
+    diff = (
+        "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n"
+        f"@@ -1,3 +1,4 @@\n a\n{long_line}\n+b\n c\n"
+    )
+
+    (file,) = parse_unified_diff(diff, max_patch_chars=40)
+
+    assert file.patch_truncated
+    assert file.patch == "@@ -1,3 +1,4 @@\n a"
+    assert commentable_lines(file.patch) == {1}
+    assert file.additions == 2
+
+
+def test_truncation_keeps_last_complete_hunk():
+    """두 번째 hunk에서 한도를 넘으면 첫 hunk까지만 남긴다."""
+    diff = (
+        "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n"
+        "@@ -1,2 +1,2 @@\n a\n+b\n@@ -20,2 +20,3 @@\n c\n+" + "y" * 60 + "\n d\n"
+    )
+
+    (file,) = parse_unified_diff(diff, max_patch_chars=40)
+
+    assert file.patch == "@@ -1,2 +1,2 @@\n a\n+b"
+    assert file.patch_truncated
+
+
+def test_parse_unified_diff_handles_mode_only_change():
+    """내용 변경 없는 모드 변경은 patch 없이 modified로 읽는다."""
+    diff = "diff --git a/run.sh b/run.sh\nold mode 100644\nnew mode 100755\n"
+
+    (run,) = parse_unified_diff(diff)
+
+    assert (run.filename, run.status, run.patch, run.changes) == ("run.sh", "modified", None, 0)
+
+
+@pytest.mark.asyncio
+async def test_iter_file_changes_yields_each_file_as_it_completes():
+    """다음 파일 헤더가 도착하면 직전 파일을 바로 내보낸다."""
+    consumed = []
+
+    async def lines():
+        for line in SAMPLE_DIFF.splitlines():
+            consumed.append(line)
+            yield line
+
+    stream = iter_file_changes(lines())
+    first = await anext(stream)
+
+    assert first.filename == "app/main.py"
+    assert consumed[-1] == "diff --git a/docs/new file.md b/docs/new file.md"
+    assert len([f async for f in stream]) == 5
+
+
+@pytest.mark.asyncio
+async def test_diff_collector_parses_streamed_diff():
+    """diff 수집기는 files API 대신 스트리밍 diff로 파일 목록을 만든다."""
+    async def diff_lines(**_):
+        for line in SAMPLE_DIFF.splitlines():
+            yield line
+
+    client = MagicMock()
+    client.get_pr_details = AsyncMock(return_value={"number": 7})
+    client.get_pr_commits = AsyncMock(return_value=[])
+    client.get_pr_files = AsyncMock()
+    client.iter_pr_diff_lines = diff_lines
+
+    _, files_data, _ = await DiffPRDataCollector(client)._fetch_pr_payloads("1", "o", "r", 7, True)
+
+    assert len(files_data) == 6
+    assert files_data[4]["is_binary"] is True
+    client.get_pr_files.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_diff_collector_falls_back_to_files_api_when_diff_too_large():
+    """diff가 너무 커서 406을 받으면 files API로 조회한다."""
+    async def diff_lines(**_):
+        request = httpx.Request("GET", "https://api.test/repos/o/r/pulls/7")
+        raise httpx.HTTPStatusError("too large", request=request, response=httpx.Response(406, request=request))
+        yield
+
+    client = MagicMock()
+    client.get_pr_details = AsyncMock(return_value={"number": 7})
+    client.get_pr_files = AsyncMock(return_value=[{"filename": "a.py", "status": "modified"}])
+    client.iter_pr_diff_lines = diff_lines
+
+    _, files_data, commits_data = await DiffPRDataCollector(client)._fetch_pr_payloads("1", "o", "r", 7, False)
+
+    assert files_data == [{"filename": "a.py", "status": "modified"}]
+    assert commits_data == []
+
+
+@pytest.mark.asyncio
+async def test_diff_collector_keeps_truncated_flag():
+    """diff 수집기가 만든 FileChange에도 patch 잘림 표시가 남는다."""
+    diff = "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1,1 +1,2 @@\n a\n+" + "x" * 60
+
+    async def diff_lines(**_):
+        for line in diff.splitlines():
+            yield line
+
+    client = MagicMock()
+    client.iter_pr_diff_lines = diff_lines
+
+    with patch.object(settings, "github_diff_max_patch_chars", 40):
+        files = await DiffPRDataCollector(client).collect_files("1", "o", "r", 7, total=1)
+
+    assert files[0].patch_truncated
@@ -0,0 +1,125 @@
+"""리뷰 작업 등록 헬퍼 단위 테스트."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.webhook.handlers._helpers import enqueue_review
+
+
+def make_kwargs(**overrides) -> dict:
+    kwargs = {
+        "installation_id": "99",
+        "github_repo_id": 111,
+        "github_pr_id": 999,
+        "repo_owner": "test-user",
+        "repo_name": "test-repo",
+        "pr_number": 1,
+        "head_sha": "abc1234",
+        "trigger_source": "push",
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+@pytest.fixture
+def mock_session():
+    return AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def no_existing_review():
+    with (
+        patch("app.webhook.handlers._helpers.find_active_review_job", new_callable=AsyncMock, return_value=None) as mock_active,
+        patch("app.webhook.handlers._helpers.review_exists_for_head_sha", new_callable=AsyncMock, return_value=False) as mock_exists,
+        patch("app.webhook.handlers._helpers.get_pr_scheduling_hints", new_callable=AsyncMock, return_value=(None, None)),
+    ):
+        yield mock_active, mock_exists
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock, return_value=MagicMock(id=1))
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=2)
+async def test_new_head_sha_supersedes_previous_jobs(mock_supersede, mock_enqueue, mock_session):
+    """새 head_sha 등록 → 같은 PR의 이전 커밋 작업 supersede 후 등록."""
+    await enqueue_review(mock_session, **make_kwargs())
+    mock_supersede.assert_awaited_once_with(mock_session, 111, 1, "abc1234")
+    mock_enqueue.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.settings.review_debounce_seconds", 30)
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock, return_value=MagicMock(id=1))
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_debounce_applies_only_to_push(mock_supersede, mock_enqueue, mock_session):
+    """push 트리거만 debounce 지연 적용, /re-review는 즉시."""
+    await enqueue_review(mock_session, **make_kwargs(trigger_source="push"))
+    assert mock_enqueue.call_args.kwargs["delay_seconds"] == 30
+
+    await enqueue_review(mock_session, **make_kwargs(trigger_source="re_review_command"))
+    assert mock_enqueue.call_args.kwargs["delay_seconds"] == 0
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock)
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_existing_review_skips(mock_supersede, mock_enqueue, mock_session, no_existing_review):
+    """같은 head_sha 리뷰가 이미 저장됨 → 등록 스킵 (이전 작업도 건드리지 않음)."""
+    no_existing_review[1].return_value = True
+    assert await enqueue_review(mock_session, **make_kwargs(trigger_source="ready_for_review")) is None
+    mock_supersede.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock, return_value=MagicMock(id=1))
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_force_bypasses_existing_review(mock_supersede, mock_enqueue, mock_session, no_existing_review):
+    """force=True(/re-review) → 기존 리뷰가 있어도 등록."""
+    no_existing_review[1].return_value = True
+    await enqueue_review(mock_session, **make_kwargs(trigger_source="re_review_command"), force=True)
+    mock_enqueue.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock)
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_active_job_skips_even_with_force(mock_supersede, mock_enqueue, mock_session, no_existing_review):
+    """같은 head_sha 작업이 대기/실행 중 → force여도 등록 스킵."""
+    no_existing_review[0].return_value = MagicMock(id=7)
+    assert await enqueue_review(mock_session, **make_kwargs(), force=True) is None
+    mock_enqueue.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock, return_value=None)
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_concurrent_insert_conflict_returns_none(mock_supersede, mock_enqueue, mock_session):
+    """동시에 같은 작업이 등록돼 INSERT가 충돌 → None 반환."""
+    assert await enqueue_review(mock_session, **make_kwargs()) is None
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.get_pr_scheduling_hints", new_callable=AsyncMock, return_value=(2, "HIGH"))
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock, return_value=MagicMock(id=1))
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_priority_combines_trigger_and_triage(mock_supersede, mock_enqueue, mock_triage, mock_session):
+    """작업 우선순위 = 트리거 기본값 + PR triage_priority."""
+    await enqueue_review(mock_session, **make_kwargs(trigger_source="re_review_command"), force=True)
+    assert mock_enqueue.call_args.kwargs["priority"] == 3 + 2
+
+
+@pytest.mark.asyncio
+@patch("app.webhook.handlers._helpers.settings.review_saturation_queue_depth", 10)
+@patch("app.webhook.handlers._helpers.settings.review_low_risk_defer_seconds", 300)
+@patch("app.webhook.handlers._helpers.count_pending_review_jobs", new_callable=AsyncMock, return_value=10)
+@patch("app.webhook.handlers._helpers.get_pr_scheduling_hints", new_callable=AsyncMock, return_value=(None, "LOW"))
+@patch("app.webhook.handlers._helpers.enqueue_review_job", new_callable=AsyncMock, return_value=MagicMock(id=1))
+@patch("app.webhook.handlers._helpers.supersede_review_jobs", new_callable=AsyncMock, return_value=0)
+async def test_low_risk_deferred_when_saturated(mock_supersede, mock_enqueue, mock_hints, mock_pending, mock_session):
+    """큐 포화 + 직전 위험도 LOW → 지연 등록 및 우선순위 하향, /re-review는 즉시."""
+    await enqueue_review(mock_session, **make_kwargs(trigger_source="push"))
+    kwargs = mock_enqueue.call_args.kwargs
+    assert kwargs["delay_seconds"] == 300
+    assert kwargs["priority"] == 0
+
+    await enqueue_review(mock_session, **make_kwargs(trigger_source="re_review_command"), force=True)
+    assert mock_enqueue.call_args.kwargs["delay_seconds"] == 0
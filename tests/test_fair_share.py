@@ -0,0 +1,79 @@
+"""installation별 공정 분배 정책 단위 테스트."""
+import pytest
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from app.database.models import ReviewJob
+from app.reviewer.usage import TokenUsageCallback
+from app.services.fair_share import (
+    InstallationLimits,
+    get_installation_limits,
+    is_installation_blocked,
+    pick_fair_share_job,
+)
+
+
+def make_job(job_id: int, installation_id: str) -> ReviewJob:
+    return ReviewJob(id=job_id, installation_id=installation_id)
+
+
+def equal_weight(_: str) -> InstallationLimits:
+    return InstallationLimits(weight=1.0, max_concurrent=0, daily_token_quota=0)
+
+
+def test_pick_prefers_installation_with_fewer_running():
+    """대량 installation이 슬롯을 차지하고 있으면 다른 installation 작업을 먼저 선택."""
+    candidates = [make_job(1, "big"), make_job(2, "big"), make_job(3, "small")]
+    job = pick_fair_share_job(candidates, {"big": 3}, equal_weight)
+    assert job.id == 3
+
+
+def test_pick_keeps_priority_order_on_tie():
+    """실행 중 비율이 같으면 우선순위 순서(앞선 후보) 유지."""
+    candidates = [make_job(1, "a"), make_job(2, "b")]
+    assert pick_fair_share_job(candidates, {}, equal_weight).id == 1
+
+
+def test_pick_respects_weight():
+    """가중치가 큰 installation은 더 많은 슬롯을 배분받음."""
+    def limits(installation_id: str) -> InstallationLimits:
+        weight = 4.0 if installation_id == "heavy" else 1.0
+        return InstallationLimits(weight=weight, max_concurrent=0, daily_token_quota=0)
+
+    candidates = [make_job(1, "heavy"), make_job(2, "light")]
+    assert pick_fair_share_job(candidates, {"heavy": 2, "light": 1}, limits).id == 1
+
+
+def test_pick_returns_none_without_candidates():
+    """후보가 없으면 None."""
+    assert pick_fair_share_job([], {}, equal_weight) is None
+
+
+def test_blocked_by_concurrency_cap_and_quota():
+    """동시 실행 한도 또는 일일 토큰 한도 도달 시 차단, 0은 무제한."""
+    limits = InstallationLimits(weight=1.0, max_concurrent=2, daily_token_quota=1000)
+    assert is_installation_blocked(limits, running=2, tokens_today=0)
+    assert is_installation_blocked(limits, running=0, tokens_today=1000)
+    assert not is_installation_blocked(limits, running=1, tokens_today=999)
+    assert not is_installation_blocked(equal_weight("x"), running=100, tokens_today=10**9)
+
+
+@patch("app.services.fair_share.settings.installation_max_concurrent_reviews", 2)
+@patch("app.services.fair_share.settings.installation_limit_overrides", {"42": {"weight": 3, "max_concurrent": 5}})
+def test_installation_limits_override():
+    """override가 있는 installation만 기본 한도를 덮어씀."""
+    assert get_installation_limits("42") == InstallationLimits(weight=3.0, max_concurrent=5, daily_token_quota=0)
+    assert get_installation_limits("7").max_concurrent == 2
+
+
+@pytest.mark.asyncio
+async def test_token_usage_callback_sums_usage_metadata():
+    """LLM 응답의 usage_metadata 토큰 수를 누적."""
+    usage = TokenUsageCallback()
+    message = AIMessage(content="ok", usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15})
+    result = LLMResult(generations=[[ChatGeneration(message=message)]])
+    await usage.on_llm_end(result)
+    await usage.on_llm_end(result)
+    assert usage.total_tokens == 30
@@ -0,0 +1,327 @@
+"""GitHubClient 공유 HTTP 클라이언트 단위 테스트."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.github.cache import CachedResponse, ResponseCache
+from app.github.client import GitHubClient
+from app.github.rate_limit import GitHubRateLimiter
+
+
+def make_client(handler, cache: ResponseCache | None = None) -> GitHubClient:
+    if cache is None:
+        cache = ResponseCache(100, 1 << 20)
+    client = GitHubClient(
+        base_url="https://api.test",
+        cache=cache,
+        rate_limiter=GitHubRateLimiter(0.2, 0.1, max_wait_seconds=60),
+    )
+    client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def requests_seen():
+    return []
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_http_client(requests_seen):
+    """여러 API 호출이 같은 httpx 클라이언트를 재사용한다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        return httpx.Response(200, json=[])
+
+    client = make_client(handler)
+    http = client._http
+
+    await client.get_pr_files("1", "o", "r", 7)
+    await client.get_pr_commits("1", "o", "r", 7)
+
+    assert client._http is http
+    assert [r.url.path for r in requests_seen if "/pulls/" in r.url.path] == [
+        "/repos/o/r/pulls/7/files",
+        "/repos/o/r/pulls/7/commits",
+    ]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_sets_auth_and_accept_headers(requests_seen):
+    """토큰과 Accept 헤더가 요청마다 붙는다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200, text="content")
+
+    client = make_client(handler)
+    response = await client._request("GET", "/x", "tok", accept="application/vnd.github.raw+json")
+
+    assert response.text == "content"
+    assert requests_seen[0].headers["Authorization"] == "Bearer tok"
+    assert requests_seen[0].headers["Accept"] == "application/vnd.github.raw+json"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_raises_on_error_status():
+    """에러 응답이면 HTTPStatusError를 던진다."""
+    client = make_client(lambda request: httpx.Response(404, json={"message": "Not Found"}))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._request("GET", "/missing", "tok")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_recreates_client_on_next_use():
+    """aclose 후 다시 호출하면 새 클라이언트를 만든다."""
+    client = make_client(lambda request: httpx.Response(200, json={}))
+    old = client._http
+
+    await client.aclose()
+    assert client._http is None
+    assert client._get_http() is not old
+    await client.aclose()
+
+
+def token_handler(calls: list, delay: float = 0.0):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(delay)
+        installation_id = request.url.path.split("/")[3]
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        return httpx.Response(
+            201,
+            json={"token": f"ghs_{installation_id}_{len(calls)}", "expires_at": expires_at.isoformat()},
+        )
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_installation_tokens_are_cached_per_installation():
+    """installation마다 별도 토큰을 캐시한다."""
+    calls = []
+    client = make_client(token_handler(calls))
+
+    first = await client.get_installation_token("1")
+    second = await client.get_installation_token("2")
+
+    assert first != second
+    assert await client.get_installation_token("1") == first
+    assert await client.get_installation_token("2") == second
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_token_requests_issue_once():
+    """같은 installation의 동시 요청은 발급 한 번으로 합쳐진다."""
+    calls = []
+    client = make_client(token_handler(calls, delay=0.05))
+
+    tokens = await asyncio.gather(*(client.get_installation_token("1") for _ in range(5)))
+
+    assert len(set(tokens)) == 1
+    assert len(calls) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_token_near_expiry_is_refreshed_in_background():
+    """만료가 가까운 토큰은 그대로 반환하고 백그라운드에서 새로 받는다."""
+    calls = []
+    client = make_client(token_handler(calls))
+    client._installation_tokens["1"] = ("ghs_old", datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert await client.get_installation_token("1") == "ghs_old"
+    await asyncio.sleep(0.01)
+
+    assert len(calls) == 1
+    assert await client.get_installation_token("1") == "ghs_1_1"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_reissued():
+    """곧 만료되는 토큰은 쓰지 않고 새 토큰을 기다린다."""
+    calls = []
+    client = make_client(token_handler(calls))
+    client._installation_tokens["1"] = ("ghs_old", datetime.now(timezone.utc) + timedelta(seconds=10))
+
+    assert await client.get_installation_token("1") == "ghs_1_1"
+    await client.aclose()
+
+
+def test_app_jwt_is_reused_until_near_expiry():
+    """App JWT는 만료 직전까지 재사용한다."""
+    client = GitHubClient(base_url="https://api.test")
+
+    with patch("app.github.client.generate_jwt", side_effect=["jwt-1", "jwt-2"]) as mock_generate:
+        assert client._get_jwt() == "jwt-1"
+        assert client._get_jwt() == "jwt-1"
+        client._app_jwt_expires_at -= 600
+        assert client._get_jwt() == "jwt-2"
+
+    assert mock_generate.call_count == 2
+
+
+def etag_handler(requests_seen: list, etag: str = '"v1"'):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        requests_seen.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"number": 7, "title": "t"}, headers={"ETag": etag})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_get_revalidates_with_etag_and_reuses_body_on_304(requests_seen):
+    """두 번째 조회는 If-None-Match를 보내고 304면 캐시된 본문을 돌려준다."""
+    client = make_client(etag_handler(requests_seen))
+
+    first = await client.get_pr_details("1", "o", "r", 7)
+    second = await client.get_pr_details("1", "o", "r", 7)
+
+    assert first == second == {"number": 7, "title": "t"}
+    assert "If-None-Match" not in requests_seen[0].headers
+    assert requests_seen[1].headers["If-None-Match"] == '"v1"'
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_installation(requests_seen):
+    """다른 installation의 조회는 캐시된 검증자를 공유하지 않는다."""
+    client = make_client(etag_handler(requests_seen))
+
+    await client.get_pr_details("1", "o", "r", 7)
+    await client.get_pr_details("2", "o", "r", 7)
+
+    assert "If-None-Match" not in requests_seen[1].headers
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_new_client(tmp_path, requests_seen):
+    """디스크 계층에 저장된 검증자는 새 캐시 인스턴스에서도 재사용된다."""
+    first = make_client(etag_handler(requests_seen), ResponseCache(100, 1 << 20, disk_dir=tmp_path))
+    await first.get_pr_details("1", "o", "r", 7)
+    await first.aclose()
+
+    second = make_client(etag_handler(requests_seen), ResponseCache(100, 1 << 20, disk_dir=tmp_path))
+    assert await second.get_pr_details("1", "o", "r", 7) == {"number": 7, "title": "t"}
+    assert requests_seen[-1].headers["If-None-Match"] == '"v1"'
+    await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_evicts_by_entries_and_bytes():
+    """메모리 캐시는 항목 수와 본문 크기 한도를 넘으면 오래된 항목부터 버린다."""
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    await cache.put("a", CachedResponse('"a"', None, {}, b"1234"))
+    await cache.put("b", CachedResponse('"b"', None, {}, b"1234"))
+    await cache.put("c", CachedResponse('"c"', None, {}, b"1234"))
+    assert await cache.get("a") is None
+    assert len(cache) == 2
+
+    await cache.put("d", CachedResponse('"d"', None, {}, b"12345678"))
+    assert len(cache) == 1
+    assert await cache.get("d") is not None
+
+
+def paged_handler(requests_seen: list, total: int, link: bool = False):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        requests_seen.append(request)
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        start = (page - 1) * per_page
+        items = [{"filename": f"f{i}"} for i in range(start, min(start + per_page, total))]
+        headers = {}
+        if link and page == 1:
+            last = -(-total // per_page)
+            headers["Link"] = f'<{request.url.copy_set_param("page", last)}>; rel="last"'
+        return httpx.Response(200, json=items, headers=headers)
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_get_pr_files_fetches_all_pages_with_known_total(requests_seen):
+    """전체 개수를 알면 per_page=100으로 모든 페이지를 요청한다."""
+    client = make_client(paged_handler(requests_seen, total=250))
+
+    files = await client.get_pr_files("1", "o", "r", 7, total=250)
+
+    assert [f["filename"] for f in files] == [f"f{i}" for i in range(250)]
+    assert sorted(int(r.url.params["page"]) for r in requests_seen) == [1, 2, 3]
+    assert {r.url.params["per_page"] for r in requests_seen} == {"100"}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_pr_files_follows_link_header_without_total(requests_seen):
+    """전체 개수를 모르면 Link 헤더의 last 페이지까지 조회한다."""
+    client = make_client(paged_handler(requests_seen, total=205, link=True))
+
+    files = await client.get_pr_files("1", "o", "r", 7)
+
+    assert len(files) == 205
+    assert len(requests_seen) == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_pr_files_stops_at_api_limit(requests_seen):
+    """GitHub 상한(3000개)을 넘는 페이지는 요청하지 않는다."""
+    client = make_client(paged_handler(requests_seen, total=3500))
+
+    files = await client.get_pr_files("1", "o", "r", 7, total=3500)
+
+    assert len(files) == 3000
+    assert len(requests_seen) == 30
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_pr_diff_lines_streams_unified_diff(requests_seen):
+    """PR diff를 diff Accept 헤더로 한 번 요청해 줄 단위로 내보낸다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        return httpx.Response(200, content=b"diff --git a/x b/x\n@@ -1 +1 @@\n-a\n+b\n")
+
+    client = make_client(handler)
+
+    lines = [line async for line in client.iter_pr_diff_lines("1", "o", "r", 7)]
+
+    assert lines == ["diff --git a/x b/x", "@@ -1 +1 @@", "-a", "+b"]
+    assert requests_seen[-1].headers["Accept"] == "application/vnd.github.diff"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_download_tarball_follows_redirect_to_file(tmp_path):
+    """tarball 요청의 리다이렉트를 따라가 본문을 파일로 저장한다."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        if request.url.host == "codeload.test":
+            return httpx.Response(200, content=b"tarball-bytes")
+        return httpx.Response(302, headers={"location": "https://codeload.test/o/r/legacy.tar.gz/abc"})
+
+    client = make_client(handler)
+    destination = tmp_path / "repo.tar.gz"
+
+    size = await client.download_tarball("1", "o", "r", "abc", destination)
+
+    assert size == len(b"tarball-bytes")
+    assert destination.read_bytes() == b"tarball-bytes"
+    await client.aclose()
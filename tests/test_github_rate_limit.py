@@ -0,0 +1,107 @@
+"""GitHub rate limit 스로틀링 단위 테스트."""
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app import metrics
+from app.github.cache import ResponseCache
+from app.github.client import GitHubClient
+from app.github.rate_limit import PRIORITY_LOW, GitHubRateLimiter, RateLimitBudgetExceeded
+
+
+def rate_headers(remaining: int, limit: int = 5000, reset_in: float = 3600) -> dict:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+
+@pytest.fixture
+def limiter():
+    metrics.reset()
+    return GitHubRateLimiter(throttle_ratio=0.2, low_priority_reserve_ratio=0.1, max_wait_seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_update_exposes_remaining_budget(limiter):
+    """응답 헤더의 남은 예산을 installation별 게이지로 노출한다."""
+    limiter.update("1", httpx.Response(200, headers=rate_headers(4321)))
+
+    assert metrics.get_value("github_rate_limit_remaining", installation="1") == 4321
+
+
+@pytest.mark.asyncio
+async def test_low_priority_request_is_shed_when_budget_scarce(limiter):
+    """예산이 예비분 아래면 저우선순위 요청은 보내지 않는다."""
+    limiter.update("1", httpx.Response(200, headers=rate_headers(100)))
+
+    with pytest.raises(RateLimitBudgetExceeded):
+        await limiter.acquire("1", PRIORITY_LOW)
+    assert metrics.get_value("github_requests_shed_total", installation="1") == 1
+
+
+@pytest.mark.asyncio
+async def test_normal_requests_are_paced_when_budget_low(limiter):
+    """예산이 스로틀 비율 아래면 남은 요청을 reset까지 나눠 보낸다."""
+    limiter.update("1", httpx.Response(200, headers=rate_headers(500, reset_in=1000)))
+
+    with patch("app.github.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire("1")
+        await limiter.acquire("1")
+
+    waits = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(waits) == 1
+    assert waits[0] == pytest.approx(2.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_requests_not_paced_with_ample_budget(limiter):
+    """예산이 넉넉하면 기다리지 않는다."""
+    limiter.update("1", httpx.Response(200, headers=rate_headers(4000)))
+
+    with patch("app.github.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire("1")
+        await limiter.acquire("1", PRIORITY_LOW)
+
+    mock_sleep.assert_not_awaited()
+
+
+def test_backoff_uses_retry_after_with_jitter(limiter):
+    """Retry-After가 있으면 그 시간에 지터를 더해 기다린다."""
+    wait = limiter.backoff("1", httpx.Response(429, headers={"Retry-After": "10"}), attempt=0)
+
+    assert 10 <= wait <= 12
+    assert metrics.get_value("github_rate_limited_total", installation="1") == 1
+
+
+def test_backoff_ignores_permission_403(limiter):
+    """rate limit과 무관한 403은 재시도하지 않는다."""
+    response = httpx.Response(403, json={"message": "Resource not accessible by integration"})
+
+    assert limiter.backoff("1", response, attempt=0) is None
+
+
+@pytest.mark.asyncio
+async def test_client_retries_after_secondary_rate_limit(limiter):
+    """2차 rate limit 응답을 받으면 대기 후 다시 요청한다."""
+    responses = iter([
+        httpx.Response(403, json={"message": "You have exceeded a secondary rate limit"}, headers={"Retry-After": "5"}),
+        httpx.Response(200, json={"number": 7}),
+    ])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        return next(responses)
+
+    client = GitHubClient(base_url="https://api.test", cache=ResponseCache(10, 1 << 20), rate_limiter=limiter)
+    client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    with patch("app.github.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        assert await client.get_pr_details("1", "o", "r", 7) == {"number": 7}
+
+    assert 5 <= mock_sleep.await_args.args[0] <= 7
+    await client.aclose()
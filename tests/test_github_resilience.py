@@ -0,0 +1,169 @@
+"""GitHub 일시적 오류 재시도와 호스트별 circuit breaker 단위 테스트."""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.github.cache import ResponseCache
+from app.github.client import GitHubClient
+from app.github.rate_limit import GitHubRateLimiter
+from app.github.resilience import CircuitBreaker, CircuitOpenError, can_retry, retry_delay
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    with patch.object(settings, "github_retry_base_delay_seconds", 0.0):
+        yield
+
+
+def make_client(handler, breaker: CircuitBreaker | None = None) -> GitHubClient:
+    client = GitHubClient(
+        base_url="https://api.test",
+        cache=ResponseCache(100, 1 << 20),
+        rate_limiter=GitHubRateLimiter(0.2, 0.1, max_wait_seconds=60),
+        circuit_breaker=breaker or CircuitBreaker(failure_threshold=100, reset_seconds=30),
+    )
+    client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def make_handler(api_responses: list, requests_seen: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(201, json={"token": "ghs_test"})
+        requests_seen.append(request)
+        response = api_responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+def test_can_retry_allows_post_only_when_safe_or_not_sent():
+    """POST는 안전 표시가 있거나 요청이 전송되지 않은 연결 실패일 때만 재시도한다."""
+    assert can_retry("GET", retry_safe=False)
+    assert can_retry("POST", retry_safe=True)
+    assert not can_retry("POST", retry_safe=False)
+    assert not can_retry("POST", retry_safe=False, error=httpx.ReadTimeout("timeout"))
+    assert can_retry("POST", retry_safe=False, error=httpx.ConnectError("refused"))
+
+
+def test_can_retry_does_not_retry_put_after_response_may_be_lost():
+    """PR 병합 같은 PUT은 서버에 닿았을 수 있는 오류 뒤에는 다시 보내지 않는다."""
+    assert not can_retry("PUT", retry_safe=False)
+    assert not can_retry("PUT", retry_safe=False, error=httpx.ReadTimeout("timeout"))
+    assert can_retry("PUT", retry_safe=False, error=httpx.ConnectError("refused"))
+
+
+def test_retry_delay_is_capped_full_jitter():
+    """대기 시간은 0 ~ base·2^attempt 사이이며 상한을 넘지 않는다."""
+    delays = [retry_delay(attempt, 0.5, 4.0) for attempt in range(6) for _ in range(20)]
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert all(retry_delay(0, 0.5, 4.0) <= 0.5 for _ in range(20))
+
+
+def test_circuit_opens_after_threshold_and_closes_on_probe_success():
+    """연속 실패가 한도에 닿으면 열리고, reset 후 시험 요청이 성공하면 닫힌다."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+    breaker.record_failure("api.test")
+    breaker.before_request("api.test")
+    breaker.record_failure("api.test")
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("api.test")
+    breaker.before_request("other.test")
+
+    with patch("app.github.resilience.time.monotonic", return_value=10**9):
+        breaker.before_request("api.test")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("api.test")
+    breaker.record_success("api.test")
+
+    assert not breaker.is_open("api.test")
+    breaker.before_request("api.test")
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_502():
+    """GET은 502를 받으면 다시 보내 성공한 응답을 돌려준다."""
+    seen = []
+    client = make_client(make_handler([httpx.Response(502), httpx.Response(200, json={"number": 7})], seen))
+
+    data = await client.get_pr_details("1", "o", "r", 7)
+
+    assert data == {"number": 7}
+    assert len(seen) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_gives_up_after_max_attempts():
+    """재시도 횟수를 다 쓰면 마지막 502로 HTTPStatusError를 던진다."""
+    seen = []
+    attempts = settings.github_retry_max_attempts + 1
+    client = make_client(make_handler([httpx.Response(502) for _ in range(attempts)], seen))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_pr_details("1", "o", "r", 7)
+
+    assert len(seen) == attempts
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_comment_post_is_not_retried_after_502():
+    """코멘트 작성 POST는 서버에 닿았을 수 있으므로 502를 받아도 다시 보내지 않는다."""
+    seen = []
+    client = make_client(make_handler([httpx.Response(502), httpx.Response(201, json={"id": 1})], seen))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.create_pr_comment("1", "o", "r", 7, "본문")
+
+    assert len(seen) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_comment_post_is_retried_after_connect_error():
+    """전송되지 않은 연결 실패는 POST라도 다시 보낸다."""
+    seen = []
+    responses = [httpx.ConnectError("refused"), httpx.Response(201, json={"id": 5})]
+    client = make_client(make_handler(responses, seen))
+
+    comment = await client.create_pr_comment("1", "o", "r", 7, "본문")
+
+    assert comment == {"id": 5}
+    assert len(seen) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_sending():
+    """circuit이 열리면 요청을 보내지 않고 CircuitOpenError를 던진다."""
+    seen = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+    client = make_client(make_handler([httpx.Response(503) for _ in range(10)], seen), breaker)
+
+    with pytest.raises(CircuitOpenError):
+        await client.get_pr_details("1", "o", "r", 7)
+    with pytest.raises(CircuitOpenError):
+        await client.get_pr_details("1", "o", "r", 8)
+
+    assert len(seen) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_merge_is_not_retried_after_504():
+    """병합 PUT은 504를 받아도 다시 보내지 않아, 이미 병합된 PR에 405를 받지 않는다."""
+    seen = []
+    client = make_client(make_handler([httpx.Response(504), httpx.Response(405)], seen))
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.merge_pull_request("1", "o", "r", 7)
+
+    assert exc_info.value.response.status_code == 504
+    assert len(seen) == 1
+    await client.aclose()
@@ -0,0 +1,119 @@
+"""GraphQL PR 데이터 수집기 단위 테스트."""
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.github.graphql_collector import GraphQLPRDataCollector
+
+
+def make_pr_node(files_page: dict | None, commits_page: dict | None) -> dict:
+    node = {
+        "number": 7,
+        "title": "Add feature",
+        "body": "body",
+        "state": "MERGED",
+        "url": "https://github.com/o/r/pull/7",
+        "additions": 12,
+        "deletions": 3,
+        "changedFiles": 2,
+        "baseRefName": "main",
+        "baseRefOid": "b" * 40,
+        "headRefName": "feature",
+        "headRefOid": "h" * 40,
+        "author": {"login": "alice", "avatarUrl": None, "databaseId": 42},
+    }
+    if files_page is not None:
+        node["files"] = files_page
+    if commits_page is not None:
+        node["commits"] = commits_page
+    return {"repository": {"pullRequest": node}}
+
+
+def page(nodes: list, next_cursor: str | None) -> dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": next_cursor is not None, "endCursor": next_cursor}}
+
+
+def commit_node(sha: str, user: dict | None) -> dict:
+    return {"commit": {
+        "oid": sha, "message": f"commit {sha}", "url": None,
+        "author": {"name": "Alice", "date": "2026-01-01T00:00:00Z", "user": user},
+    }}
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.base_url = "https://api.test"
+    client.graphql = AsyncMock(side_effect=[
+        make_pr_node(
+            page([{"path": "a.py", "additions": 10, "deletions": 2, "changeType": "MODIFIED"}], "f1"),
+            {**page([commit_node("c1", {"login": "alice", "databaseId": 42, "avatarUrl": None})], None),
+             "totalCount": 1},
+        ),
+        make_pr_node(page([{"path": "b.py", "additions": 2, "deletions": 1, "changeType": "ADDED"}], None), None),
+    ])
+    client.get_pr_files = AsyncMock(return_value=[
+        {"filename": "a.py", "status": "modified", "additions": 10, "deletions": 2, "changes": 12, "patch": "@@ a"},
+    ])
+    return client
+
+
+@pytest.mark.asyncio
+async def test_collects_pr_data_with_cursor_pagination(client):
+    """파일 커서가 남아 있으면 파일 연결만 다시 조회해 PRData를 만든다."""
+    pr_data = await GraphQLPRDataCollector(client).collect_pr_data("1", "o", "r", 7)
+
+    assert client.graphql.await_count == 2
+    second_vars = client.graphql.await_args_list[1].args[2]
+    assert second_vars["filesCursor"] == "f1"
+    assert second_vars["withCommits"] is False
+
+    assert pr_data.state == "closed"
+    assert pr_data.author.login == "alice"
+    assert pr_data.head_sha == "h" * 40
+    assert [f.filename for f in pr_data.files] == ["a.py", "b.py"]
+    assert pr_data.changed_files_count == 2
+    assert pr_data.commits_count == 1
+    assert pr_data.commits[0].author.login == "alice"
+
+
+@pytest.mark.asyncio
+async def test_patches_come_from_rest_files(client):
+    """patch는 REST files 응답에서 가져오고, 없는 파일은 patch 없이 유지한다."""
+    pr_data = await GraphQLPRDataCollector(client).collect_pr_data("1", "o", "r", 7)
+
+    assert pr_data.get_file_by_name("a.py").patch == "@@ a"
+    added = pr_data.get_file_by_name("b.py")
+    assert added.patch is None
+    assert added.status == "added"
+    assert added.changes == 3
+
+
+@pytest.mark.asyncio
+async def test_metadata_collection_uses_graphql_only(client):
+    """메타데이터 수집은 GraphQL만 쓰고, patch는 load_patches를 부를 때 REST로 받는다."""
+    collector = GraphQLPRDataCollector(client)
+
+    pr_data = await collector.collect_pr_metadata("1", "o", "r", 7)
+
+    client.get_pr_files.assert_not_awaited()
+    assert [f.patch for f in pr_data.files] == [None, None]
+
+    loaded = await collector.load_patches("1", "o", "r", pr_data)
+
+    assert client.get_pr_files.await_args.kwargs["total"] == 2
+    assert loaded.get_file_by_name("a.py").patch == "@@ a"
+    assert await collector.load_patches("1", "o", "r", loaded) is loaded
+    client.get_pr_files.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_missing_pull_request_raises_not_found(client):
+    """pullRequest가 null이면 REST 조회와 같은 404 HTTPStatusError를 던진다."""
+    client.graphql = AsyncMock(return_value={"repository": {"pullRequest": None}})
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await GraphQLPRDataCollector(client).collect_pr_metadata("1", "o", "r", 7)
+
+    assert exc_info.value.response.status_code == 404
@@ -53,37 +53,37 @@ def mock_session():
 # ── 필터링 ────────────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_non_created_action_skips(mock_pipeline, mock_session):
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_non_created_action_skips(mock_enqueue, mock_session):
     """created 아닌 액션 → 스킵."""
     payload = make_payload()
     payload["action"] = "edited"
     await handle_issue_comment("edited", payload, mock_session)
-    mock_pipeline.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_non_pr_comment_skips(mock_pipeline, mock_session):
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_non_pr_comment_skips(mock_enqueue, mock_session):
     """PR 아닌 이슈 코멘트 → 스킵."""
     await handle_issue_comment("created", make_payload(is_pr=False), mock_session)
-    mock_pipeline.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_closed_pr_skips(mock_pipeline, mock_session):
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_closed_pr_skips(mock_enqueue, mock_session):
     """닫힌 PR → 스킵."""
     await handle_issue_comment("created", make_payload(state="closed"), mock_session)
-    mock_pipeline.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_no_re_review_command_skips(mock_pipeline, mock_session):
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_no_re_review_command_skips(mock_enqueue, mock_session):
     """/re-review 없는 코멘트 → 스킵."""
     await handle_issue_comment("created", make_payload(body="LGTM"), mock_session)
-    mock_pipeline.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
 
 
 # ── 쿨다운 ────────────────────────────────────────────────────────────────────
@@ -91,9 +91,9 @@ async def test_no_re_review_command_skips(mock_pipeline, mock_session):
 @pytest.mark.asyncio
 @patch("app.webhook.handlers.issue_comment.github_client.create_pr_comment", new_callable=AsyncMock)
 @patch("app.webhook.handlers.issue_comment.get_most_recent_review")
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_cooldown_active_posts_comment_and_skips(mock_pipeline, mock_recent, mock_comment, mock_session):
-    """쿨다운 중 → 안내 코멘트 게시, 파이프라인 스킵."""
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_cooldown_active_posts_comment_and_skips(mock_enqueue, mock_recent, mock_comment, mock_session):
+    """쿨다운 중 → 안내 코멘트 게시, 리뷰 등록 스킵."""
     mock_recent.return_value = AsyncMock(return_value=make_review(created_seconds_ago=10))
     mock_recent.return_value = make_review(created_seconds_ago=10)
 
@@ -101,79 +101,80 @@ async def test_cooldown_active_posts_comment_and_skips(mock_pipeline, mock_recen
         await handle_issue_comment("created", make_payload(), mock_session)
 
     mock_comment.assert_awaited_once()
-    mock_pipeline.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999})
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_cooldown_expired_runs_pipeline(mock_pipeline, mock_details, mock_session):
-    """쿨다운 만료 → 파이프라인 실행."""
+@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999, "head": {"sha": "abc1234"}})
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_cooldown_expired_runs_pipeline(mock_enqueue, mock_details, mock_session):
+    """쿨다운 만료 → 리뷰 등록."""
     old_review = make_review(created_seconds_ago=REVIEW_COOLDOWN_SECONDS + 1)
     with patch("app.webhook.handlers.issue_comment.get_most_recent_review", new_callable=AsyncMock, return_value=old_review):
         await handle_issue_comment("created", make_payload(), mock_session)
 
-    mock_pipeline.assert_awaited_once()
+    mock_enqueue.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999})
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_no_prior_review_runs_pipeline(mock_pipeline, mock_details, mock_session):
-    """이전 리뷰 없음 → 파이프라인 실행."""
+@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999, "head": {"sha": "abc1234"}})
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_no_prior_review_runs_pipeline(mock_enqueue, mock_details, mock_session):
+    """이전 리뷰 없음 → 리뷰 등록."""
     with patch("app.webhook.handlers.issue_comment.get_most_recent_review", new_callable=AsyncMock, return_value=None):
         await handle_issue_comment("created", make_payload(), mock_session)
 
-    mock_pipeline.assert_awaited_once()
+    mock_enqueue.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999})
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_re_review_passes_correct_trigger_source(mock_pipeline, mock_details, mock_session):
-    """파이프라인 실행 시 trigger_source='re_review_command' 전달."""
+@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999, "head": {"sha": "abc1234"}})
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_re_review_passes_correct_trigger_source(mock_enqueue, mock_details, mock_session):
+    """리뷰 등록 시 trigger_source='re_review_command' 전달."""
     with patch("app.webhook.handlers.issue_comment.get_most_recent_review", new_callable=AsyncMock, return_value=None):
         await handle_issue_comment("created", make_payload(), mock_session)
 
-    _, kwargs = mock_pipeline.call_args
+    _, kwargs = mock_enqueue.call_args
     assert kwargs["trigger_source"] == "re_review_command"
+    assert kwargs["force"] is True
 
 
 # ── 권한 검사 ─────────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999})
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_collaborator_is_authorized(mock_pipeline, mock_details, mock_session):
-    """COLLABORATOR → 파이프라인 실행."""
+@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999, "head": {"sha": "abc1234"}})
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_collaborator_is_authorized(mock_enqueue, mock_details, mock_session):
+    """COLLABORATOR → 리뷰 등록."""
     with patch("app.webhook.handlers.issue_comment.get_most_recent_review", new_callable=AsyncMock, return_value=None):
         await handle_issue_comment("created", make_payload(author_association="COLLABORATOR"), mock_session)
-    mock_pipeline.assert_awaited_once()
+    mock_enqueue.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999})
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_pr_author_is_authorized(mock_pipeline, mock_details, mock_session):
-    """외부인(NONE)이라도 본인 PR이면 파이프라인 실행."""
+@patch("app.webhook.handlers.issue_comment.github_client.get_pr_details", new_callable=AsyncMock, return_value={"id": 999, "head": {"sha": "abc1234"}})
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_pr_author_is_authorized(mock_enqueue, mock_details, mock_session):
+    """외부인(NONE)이라도 본인 PR이면 리뷰 등록."""
     with patch("app.webhook.handlers.issue_comment.get_most_recent_review", new_callable=AsyncMock, return_value=None):
         await handle_issue_comment(
             "created",
             make_payload(author_association="NONE", commenter_login="pr-author", pr_author_login="pr-author"),
             mock_session,
         )
-    mock_pipeline.assert_awaited_once()
+    mock_enqueue.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 @patch("app.webhook.handlers.issue_comment.github_client.create_pr_comment", new_callable=AsyncMock)
-@patch("app.webhook.handlers.issue_comment.run_full_review_pipeline", new_callable=AsyncMock)
-async def test_unauthorized_user_blocked(mock_pipeline, mock_comment, mock_session):
-    """외부인(NONE) + 다른 사람 PR → 파이프라인 스킵, 안내 코멘트 게시."""
+@patch("app.webhook.handlers.issue_comment.enqueue_review", new_callable=AsyncMock)
+async def test_unauthorized_user_blocked(mock_enqueue, mock_comment, mock_session):
+    """외부인(NONE) + 다른 사람 PR → 리뷰 등록 스킵, 안내 코멘트 게시."""
     await handle_issue_comment(
         "created",
         make_payload(author_association="NONE", commenter_login="outsider", pr_author_login="pr-author"),
         mock_session,
     )
-    mock_pipeline.assert_not_awaited()
+    mock_enqueue.assert_not_awaited()
     mock_comment.assert_awaited_once()
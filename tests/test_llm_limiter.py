@@ -0,0 +1,115 @@
+"""provider/model별 LLM 호출 동시성·속도 제한 단위 테스트."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app import metrics
+from app.reviewer import llm as llm_module
+from app.reviewer.llm import ainvoke_llm
+from app.reviewer.llm_limiter import LLMLimiter, ModelLimiter, llm_share_key, rate_limit_retry_after
+
+
+class RateLimited(Exception):
+    def __init__(self, retry_after: str | None = None):
+        super().__init__("429")
+        self.status_code = 429
+        self.response = SimpleNamespace(headers={"retry-after": retry_after} if retry_after else {})
+
+
+async def acquire_as(limiter: ModelLimiter, key: str, order: list[str], tokens: int = 1) -> None:
+    llm_share_key.set(key)
+    await limiter.acquire(tokens)
+    order.append(key)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_and_round_robin_between_reviews():
+    """동시 요청 수를 넘지 않고, 대기 요청은 리뷰를 번갈아 가며 차례를 받는다."""
+    limiter = ModelLimiter("test:m", max_concurrent=1, rpm=0, tpm=0)
+    order: list[str] = []
+    await limiter.acquire(1)
+
+    tasks = [asyncio.create_task(acquire_as(limiter, key, order)) for key in ["big", "big", "big", "small"]]
+    await asyncio.sleep(0)
+    assert order == [] and limiter.waiting == 4
+
+    for _ in range(4):
+        limiter.release(1, 1)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+    assert order == ["big", "small", "big", "big"]
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    """분당 토큰 예산이 모자라면 버킷이 찰 때까지 기다린다."""
+    limiter = ModelLimiter("test:m", max_concurrent=0, rpm=0, tpm=6000)
+    await limiter.acquire(6000)
+
+    started = asyncio.get_running_loop().time()
+    await limiter.acquire(10)
+
+    assert asyncio.get_running_loop().time() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_release_refunds_unused_reserved_tokens():
+    """예약한 토큰보다 실제 사용량이 적으면 차액을 돌려받는다."""
+    limiter = ModelLimiter("test:m", max_concurrent=0, rpm=0, tpm=1000)
+    await limiter.acquire(1000)
+    limiter.release(1000, 100)
+
+    await asyncio.wait_for(limiter.acquire(800), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed_from_queue():
+    """대기 중 취소된 요청은 큐에서 빠지고 슬롯을 잡지 않는다."""
+    limiter = ModelLimiter("test:m", max_concurrent=1, rpm=0, tpm=0)
+    await limiter.acquire(1)
+    task = asyncio.create_task(limiter.acquire(1))
+    await asyncio.sleep(0)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    limiter.release(1, 1)
+
+    assert limiter.waiting == 0 and limiter.in_flight == 0
+
+
+def test_rate_limit_retry_after_reads_header():
+    """429 예외면 Retry-After 값을, 아니면 None을 돌려준다."""
+    assert rate_limit_retry_after(RateLimited("3")) == 3.0
+    assert rate_limit_retry_after(RateLimited()) == 10.0
+    assert rate_limit_retry_after(ValueError("boom")) is None
+
+
+def test_overrides_apply_per_provider_then_model():
+    """override는 provider, provider:model 순서로 적용된다."""
+    overrides = {"ollama": {"max_concurrent": 1, "rpm": 30}, "ollama:big": {"rpm": 5}}
+    with patch.object(llm_module.settings, "llm_limit_overrides", overrides):
+        limiter = LLMLimiter().get("ollama", "big")
+
+    assert (limiter.max_concurrent, limiter.rpm) == (1, 5)
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_llm_retries_after_rate_limit_and_records_wait():
+    """429를 받으면 Retry-After 동안 막은 뒤 다시 호출하고, 대기/응답 시간을 따로 기록한다."""
+    response = SimpleNamespace(content="{}", usage_metadata={"total_tokens": 42})
+    llm = SimpleNamespace(model="m-retry", ainvoke=AsyncMock(side_effect=[RateLimited("0"), response]))
+    limiter = ModelLimiter("test:m-retry", max_concurrent=2, rpm=0, tpm=0)
+
+    with patch.object(llm_module.llm_limiter, "get", return_value=limiter):
+        result = await ainvoke_llm(llm, "prompt")
+
+    assert result is response
+    assert llm.ainvoke.await_count == 2
+    assert limiter.in_flight == 0
+    observations = metrics.snapshot()["observations"]
+    assert "llm_queue_wait_seconds" in observations and "llm_request_seconds" in observations
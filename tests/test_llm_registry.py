@@ -0,0 +1,44 @@
+"""LLM 인스턴스 재사용 레지스트리 단위 테스트."""
+from unittest.mock import patch
+
+import pytest
+
+from app.reviewer import llm as llm_module
+from app.reviewer.llm import close_llm_clients, get_llm
+
+
+@pytest.fixture
+def ollama_settings():
+    with patch.object(llm_module.settings, "llm_provider", "ollama"), \
+            patch.object(llm_module.settings, "ollama_base_url", "http://localhost:11434"):
+        yield
+    llm_module._llm_clients.clear()
+
+
+def test_get_llm_reuses_instance_for_same_settings(ollama_settings):
+    """같은 provider/temperature/추가 설정이면 같은 인스턴스를 돌려준다."""
+    first = get_llm(temperature=0.0)
+
+    assert get_llm(temperature=0.0) is first
+    assert get_llm(temperature=0.1) is not first
+    assert get_llm(temperature=0.0, model="qwen2.5") is not first
+
+
+def test_get_llm_does_not_cache_unhashable_settings(ollama_settings):
+    """해시할 수 없는 추가 설정이 있으면 캐시하지 않고 매번 만든다."""
+    first = get_llm(temperature=0.0, stop=["\n"])
+
+    assert get_llm(temperature=0.0, stop=["\n"]) is not first
+    assert llm_module._llm_clients == {}
+
+
+@pytest.mark.asyncio
+async def test_close_llm_clients_closes_connections_and_clears(ollama_settings):
+    """종료 시 인스턴스가 소유한 HTTP 클라이언트를 닫고 레지스트리를 비운다."""
+    llm = get_llm(temperature=0.0)
+    http = llm._async_client._client
+
+    await close_llm_clients()
+
+    assert http.is_closed
+    assert get_llm(temperature=0.0) is not llm
@@ -0,0 +1,40 @@
+"""운영 지표 모듈 단위 테스트."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import metrics
+from app.database.engine import _on_pool_checkin, _on_pool_checkout
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_counter_and_observation_snapshot():
+    """카운터는 라벨별로 누적, 관측값은 개수/합계/최댓값 집계."""
+    metrics.inc("events_total", event="push")
+    metrics.inc("events_total", event="push")
+    metrics.observe("latency_seconds", 0.5)
+    metrics.observe("latency_seconds", 1.5)
+
+    assert metrics.get_value("events_total", event="push") == 2
+    assert metrics.get_value("events_total", event="pull_request") == 0
+    latency = metrics.snapshot()["observations"]["latency_seconds"][0]
+    assert latency["count"] == 2
+    assert latency["sum"] == 2.0
+    assert latency["max"] == 1.5
+
+
+def test_pool_events_track_checked_out_connections():
+    """커넥션 대여/반납 → 사용 중 게이지 증감 및 점유 시간 기록."""
+    record = MagicMock(info={})
+    _on_pool_checkout(None, record, None)
+    assert metrics.get_value("db_pool_checked_out") == 1
+
+    _on_pool_checkin(None, record)
+    assert metrics.get_value("db_pool_checked_out") == 0
+    assert metrics.snapshot()["observations"]["db_connection_hold_seconds"][0]["count"] == 1
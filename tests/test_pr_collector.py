@@ -0,0 +1,66 @@
+"""REST PR 데이터 수집기 단위 테스트."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.github.pr_collector import PRDataCollector
+
+PR_DETAILS = {
+    "number": 7,
+    "title": "t",
+    "body": None,
+    "state": "open",
+    "user": {"login": "alice", "id": 1},
+    "base": {"ref": "main", "sha": "b" * 40},
+    "head": {"ref": "feature", "sha": "h" * 40},
+}
+
+
+def file_entry(name: str) -> dict:
+    return {"filename": name, "status": "modified", "additions": 1, "deletions": 0, "changes": 1, "patch": "@@"}
+
+
+@pytest.mark.asyncio
+async def test_collect_fetches_details_with_commits_then_files_with_total():
+    """PR 상세와 커밋은 동시에 요청하고, 파일은 changed_files로 전체 페이지를 알고 요청한다."""
+    started = []
+    release = asyncio.Event()
+
+    def fetcher(name: str, result):
+        async def fetch(**kwargs):
+            started.append((name, kwargs.get("total")))
+            await release.wait()
+            return result
+        return fetch
+
+    client = MagicMock()
+    client.get_pr_details = fetcher("details", {**PR_DETAILS, "changed_files": 250})
+    client.get_pr_files = fetcher("files", [file_entry("a.py")])
+    client.get_pr_commits = fetcher("commits", [])
+
+    task = asyncio.create_task(PRDataCollector(client).collect_pr_data("1", "o", "r", 7))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert sorted(name for name, _ in started) == ["commits", "details"]
+
+    release.set()
+    pr_data = await task
+    assert ("files", 250) in started
+    assert [f.filename for f in pr_data.files] == ["a.py"]
+
+
+@pytest.mark.asyncio
+async def test_collect_files_gathers_streamed_pages():
+    """파일 페이지가 도착하는 대로 FileChange로 바꿔 모은다."""
+    async def iter_pr_files(**kwargs):
+        assert kwargs["total"] == 3
+        yield [file_entry("a.py"), file_entry("b.py")]
+        yield [file_entry("c.py")]
+
+    client = MagicMock()
+    client.iter_pr_files = iter_pr_files
+
+    files = await PRDataCollector(client).collect_files("1", "o", "r", 7, total=3)
+
+    assert [f.filename for f in files] == ["a.py", "b.py", "c.py"]
@@ -0,0 +1,160 @@
+"""PR 상태 증분 동기화 단위 테스트."""
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.database.models import PullRequest, Repository
+from app.services.pr_sync import WATERMARK_SKEW, reconcile_active_repositories, reconcile_repository_prs
+
+
+def make_repo(prs_synced_at: datetime | None = None) -> Repository:
+    return Repository(
+        id=1, github_repo_id=111, owner="o", name="r", installation_id="99", prs_synced_at=prs_synced_at
+    )
+
+
+def make_session(open_numbers: list[int]) -> tuple[AsyncMock, dict[int, PullRequest]]:
+    prs = {n: PullRequest(repository_id=1, pr_number=n, github_pr_id=n, head_sha="h", state="open")
+           for n in open_numbers}
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(prs.values())
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session, prs
+
+
+def gh_pr(number: int, state: str, updated_at: datetime, merged: bool = False) -> dict:
+    return {
+        "number": number,
+        "state": state,
+        "merged_at": updated_at.isoformat() if merged else None,
+        "updated_at": updated_at.isoformat().replace("+00:00", "Z"),
+    }
+
+
+@pytest.mark.asyncio
+@patch("app.services.pr_sync.github_client")
+async def test_few_open_prs_are_fetched_directly(mock_client):
+    """open PR이 적으면 목록 대신 해당 PR만 조회한다."""
+    now = datetime.now(timezone.utc)
+    states = {1: gh_pr(1, "closed", now, merged=True), 2: gh_pr(2, "open", now), 3: gh_pr(3, "closed", now)}
+    mock_client.get_pr_details = AsyncMock(side_effect=lambda inst, owner, name, number: states[number])
+    mock_client.iter_prs = MagicMock()
+    session, prs = make_session([1, 2, 3])
+    repo = make_repo()
+
+    updated = await reconcile_repository_prs(session, repo)
+
+    assert sorted(updated, key=lambda u: u["pr_number"]) == [
+        {"pr_number": 1, "new_state": "merged"},
+        {"pr_number": 3, "new_state": "closed"},
+    ]
+    assert [prs[n].state for n in (1, 2, 3)] == ["merged", "open", "closed"]
+    assert repo.prs_synced_at <= now - WATERMARK_SKEW + timedelta(seconds=5)
+    mock_client.iter_prs.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.services.pr_sync.github_client")
+async def test_failed_fetch_keeps_watermark(mock_client):
+    """일부 PR 조회가 실패하면 조회된 상태만 반영하고 기준점은 옮기지 않는다."""
+    now = datetime.now(timezone.utc)
+    watermark = now - timedelta(hours=1)
+
+    async def get_pr_details(inst, owner, name, number):
+        if number == 2:
+            raise RuntimeError("boom")
+        return gh_pr(number, "closed", now)
+
+    mock_client.get_pr_details = AsyncMock(side_effect=get_pr_details)
+    session, prs = make_session([1, 2])
+    repo = make_repo(prs_synced_at=watermark)
+
+    updated = await reconcile_repository_prs(session, repo)
+
+    assert updated == [{"pr_number": 1, "new_state": "closed"}]
+    assert prs[2].state == "open"
+    assert repo.prs_synced_at == watermark
+
+
+@pytest.mark.asyncio
+@patch("app.services.pr_sync.settings")
+@patch("app.services.pr_sync.github_client")
+async def test_listing_stops_at_watermark(mock_client, mock_settings):
+    """open PR이 많으면 최근 갱신 순으로 읽다가 기준점보다 오래된 PR에서 멈춘다."""
+    mock_settings.pr_sync_direct_fetch_max = 1
+    watermark = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    pages_read = []
+
+    async def iter_prs(*args, **kwargs):
+        assert kwargs == {"state": "closed", "sort": "updated", "direction": "desc"}
+        for page in (
+            [gh_pr(5, "closed", watermark + timedelta(hours=2)), gh_pr(9, "closed", watermark + timedelta(hours=1))],
+            [gh_pr(6, "closed", watermark - timedelta(hours=1), merged=True)],
+            [gh_pr(7, "closed", watermark - timedelta(days=1))],
+        ):
+            pages_read.append(page)
+            yield page
+
+    mock_client.iter_prs = iter_prs
+    mock_client.get_pr_details = AsyncMock()
+    session, prs = make_session([5, 6])
+    repo = make_repo(prs_synced_at=watermark)
+
+    updated = await reconcile_repository_prs(session, repo)
+
+    assert updated == [{"pr_number": 5, "new_state": "closed"}]
+    assert prs[6].state == "open"
+    assert len(pages_read) == 2
+    assert repo.prs_synced_at > watermark
+    mock_client.get_pr_details.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.services.pr_sync.github_client")
+async def test_active_sync_calls_github_without_open_session(mock_client):
+    """주기 동기화는 세션을 닫은 상태에서 GitHub를 조회하고, 결과와 임대 해제를 별도 트랜잭션으로 기록한다."""
+    now = datetime.now(timezone.utc)
+    open_sessions = []
+    statements = []
+
+    def tracked_session():
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [1]
+        session = AsyncMock()
+
+        async def execute(stmt):
+            statements.append(stmt)
+            return result
+
+        session.execute.side_effect = execute
+
+        @asynccontextmanager
+        async def scope():
+            open_sessions.append(session)
+            try:
+                yield session
+            finally:
+                open_sessions.remove(session)
+
+        return scope()
+
+    async def get_pr_details(inst, owner, name, number):
+        assert open_sessions == []
+        return gh_pr(number, "closed", now, merged=True)
+
+    mock_client.get_pr_details = AsyncMock(side_effect=get_pr_details)
+    repo = make_repo()
+
+    with patch("app.services.pr_sync._claim_due_repositories", AsyncMock(return_value=[repo])), \
+         patch("app.services.pr_sync.async_session_factory", side_effect=tracked_session), \
+         patch("app.services.pr_sync.session_scope", side_effect=tracked_session):
+        updated = await reconcile_active_repositories(interval_seconds=60, concurrency=2)
+
+    assert updated == 1
+    mock_client.get_pr_details.assert_awaited_once()
+    params = statements[-1].compile().params
+    assert params["prs_sync_claimed_at"] is None
+    assert params["prs_synced_at"] <= now - WATERMARK_SKEW + timedelta(seconds=5)
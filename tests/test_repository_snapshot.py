@@ -0,0 +1,175 @@
+"""head_sha별 저장소 스냅샷 캐시 단위 테스트."""
+import io
+import os
+import tarfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.github.snapshot import SnapshotCache, git_blob_sha
+from app.models import FileChange
+from app.reviewer.nodes.file_reviewer import _fetch_context_files
+
+SHA_1 = "1" * 40
+SHA_2 = "2" * 40
+
+
+def make_tarball(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for path, content in files.items():
+            info = tarfile.TarInfo(f"o-r-{SHA_1[:7]}/{path}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def make_client(tarball: bytes) -> MagicMock:
+    async def download_tarball(installation_id, repo_owner, repo_name, ref, destination):
+        destination.write_bytes(tarball)
+        return len(tarball)
+
+    client = MagicMock()
+    client.download_tarball = AsyncMock(side_effect=download_tarball)
+    client.compare_commits = AsyncMock()
+    client.get_blob = AsyncMock()
+    return client
+
+
+def make_cache(tmp_path, **kwargs) -> SnapshotCache:
+    options = {"max_bytes": 0, "max_file_bytes": 1024, "max_delta_files": 100}
+    options.update(kwargs)
+    return SnapshotCache(tmp_path, **options)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_downloads_tarball_once_and_indexes_paths(tmp_path):
+    """tarball을 한 번 내려받아 경로별로 읽고, 같은 head_sha는 다시 내려받지 않는다."""
+    client = make_client(make_tarball({"main.py": b"app = 1\n", "pkg/big.bin": b"x" * 2048}))
+    cache = make_cache(tmp_path)
+
+    snapshot = await cache.get(client, "1", "o", "r", SHA_1)
+    again = await cache.get(client, "1", "o", "r", SHA_1)
+
+    assert again is snapshot
+    assert snapshot.read_text("main.py") == "app = 1\n"
+    assert snapshot.files["main.py"][2] == git_blob_sha(b"app = 1\n")
+    assert "pkg/big.bin" not in snapshot  # max_file_bytes 초과
+    client.download_tarball.assert_awaited_once()
+
+    # 프로세스가 재시작해도 디스크의 스냅샷을 그대로 연다
+    reopened = await make_cache(tmp_path).get(client, "1", "o", "r", SHA_1)
+    assert reopened.read_text("main.py") == "app = 1\n"
+    client.download_tarball.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_next_push_builds_snapshot_from_delta(tmp_path):
+    """fast-forward 푸시는 이전 스냅샷에 변경 파일만 반영해 새 스냅샷을 만든다."""
+    client = make_client(make_tarball({"main.py": b"v1", "old.py": b"old", "keep.py": b"keep"}))
+    cache = make_cache(tmp_path)
+    await cache.get(client, "1", "o", "r", SHA_1)
+
+    client.compare_commits.return_value = {
+        "status": "ahead",
+        "files": [
+            {"filename": "main.py", "status": "modified", "sha": "m" * 40},
+            {"filename": "new.py", "status": "renamed", "previous_filename": "old.py", "sha": "n" * 40},
+        ],
+    }
+    client.get_blob.side_effect = lambda installation_id, owner, repo, sha: {"m" * 40: b"v2", "n" * 40: b"old"}[sha]
+
+    snapshot = await cache.get(client, "1", "o", "r", SHA_2)
+
+    assert {path: snapshot.read_text(path) for path in snapshot.files} == {
+        "keep.py": "keep", "main.py": "v2", "new.py": "old",
+    }
+    client.download_tarball.assert_awaited_once()
+    assert client.compare_commits.await_args.args[3:] == (SHA_1, SHA_2)
+
+
+@pytest.mark.asyncio
+async def test_diverged_push_downloads_full_tarball(tmp_path):
+    """force push 등으로 head가 이전 스냅샷의 후손이 아니면 tarball을 새로 받는다."""
+    client = make_client(make_tarball({"main.py": b"v1"}))
+    cache = make_cache(tmp_path)
+    await cache.get(client, "1", "o", "r", SHA_1)
+    client.compare_commits.return_value = {"status": "diverged", "files": []}
+
+    await cache.get(client, "1", "o", "r", SHA_2)
+
+    assert client.download_tarball.await_count == 2
+    client.get_blob.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_prune_evicts_least_recently_used_snapshot(tmp_path):
+    """디스크 한도를 넘으면 오래 사용하지 않은 스냅샷부터 삭제한다."""
+    client = make_client(make_tarball({"main.py": b"x" * 100}))
+    client.compare_commits.return_value = {"status": "diverged", "files": []}
+    cache = make_cache(tmp_path, max_bytes=300)
+    await cache.get(client, "1", "o", "r", SHA_1)
+    os.utime(tmp_path / "o" / "r" / f"{SHA_1}.json", (0, 0))
+
+    await cache.get(client, "1", "o", "r", SHA_2)
+
+    assert not (tmp_path / "o" / "r" / f"{SHA_1}.pack").exists()
+    assert (tmp_path / "o" / "r" / f"{SHA_2}.pack").exists()
+
+
+@pytest.mark.asyncio
+async def test_context_files_read_from_snapshot(tmp_path):
+    """스냅샷 캐시가 켜져 있으면 컨텍스트 파일을 스냅샷에서 읽는다."""
+    client = make_client(make_tarball({"app.py": b"app = 1\n", "server.py": b"s"}))
+    cache = make_cache(tmp_path)
+    changed = [FileChange(filename="api/users.py", status="modified")]
+
+    with patch("app.reviewer.nodes.file_reviewer.snapshot_cache", cache), \
+            patch("app.reviewer.nodes.file_reviewer.github_client", client):
+        context = await _fetch_context_files(changed, "1", "o", "r", SHA_1)
+
+    assert context == {"app.py": "app = 1\n"}
+    client.get_tree.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_copied_file_keeps_source_path(tmp_path):
+    """copied 파일은 새 경로만 추가하고, renamed와 달리 원본 경로를 지우지 않는다."""
+    client = make_client(make_tarball({"base.py": b"base"}))
+    cache = make_cache(tmp_path)
+    await cache.get(client, "1", "o", "r", SHA_1)
+    client.compare_commits.return_value = {
+        "status": "ahead",
+        "files": [{"filename": "copy.py", "status": "copied", "previous_filename": "base.py", "sha": "c" * 40}],
+    }
+    client.get_blob.return_value = b"base"
+
+    snapshot = await cache.get(client, "1", "o", "r", SHA_2)
+
+    assert {path: snapshot.read_text(path) for path in snapshot.files} == {"base.py": "base", "copy.py": "base"}
+
+
+@pytest.mark.asyncio
+async def test_pruned_snapshot_stays_readable_for_current_reader(tmp_path):
+    """디스크에서 삭제된 스냅샷도 이미 받아 간 쪽은 계속 읽을 수 있다."""
+    client = make_client(make_tarball({"main.py": b"x" * 100}))
+    client.compare_commits.return_value = {"status": "diverged", "files": []}
+    cache = make_cache(tmp_path, max_bytes=300)
+    reader = await cache.get(client, "1", "o", "r", SHA_1)
+    os.utime(tmp_path / "o" / "r" / f"{SHA_1}.json", (0, 0))
+
+    await cache.get(client, "1", "o", "r", SHA_2)
+
+    assert not (tmp_path / "o" / "r" / f"{SHA_1}.pack").exists()
+    assert reader.read_bytes("main.py") == b"x" * 100
+
+
+@pytest.mark.asyncio
+async def test_snapshot_locks_are_released_after_build(tmp_path):
+    """스냅샷을 만든 뒤에는 경로별 잠금을 보관하지 않는다."""
+    client = make_client(make_tarball({"main.py": b"v1"}))
+    cache = make_cache(tmp_path)
+
+    await cache.get(client, "1", "o", "r", SHA_1)
+
+    assert len(cache._locks) == 0
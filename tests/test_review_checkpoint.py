@@ -0,0 +1,136 @@
+"""리뷰 그래프 체크포인트 재개 단위 테스트."""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.models import Author, FileChange, PRData
+from app.reviewer import graph as graph_module
+from app.reviewer.checkpoint import checkpoint_thread_id
+from app.reviewer.nodes.file_reviewer import review_all_files
+
+
+def make_pr_data() -> PRData:
+    return PRData(
+        pr_number=1,
+        title="test",
+        state="open",
+        author=Author(login="test-user", id=1),
+        base_branch="main",
+        head_branch="feature",
+        base_sha="base",
+        head_sha="abc1234",
+        repo_owner="test-user",
+        repo_name="test-repo",
+        files=[FileChange(filename="a.py", status="modified"), FileChange(filename="b.py", status="modified")],
+    )
+
+
+def test_thread_id_is_keyed_by_repo_pr_and_head_sha():
+    """thread ID = 저장소 + PR 번호 + head_sha."""
+    assert checkpoint_thread_id("o", "r", 3, "deadbeef") == "o/r#3@deadbeef"
+
+
+@pytest.fixture
+def stub_nodes():
+    """LLM/DB를 쓰는 노드를 스텁으로 교체하고 그래프 싱글톤을 초기화."""
+    nodes = {
+        "load_repo_skills": AsyncMock(return_value={"repo_skills": [], "repo_system_prompt": None}),
+        "load_previous_review": AsyncMock(return_value={"previous_review": None}),
+        "analyze_pr_intent": AsyncMock(return_value={"pr_intent": {"type": "feature"}}),
+        "classify_risk": AsyncMock(return_value={"risk_assessment": {"level": "LOW"}}),
+        "summarize_review": AsyncMock(return_value={"final_review": "done", "review_decision": "COMMENT"}),
+    }
+    with patch.multiple(graph_module, **nodes), \
+            patch.object(graph_module, "_compiled_graph", None), \
+            patch.object(graph_module, "_compiled_checkpointed_graph", None), \
+            patch.object(graph_module, "_compiled_checkpointer", None):
+        yield nodes
+
+
+@pytest.mark.asyncio
+async def test_run_review_resumes_from_last_completed_node(stub_nodes):
+    """classify_risk에서 중단 → 재실행 시 이전 노드는 건너뛰고 classify_risk부터 재개."""
+    saver = InMemorySaver()
+    stub_nodes["classify_risk"].side_effect = [RuntimeError("worker crashed"), {"risk_assessment": {"level": "LOW"}}]
+
+    with patch.object(graph_module, "get_checkpointer", return_value=saver):
+        with pytest.raises(RuntimeError):
+            await graph_module.run_review(make_pr_data(), "99", "test-user", "test-repo", thread_id="t-1")
+        result = await graph_module.run_review(make_pr_data(), "99", "test-user", "test-repo", thread_id="t-1")
+
+    assert result["final_review"] == "done"
+    assert stub_nodes["analyze_pr_intent"].await_count == 1
+    assert stub_nodes["classify_risk"].await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_review_reuses_completed_checkpoint(stub_nodes):
+    """완료된 체크포인트가 남아 있으면 그래프를 다시 실행하지 않음."""
+    saver = InMemorySaver()
+    with patch.object(graph_module, "get_checkpointer", return_value=saver):
+        await graph_module.run_review(make_pr_data(), "99", "test-user", "test-repo", thread_id="t-2")
+        result = await graph_module.run_review(make_pr_data(), "99", "test-user", "test-repo", thread_id="t-2")
+
+    assert result["final_review"] == "done"
+    assert stub_nodes["summarize_review"].await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_review_hands_over_files_collected_during_early_nodes(stub_nodes):
+    """파일 수집이 끝나기 전에 앞 단계 노드가 실행되고, classify_risk는 채워진 파일 목록을 받는다."""
+    release = asyncio.Event()
+    files = make_pr_data().files
+
+    async def collect() -> list:
+        await release.wait()
+        return files
+
+    async def analyze(state):
+        release.set()
+        return {"pr_intent": {"type": "feature"}}
+
+    stub_nodes["analyze_pr_intent"].side_effect = analyze
+    pr_data = make_pr_data().model_copy(update={"files": []})
+
+    result = await graph_module.run_review(
+        pr_data, "99", "test-user", "test-repo", pending_files=asyncio.create_task(collect())
+    )
+
+    assert [f.filename for f in result["pr_data"].files] == ["a.py", "b.py"]
+    risk_state = stub_nodes["classify_risk"].await_args.args[0]
+    assert len(risk_state["pr_data"].files) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_review_cancels_unused_file_collection(stub_nodes):
+    """완료된 체크포인트를 재사용하면 파일 수집 태스크를 취소한다."""
+    saver = InMemorySaver()
+    with patch.object(graph_module, "get_checkpointer", return_value=saver):
+        await graph_module.run_review(make_pr_data(), "99", "test-user", "test-repo", thread_id="t-4")
+        pending = asyncio.create_task(asyncio.Event().wait())
+        await graph_module.run_review(make_pr_data(), "99", "test-user", "test-repo", thread_id="t-4", pending_files=pending)
+
+    await asyncio.sleep(0)
+    assert pending.cancelled()
+
+
+@pytest.mark.asyncio
+@patch("app.reviewer.nodes.file_reviewer._save_completed_review", new_callable=AsyncMock)
+@patch("app.reviewer.nodes.file_reviewer._fetch_context_files", new_callable=AsyncMock, return_value={})
+@patch("app.reviewer.nodes.file_reviewer.review_single_file", new_callable=AsyncMock)
+@patch("app.reviewer.nodes.file_reviewer._load_completed_reviews", new_callable=AsyncMock)
+async def test_review_all_files_skips_completed_files(mock_load, mock_review, mock_context, mock_save):
+    """이전 실행에서 끝난 파일은 재리뷰하지 않고, 새로 끝난 파일만 저장."""
+    mock_load.return_value = {"a.py": {"review": {"filename": "a.py", "status": "LGTM"}, "message": {}}}
+    mock_review.return_value = {"review": {"filename": "b.py", "status": "LGTM"}, "message": {}, "error": None}
+    state = {"pr_data": make_pr_data(), "installation_id": "99", "repo_owner": "test-user", "repo_name": "test-repo"}
+
+    result = await review_all_files(state, {"configurable": {"thread_id": "t-3"}})
+
+    assert [r["filename"] for r in result["file_reviews"]] == ["a.py", "b.py"]
+    mock_review.assert_awaited_once()
+    mock_save.assert_awaited_once()
+    mock_load.assert_awaited_once_with("t-3", 1)
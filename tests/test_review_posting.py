@@ -0,0 +1,204 @@
+"""리뷰 결과 GitHub 게시(요약 코멘트 수정, 인라인 리뷰 일괄 제출) 단위 테스트."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.github.diff_parser import commentable_lines
+from app.database.models import PullRequest, Repository, Review
+from app.models import FileChange
+from app.services import review_posting
+from app.services.review_posting import (
+    build_inline_comments,
+    post_inline_review,
+    post_summary_comment,
+    publish_review,
+)
+from app.services.review_service import (
+    REVIEW_POST_FAILED,
+    REVIEW_POST_PENDING,
+    REVIEW_POST_POSTED,
+    record_review_post,
+)
+
+PATCH = "@@ -10,3 +10,4 @@ def handler():\n     a = 1\n-    b = 2\n+    b = 3\n+    c = 4\n     return a"
+
+
+def issue(line, severity="high") -> dict:
+    return {"severity": severity, "type": "bug", "message": "문제", "suggestion": "수정", "skill": "sec", "line": line}
+
+
+def test_commentable_lines_cover_added_and_context_lines():
+    """추가/문맥 라인만 변경 후 파일의 라인 번호로 계산한다."""
+    assert commentable_lines(PATCH) == {10, 11, 12, 13}
+    assert commentable_lines(None) == set()
+
+
+def test_build_inline_comments_keeps_only_lines_inside_diff():
+    """diff 밖의 라인이나 라인이 없는 이슈는 인라인 코멘트로 만들지 않는다."""
+    files = [FileChange(filename="app/x.py", status="modified", patch=PATCH)]
+    file_reviews = [
+        {"filename": "app/x.py", "issues": [issue(11), issue("12", "low"), issue(40), issue(None)]},
+        {"filename": "app/missing.py", "issues": [issue(1)]},
+    ]
+
+    comments = build_inline_comments(file_reviews, files)
+
+    assert [(c["path"], c["line"], c["side"]) for c in comments] == [("app/x.py", 11, "RIGHT"), ("app/x.py", 12, "RIGHT")]
+    assert comments[0]["body"].startswith("🔴 **[HIGH] bug** · sec")
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.github_client")
+async def test_inline_comments_are_submitted_in_one_review(mock_client):
+    """인라인 코멘트는 개수와 관계없이 리뷰 하나로 제출한다."""
+    mock_client.create_review = AsyncMock(return_value={"id": 1})
+    comments = [{"path": "a.py", "line": n, "side": "RIGHT", "body": "x"} for n in range(30)]
+
+    posted = await post_inline_review("1", "o", "r", 7, "h" * 40, comments)
+
+    assert posted == 30
+    mock_client.create_review.assert_awaited_once()
+    assert mock_client.create_review.await_args.args[6] == comments
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.github_client")
+async def test_inline_comments_split_when_over_limit(mock_client):
+    """리뷰 하나의 코멘트 수 한도를 넘을 때만 나눠 제출한다."""
+    mock_client.create_review = AsyncMock(return_value={"id": 1})
+    comments = [{"path": "a.py", "line": n, "side": "RIGHT", "body": "x"} for n in range(5)]
+
+    with patch.object(review_posting.settings, "github_review_max_comments", 2):
+        posted = await post_inline_review("1", "o", "r", 7, "h" * 40, comments)
+
+    assert posted == 5
+    assert [len(call.args[6]) for call in mock_client.create_review.await_args_list] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.github_client")
+async def test_summary_comment_is_edited_in_place(mock_client):
+    """이전 요약 코멘트가 있으면 새 코멘트를 달지 않고 수정한다."""
+    mock_client.update_issue_comment = AsyncMock(return_value={"id": 55})
+    mock_client.create_pr_comment = AsyncMock()
+
+    comment_id = await post_summary_comment("1", "o", "r", 7, "요약", summary_comment_id=55)
+
+    assert comment_id == 55
+    mock_client.create_pr_comment.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.github_client")
+async def test_summary_comment_recreated_when_previous_deleted(mock_client):
+    """이전 요약 코멘트가 삭제되었으면(404) 새로 작성한다."""
+    request = httpx.Request("PATCH", "https://api.test")
+    mock_client.update_issue_comment = AsyncMock(side_effect=httpx.HTTPStatusError(
+        "404", request=request, response=httpx.Response(404, request=request),
+    ))
+    mock_client.create_pr_comment = AsyncMock(return_value={"id": 77})
+
+    assert await post_summary_comment("1", "o", "r", 7, "요약", summary_comment_id=55) == 77
+
+
+def pending_review_post() -> tuple[Review, PullRequest, Repository]:
+    review = Review(
+        id=3, pull_request_id=2, head_sha="h" * 40, final_review="요약", post_status=REVIEW_POST_PENDING,
+        inline_comments=[{"path": "a.py", "line": 1, "side": "RIGHT", "body": "x"}],
+    )
+    pr = PullRequest(id=2, repository_id=1, pr_number=7, github_pr_id=70, head_sha="h" * 40, summary_comment_id=55)
+    repo = Repository(id=1, github_repo_id=111, owner="o", name="r", installation_id="99")
+    return review, pr, repo
+
+
+@pytest.fixture
+def mock_sessions():
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    with patch("app.services.review_posting.async_session_factory", factory), \
+            patch("app.services.review_posting.session_scope", factory):
+        yield session
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.record_review_post", new_callable=AsyncMock, return_value=REVIEW_POST_POSTED)
+@patch("app.services.review_posting.get_review_post", new_callable=AsyncMock)
+@patch("app.services.review_posting.github_client")
+async def test_publish_review_posts_stored_result(mock_client, mock_get, mock_record, mock_sessions):
+    """저장된 리뷰로 요약 코멘트를 수정하고 인라인 리뷰를 제출한 뒤 결과를 기록한다."""
+    mock_get.return_value = pending_review_post()
+    mock_client.update_issue_comment = AsyncMock(return_value={"id": 55})
+    mock_client.create_review = AsyncMock(return_value={"id": 1})
+
+    assert await publish_review(3) == REVIEW_POST_POSTED
+
+    mock_client.update_issue_comment.assert_awaited_once_with("99", "o", "r", 55, "요약")
+    mock_client.create_review.assert_awaited_once()
+    assert mock_record.await_args.args[1:4] == (3, 55, None)
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.record_review_post", new_callable=AsyncMock, return_value=REVIEW_POST_PENDING)
+@patch("app.services.review_posting.get_review_post", new_callable=AsyncMock)
+@patch("app.services.review_posting.github_client")
+async def test_publish_review_records_failure_without_raising(mock_client, mock_get, mock_record, mock_sessions):
+    """GitHub 장애로 게시가 실패해도 예외를 던지지 않고 실패 사유를 기록한다."""
+    mock_get.return_value = pending_review_post()
+    mock_client.update_issue_comment = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+    assert await publish_review(3) == REVIEW_POST_PENDING
+
+    review_id, summary_comment_id, error = mock_record.await_args.args[1:4]
+    assert (review_id, summary_comment_id) == (3, None)
+    assert error.startswith("ConnectError")
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.record_review_post", new_callable=AsyncMock, return_value=REVIEW_POST_POSTED)
+@patch("app.services.review_posting.get_review_post", new_callable=AsyncMock)
+@patch("app.services.review_posting.github_client")
+async def test_inline_batch_transport_error_does_not_leave_review_pending(mock_client, mock_get, mock_record, mock_sessions):
+    """두 번째 인라인 배치가 연결 오류로 실패해도 게시 완료로 기록해, 재시도가 첫 배치를 다시 올리지 않는다."""
+    review, pr, repo = pending_review_post()
+    review.inline_comments = [{"path": "a.py", "line": n, "side": "RIGHT", "body": "x"} for n in range(4)]
+    mock_get.return_value = (review, pr, repo)
+    mock_client.update_issue_comment = AsyncMock(return_value={"id": 55})
+    mock_client.create_review = AsyncMock(side_effect=[{"id": 1}, httpx.ConnectError("refused")])
+
+    with patch.object(review_posting.settings, "github_review_max_comments", 2):
+        assert await publish_review(3) == REVIEW_POST_POSTED
+
+    assert mock_client.create_review.await_count == 2
+    assert mock_record.await_args.args[1:4] == (3, 55, None)
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_posting.get_review_post", new_callable=AsyncMock)
+@patch("app.services.review_posting.github_client")
+async def test_publish_review_skips_already_posted(mock_client, mock_get, mock_sessions):
+    """이미 게시가 끝난 리뷰는 다시 게시하지 않는다."""
+    review, pr, repo = pending_review_post()
+    review.post_status = REVIEW_POST_POSTED
+    mock_get.return_value = (review, pr, repo)
+    mock_client.update_issue_comment = AsyncMock()
+
+    assert await publish_review(3) is None
+    mock_client.update_issue_comment.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_record_review_post_gives_up_after_max_attempts():
+    """실패가 최대 시도 횟수에 닿으면 failed로 포기하고, 게시한 요약 코멘트 ID는 남긴다."""
+    review, _, _ = pending_review_post()
+    review.post_attempts = 2
+    session = AsyncMock()
+    session.get.return_value = review
+
+    status = await record_review_post(session, 3, 88, "ConnectError: refused", max_attempts=3)
+
+    assert status == REVIEW_POST_FAILED
+    assert review.post_attempts == 3
+    assert review.post_error == "ConnectError: refused"
+    session.execute.assert_awaited_once()
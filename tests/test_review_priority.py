@@ -0,0 +1,52 @@
+"""리뷰 작업 우선순위 단위 테스트."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.review_queue import job_priority
+from app.worker.pipeline import boost_high_risk_priority
+
+
+def test_trigger_priority_order():
+    """re_review_command > ready_for_review > push > label_removed."""
+    priorities = [
+        job_priority(source)
+        for source in ("re_review_command", "ready_for_review", "push", "label_removed")
+    ]
+    assert priorities == sorted(priorities, reverse=True)
+    assert len(set(priorities)) == 4
+
+
+def test_triage_priority_is_added():
+    """PR triage_priority가 있으면 트리거 기본값에 더함."""
+    assert job_priority("push", 2) == job_priority("push") + 2
+    assert job_priority("push", None) == job_priority("push")
+
+
+@pytest.fixture
+def mock_session_factory():
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    with patch("app.worker.pipeline.async_session_factory", factory):
+        yield session
+
+
+@pytest.mark.asyncio
+@patch("app.worker.pipeline.bump_review_job_priority", new_callable=AsyncMock, return_value=1)
+@patch("app.worker.pipeline.raise_pr_triage_priority", new_callable=AsyncMock)
+async def test_high_risk_boosts_priority(mock_raise, mock_bump, mock_session_factory):
+    """classify_risk 결과 HIGH → PR 트리아지 및 대기 작업 우선순위 상향."""
+    await boost_high_risk_priority(111, 1, {"level": "HIGH"})
+    mock_raise.assert_awaited_once()
+    mock_bump.assert_awaited_once()
+    mock_session_factory.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.worker.pipeline.bump_review_job_priority", new_callable=AsyncMock)
+@patch("app.worker.pipeline.raise_pr_triage_priority", new_callable=AsyncMock)
+async def test_non_high_risk_keeps_priority(mock_raise, mock_bump, mock_session_factory):
+    """HIGH가 아니면 우선순위 변경 없음."""
+    await boost_high_risk_priority(111, 1, {"level": "MEDIUM"})
+    mock_raise.assert_not_awaited()
+    mock_bump.assert_not_awaited()
@@ -0,0 +1,73 @@
+"""리뷰 작업 큐 서비스 단위 테스트."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.database.models import ReviewJob
+from app.services.fair_share import InstallationLimits
+from app.services.review_queue import CLAIM_CANDIDATE_LIMIT, claim_next_review_job
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_queue.count_running_jobs_by_installation", new_callable=AsyncMock, return_value={"a": 2, "b": 1})
+async def test_claim_respects_global_running_cap(mock_running):
+    """전체 실행 중 작업 수가 한도에 도달 → 작업을 가져가지 않음."""
+    session = AsyncMock()
+    job = await claim_next_review_job(session, "worker-1", aging_seconds=120, max_running=3)
+    assert job is None
+    # advisory lock 1회만 실행, 후보 조회 없음
+    assert session.execute.await_count == 1
+
+
+class FakeQueueSession:
+    """installation별 1순위 후보 조회와 잠금 조회만 흉내 내는 세션 (작업 목록은 우선순위 순).
+
+    1순위 후보 조회 없이 바로 잠금 조회를 하면 우선순위 상위 ``CLAIM_CANDIDATE_LIMIT``개만 돌려준다.
+    """
+
+    def __init__(self, jobs: list[ReviewJob]):
+        self.jobs = jobs
+        self.head_ids: list[int] | None = None
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        sql = str(statement)
+        result = MagicMock()
+        if "row_number() OVER (PARTITION BY review_jobs.installation_id" in sql:
+            heads: dict[str, int] = {}
+            for job in self.jobs:
+                heads.setdefault(job.installation_id, job.id)
+            self.head_ids = list(heads.values())[:CLAIM_CANDIDATE_LIMIT]
+            result.scalars.return_value.all.return_value = self.head_ids
+        elif "FOR UPDATE SKIP LOCKED" in str(statement.compile(dialect=postgresql.dialect())):
+            if self.head_ids is None:
+                locked = self.jobs[:CLAIM_CANDIDATE_LIMIT]
+            else:
+                locked = [job for job in self.jobs if job.id in self.head_ids]
+            result.scalars.return_value.all.return_value = locked
+        return result
+
+    async def flush(self):
+        pass
+
+
+@pytest.mark.asyncio
+@patch("app.services.review_queue.tokens_used_today_by_installation", new_callable=AsyncMock, return_value={})
+@patch("app.services.review_queue.count_running_jobs_by_installation", new_callable=AsyncMock, return_value={"big": 1})
+async def test_fair_share_sees_installation_behind_large_backlog(mock_running, mock_tokens):
+    """한 installation의 대기 작업이 후보 한도보다 많아도 다른 installation의 작업이 후보에 오른다."""
+    jobs = [
+        ReviewJob(id=n, installation_id="big", status="pending", attempts=0)
+        for n in range(1, CLAIM_CANDIDATE_LIMIT + 11)
+    ]
+    jobs.append(ReviewJob(id=999, installation_id="small", status="pending", attempts=0))
+    session = FakeQueueSession(jobs)
+
+    job = await claim_next_review_job(
+        session, "worker-1", aging_seconds=120, limits_for=lambda _: InstallationLimits(1.0, 0, 0)
+    )
+
+    assert job.id == 999
+    assert job.status == "running"
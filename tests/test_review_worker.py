@@ -0,0 +1,84 @@
+"""리뷰 작업 워커 단위 테스트."""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.database.models import ReviewJob
+from app.worker.runner import ReviewWorker
+
+
+def make_job() -> ReviewJob:
+    return ReviewJob(
+        id=1,
+        installation_id="99",
+        github_repo_id=111,
+        github_pr_id=999,
+        repo_owner="test-user",
+        repo_name="test-repo",
+        pr_number=1,
+        head_sha="abc1234",
+        trigger_source="push",
+        attempts=1,
+    )
+
+
+@pytest.fixture
+def mock_session_factory():
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    with patch("app.worker.runner.async_session_factory", factory):
+        yield session
+
+
+@pytest.mark.asyncio
+@patch("app.worker.runner.fail_review_job", new_callable=AsyncMock)
+@patch("app.worker.runner.run_full_review_pipeline", new_callable=AsyncMock)
+async def test_execute_success_marks_job_complete(mock_pipeline, mock_fail, mock_session_factory):
+    """파이프라인 성공 → 결과 저장과 함께 작업 완료 처리 (job_id 전달), 실패 기록 없음."""
+    await ReviewWorker(concurrency=1)._execute(make_job(), slot=0)
+
+    _, kwargs = mock_pipeline.call_args
+    assert kwargs["pr_number"] == 1
+    assert kwargs["trigger_source"] == "push"
+    assert kwargs["job_id"] == 1
+    mock_fail.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("app.worker.runner.fail_review_job", new_callable=AsyncMock, return_value="pending")
+@patch("app.worker.runner.run_full_review_pipeline", new_callable=AsyncMock, side_effect=RuntimeError("boom"))
+async def test_execute_failure_records_error(mock_pipeline, mock_fail, mock_session_factory):
+    """파이프라인 예외 → 실패 기록 (재시도 판단은 fail_review_job에 위임)."""
+    await ReviewWorker(concurrency=1)._execute(make_job(), slot=0)
+
+    mock_fail.assert_awaited_once()
+    assert mock_fail.call_args.kwargs["error"] == "boom"
+
+
+@pytest.mark.asyncio
+@patch("app.worker.runner.discard_review_progress", new_callable=AsyncMock)
+@patch("app.worker.runner.settings.review_supersede_check_interval", 0)
+@patch("app.worker.runner.heartbeat_review_job", new_callable=AsyncMock, return_value="superseded")
+@patch("app.worker.runner.fail_review_job", new_callable=AsyncMock)
+@patch("app.worker.runner.run_full_review_pipeline")
+async def test_execute_superseded_job_is_cancelled(
+    mock_pipeline, mock_fail, mock_status, mock_discard, mock_session_factory
+):
+    """실행 중 superseded 전환 → 파이프라인 취소, 실패 기록 없음, 체크포인트 삭제."""
+    cancelled = asyncio.Event()
+
+    async def slow_pipeline(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_pipeline.side_effect = slow_pipeline
+    await ReviewWorker(concurrency=1)._execute(make_job(), slot=0)
+
+    assert cancelled.is_set()
+    mock_fail.assert_not_awaited()
+    mock_discard.assert_awaited_once_with("test-user/test-repo#1@abc1234")
@@ -0,0 +1,34 @@
+"""웹훅 delivery LRU 캐시 단위 테스트."""
+from unittest.mock import patch
+
+from app.webhook.deliveries import RecentDeliveryCache
+
+
+def test_added_delivery_is_seen():
+    """기록한 delivery → contains True, 처음 보는 delivery → False."""
+    cache = RecentDeliveryCache(maxsize=10, ttl_seconds=60)
+    cache.add("a")
+    assert cache.contains("a")
+    assert not cache.contains("b")
+
+
+def test_evicts_least_recently_used():
+    """크기 초과 → 가장 오래 사용되지 않은 항목부터 제거."""
+    cache = RecentDeliveryCache(maxsize=2, ttl_seconds=60)
+    cache.add("a")
+    cache.add("b")
+    assert cache.contains("a")  # a를 최근 사용으로 갱신
+    cache.add("c")
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert len(cache) == 2
+
+
+def test_expired_delivery_is_forgotten():
+    """TTL 경과 → 캐시에서 제거."""
+    cache = RecentDeliveryCache(maxsize=10, ttl_seconds=60)
+    with patch("app.webhook.deliveries.time.monotonic", return_value=1000.0):
+        cache.add("a")
+    with patch("app.webhook.deliveries.time.monotonic", return_value=1061.0):
+        assert not cache.contains("a")
+    assert len(cache) == 0
@@ -52,7 +52,7 @@ async def test_webhook_with_valid_signature():
             print(f"Status Code: {response.status_code}")
             print(f"Response: {response.json()}")
 
-            if response.status_code == 200:
+            if response.status_code == 202:
                 print("✅ 유효한 서명 테스트 통과!")
             else:
                 print(f"❌ 예상치 못한 응답: {response.status_code}")
@@ -0,0 +1,144 @@
+"""웹훅 헤더 기반 사전 필터 단위 테스트."""
+import json
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import metrics
+from app.config import settings
+from app.webhook.dispatcher import is_handled_action, is_handled_event, may_enqueue_review, peek_action
+from app.webhook.validator import calculate_signature
+from main import app
+
+
+def test_peek_action_reads_leading_action():
+    """본문 앞부분의 action 값을 파싱 없이 추출."""
+    assert peek_action(b'{"action":"opened","number":1}') == "opened"
+    assert peek_action(b'  {\n  "action": "synchronize",\n') == "synchronize"
+
+
+def test_peek_action_unknown_layout_returns_none():
+    """action이 첫 키가 아니면 None (전체 파싱으로 대체)."""
+    assert peek_action(b'{"ref":"refs/heads/main","action":"x"}') is None
+    assert peek_action(b"not json") is None
+
+
+def test_handled_event_and_action():
+    """핸들러가 있는 이벤트/액션만 처리 대상."""
+    assert is_handled_event("pull_request")
+    assert not is_handled_event("push")
+    assert is_handled_action("pull_request", "synchronize")
+    assert not is_handled_action("pull_request", "edited")
+    assert not is_handled_action("issue_comment", "deleted")
+
+
+def test_may_enqueue_review_only_for_review_triggers():
+    """리뷰를 등록할 수 있는 delivery만 큐 포화 시 거절 대상."""
+    assert may_enqueue_review("pull_request", "synchronize", {})
+    assert may_enqueue_review("pull_request", "unlabeled", {"label": {"name": "WIP"}})
+    assert not may_enqueue_review("pull_request", "unlabeled", {"label": {"name": "bug"}})
+    assert not may_enqueue_review("pull_request", "closed", {})
+    assert may_enqueue_review("issue_comment", "created", {"comment": {"body": "/re-review 부탁"}})
+    assert not may_enqueue_review("issue_comment", "created", {"comment": {"body": "LGTM"}})
+
+
+@pytest.fixture
+def client():
+    metrics.reset()
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_session_scope():
+    scope = MagicMock()
+
+    @asynccontextmanager
+    async def fake_scope():
+        scope()
+        yield AsyncMock()
+
+    with patch("main.session_scope", fake_scope):
+        yield scope
+
+
+def post_webhook(client: TestClient, event: str, payload: dict, delivery_id: str | None = None):
+    body = json.dumps(payload).encode()
+    return client.post(
+        "/webhook",
+        content=body,
+        headers={
+            "X-GitHub-Event": event,
+            "X-GitHub-Delivery": delivery_id or f"delivery-{uuid.uuid4()}",
+            "X-Hub-Signature-256": calculate_signature(settings.github_webhook_secret, body),
+        },
+    )
+
+
+def test_ignored_event_skips_db(client, mock_session_scope):
+    """처리하지 않는 이벤트(push) → DB 세션 없이 무시하고 카운터 증가."""
+    response = post_webhook(client, "push", {"ref": "refs/heads/main"})
+    assert response.json() == {"status": "ignored"}
+    mock_session_scope.assert_not_called()
+    assert metrics.get_value("webhook_events_dropped_total", event="push", reason="event") == 1
+
+
+def test_ignored_action_skips_db(client, mock_session_scope):
+    """처리하지 않는 액션(pull_request.edited) → DB 세션 없이 무시."""
+    response = post_webhook(client, "pull_request", {"action": "edited", "number": 1})
+    assert response.json() == {"status": "ignored"}
+    mock_session_scope.assert_not_called()
+
+
+@patch("main.dispatch_event", new_callable=AsyncMock)
+@patch("main.record_delivery", new_callable=AsyncMock, return_value=True)
+def test_handled_action_dispatches(mock_record, mock_dispatch, client, mock_session_scope):
+    """처리 대상 액션 → 세션 획득 후 디스패치, 202."""
+    response = post_webhook(client, "pull_request", {"action": "opened", "number": 1})
+    assert response.status_code == 202
+    mock_session_scope.assert_called_once()
+    mock_dispatch.assert_awaited_once()
+
+
+@patch("main.settings.review_queue_max_depth", 5)
+@patch("main.count_pending_review_jobs", new_callable=AsyncMock, return_value=5)
+@patch("main.record_delivery", new_callable=AsyncMock, return_value=True)
+def test_saturated_queue_returns_503(mock_record, mock_pending, client, mock_session_scope):
+    """큐 깊이 한도 도달 → delivery 기록 없이 503 saturated."""
+    response = post_webhook(client, "pull_request", {"action": "synchronize", "number": 1})
+    assert response.status_code == 503
+    assert response.json()["status"] == "saturated"
+    assert "Retry-After" in response.headers
+    mock_record.assert_not_awaited()
+
+
+
+@patch("main.settings.review_queue_max_depth", 5)
+@patch("main.count_pending_review_jobs", new_callable=AsyncMock, return_value=5)
+@patch("main.dispatch_event", new_callable=AsyncMock)
+@patch("main.record_delivery", new_callable=AsyncMock, return_value=True)
+def test_saturated_queue_still_processes_closed(mock_record, mock_dispatch, mock_pending, client, mock_session_scope):
+    """큐가 포화돼도 리뷰를 등록하지 않는 closed 이벤트는 처리한다."""
+    response = post_webhook(client, "pull_request", {"action": "closed", "number": 1})
+    assert response.status_code == 202
+    mock_pending.assert_not_awaited()
+    mock_record.assert_awaited_once()
+    mock_dispatch.assert_awaited_once()
+
+
+@patch("main.settings.review_queue_max_depth", 5)
+@patch("main.count_pending_review_jobs", new_callable=AsyncMock, return_value=5)
+@patch("main.dispatch_event", new_callable=AsyncMock)
+@patch("main.record_delivery", new_callable=AsyncMock, return_value=True)
+def test_recent_duplicate_is_dropped_before_saturation_check(mock_record, mock_dispatch, mock_pending, client, mock_session_scope):
+    """최근 처리한 delivery의 재전송은 큐 포화 여부와 관계없이 중복으로 무시한다."""
+    with patch("main.settings.review_queue_max_depth", 0):
+        post_webhook(client, "pull_request", {"action": "synchronize", "number": 1}, delivery_id="delivery-dup")
+
+    response = post_webhook(client, "pull_request", {"action": "synchronize", "number": 1}, delivery_id="delivery-dup")
+
+    assert response.json() == {"status": "duplicate"}
+    mock_pending.assert_not_awaited()
+    mock_dispatch.assert_awaited_once()
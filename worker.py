@@ -0,0 +1,22 @@
+"""리뷰 작업 큐 워커 엔트리포인트.
+
+API 서버(main.py)와 별도 프로세스로 실행한다::
+
+    python worker.py
+"""
+import asyncio
+import signal
+
+from app.worker import ReviewWorker
+
+
+async def main() -> None:
+    worker = ReviewWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())